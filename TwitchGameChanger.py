@@ -1,18 +1,47 @@
+import time
+PROCESS_STARTED = time.perf_counter()  # reference point for the startup timings
+
 import os
+import re
 import json
-import winreg
 import subprocess
 from pathlib import Path
-from typing import List, Set
-import tkinter as tk
-from tkinter import ttk, messagebox
+from typing import List, Optional, Set
 import threading
-import socket
-import time
+import queue
 import sys
 import gc
 import base64
 import hashlib
+import struct
+
+
+class _LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name: str):
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+
+    def _load(self):
+        module = self.__dict__['_module']
+        if module is None:
+            import importlib
+            module = self.__dict__['_module'] = importlib.import_module(self._name)
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+
+# Heavy / platform modules load when first used: the --daemon service never touches Tk,
+# and the GUI only needs winreg once a scan runs. PyInstaller can't see these imports:
+# they are listed as hidden imports in TwitchGameChanger.spec and the release workflow.
+tk = _LazyModule('tkinter')
+ttk = _LazyModule('tkinter.ttk')
+messagebox = _LazyModule('tkinter.messagebox')
+winreg = _LazyModule('winreg')
+socket = _LazyModule('socket')
 
 # App version and update settings
 APP_VERSION = "2.0.0"  # Update this when releasing new versions
@@ -20,26 +49,54 @@ GITHUB_REPO = "abdullah-alk/Twitch-Game-Changer"  # Change to your actual GitHub
 GITHUB_API_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 UPDATE_CHECK_FILE = None  # Will be set after APP_DATA_DIR is created
 
-# Optional modules (lazy/light usage)
+# Optional modules (lazy/light usage): only look pystray up here, import it when the tray is
+# first used (load_pystray); a pystray that is installed but fails to load means no tray
 try:
-    import pystray
-    from pystray import MenuItem as item
-    TRAY_AVAILABLE = True
+    import importlib.util
+    TRAY_AVAILABLE = importlib.util.find_spec('pystray') is not None
 except Exception:
-    pystray = None
-    item = None
     TRAY_AVAILABLE = False
+_pystray = None
+
+
+def load_pystray():
+    """The pystray module, imported on first use; None if it can't be loaded"""
+    global _pystray, TRAY_AVAILABLE
+    if _pystray is None and TRAY_AVAILABLE:
+        try:
+            import pystray
+            _pystray = pystray
+        except Exception as e:
+            print(f"Tray icon unavailable: {e}")
+            TRAY_AVAILABLE = False
+    return _pystray
 
 # Detect startup mode
 STARTUP_MODE = "--startup" in sys.argv
+# Headless background service (no Tk): monitor + Twitch client, GUI attaches over IPC
+DAEMON_MODE = "--daemon" in sys.argv
+# Print startup timings (time-to-first-paint, time-to-monitoring) and exit
+STARTUP_BENCHMARK = "--startup-benchmark" in sys.argv
 
 # App directories & files
 APP_DATA_DIR = Path(os.getenv('APPDATA', os.path.expanduser('~'))) / "TwitchGameChanger"
 APP_DATA_DIR.mkdir(exist_ok=True)
 TWITCH_CONFIG_FILE = APP_DATA_DIR / 'twitch_config.json'
 EXCLUDED_GAMES_FILE = APP_DATA_DIR / 'excluded_games.json'
+SCAN_SETTINGS_FILE = APP_DATA_DIR / 'scan_settings.json'
 GAMES_CACHE_FILE = APP_DATA_DIR / 'games_cache.json'
 UPDATE_CHECK_FILE = APP_DATA_DIR / 'last_update_check.json'
+LOCATION_INDEX_FILE = APP_DATA_DIR / 'location_index.json'
+IMAGE_CACHE_DIR = APP_DATA_DIR / 'image_cache'
+IMAGE_URL_CACHE_FILE = APP_DATA_DIR / 'image_urls.json'
+CATEGORY_CACHE_FILE = APP_DATA_DIR / 'category_cache.json'
+EXE_MAP_FILE = APP_DATA_DIR / 'exe_map.json'
+STEAM_MANIFEST_CACHE_FILE = APP_DATA_DIR / 'steam_manifests.json'
+# One structured log per process: RotatingFileHandler can't share a file between the GUI and the service
+METRICS_LOG_FILE = APP_DATA_DIR / 'metrics.jsonl'
+DAEMON_METRICS_LOG_FILE = APP_DATA_DIR / 'metrics-daemon.jsonl'
+DAEMON_INFO_FILE = APP_DATA_DIR / 'daemon.json'
+GUI_MONITOR_FILE = APP_DATA_DIR / 'gui_monitor.json'  # PID of a GUI running its own monitor
 
 # Token Encryption
 class TokenEncryption:
@@ -88,6 +145,204 @@ class TokenEncryption:
                 # Backward compatibility - return plaintext if decryption fails
                 return data
 
+# ---------- Metrics ----------
+class Metrics:
+    """
+    In-process counters, gauges and timings for the monitor and Twitch pipeline.
+
+    Notable events are also appended as JSON lines to METRICS_LOG_FILE, or
+    DAEMON_METRICS_LOG_FILE in the background service (rotated at LOG_MAX_BYTES,
+    LOG_BACKUPS files kept). snapshot() feeds the diagnostics panel.
+    """
+    LOG_MAX_BYTES = 1024 * 1024
+    LOG_BACKUPS = 3
+
+    def __init__(self, log_file: Path = DAEMON_METRICS_LOG_FILE if DAEMON_MODE else METRICS_LOG_FILE):
+        self.log_file = log_file
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.counters = {}
+        self.gauges = {}
+        self.timings = {}  # name -> {'count', 'total', 'max', 'last'} in seconds
+        self.recent = []  # last few logged events, newest last
+        self._logger = None
+
+    def incr(self, name: str, amount: int = 1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def gauge(self, name: str, value):
+        with self.lock:
+            self.gauges[name] = value
+
+    def observe(self, name: str, seconds: float):
+        with self.lock:
+            t = self.timings.get(name)
+            if t is None:
+                t = self.timings[name] = {'count': 0, 'total': 0.0, 'max': 0.0, 'last': 0.0}
+            t['count'] += 1
+            t['total'] += seconds
+            t['max'] = max(t['max'], seconds)
+            t['last'] = seconds
+
+    def timer(self, name: str):
+        """with METRICS.timer("x"): ... records the block's duration"""
+        metrics = self
+
+        class _Timer:
+            def __enter__(self):
+                self.start = time.perf_counter()
+                return self
+
+            def __exit__(self, *exc):
+                self.elapsed = time.perf_counter() - self.start
+                metrics.observe(name, self.elapsed)
+                return False
+
+        return _Timer()
+
+    def event(self, kind: str, **fields):
+        """Write one structured record to the JSON-lines log"""
+        record = {'ts': round(time.time(), 3), 'event': kind}
+        record.update(fields)
+        with self.lock:
+            self.recent.append(record)
+            del self.recent[:-20]
+        try:
+            self._get_logger().info(json.dumps(record, default=str))
+        except Exception:
+            pass
+
+    def _get_logger(self):
+        if self._logger is None:
+            import logging
+            from logging.handlers import RotatingFileHandler
+            logger = logging.getLogger('TwitchGameChanger.metrics')
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = RotatingFileHandler(self.log_file, maxBytes=self.LOG_MAX_BYTES,
+                                          backupCount=self.LOG_BACKUPS, encoding='utf-8')
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {
+                'uptime': time.time() - self.started,
+                'threads': threading.active_count(),
+                'counters': dict(self.counters),
+                'gauges': dict(self.gauges),
+                'timings': {name: dict(t, avg=t['total'] / t['count']) for name, t in self.timings.items()},
+                'recent': list(self.recent),
+            }
+
+
+METRICS = Metrics()
+
+
+# ---------- HTTP ----------
+class HttpClient:
+    """
+    One requests.Session shared by every network call.
+
+    Keeps per-host keep-alive pools (so a category change reuses a warm TLS
+    connection to api.twitch.tv), retries idempotent requests with backoff and
+    applies a default timeout. requests is only imported on first use.
+    """
+    POOL_CONNECTIONS = 10  # hosts kept pooled (Twitch API/ID, Steam, RAWG, CDNs, GitHub)
+    POOL_MAXSIZE = 8  # connections per host; image workers download in parallel
+    DEFAULT_TIMEOUT = 10
+    RETRIES = 2
+    BACKOFF_FACTOR = 0.5  # 0.5s, 1s between attempts
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_METHODS = frozenset({'GET', 'HEAD', 'PATCH'})  # POSTs (token exchange) are never replayed
+
+    def __init__(self):
+        self._session = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+        return self._session
+
+    def _build_session(self):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        retry_args = dict(total=self.RETRIES, backoff_factor=self.BACKOFF_FACTOR,
+                          status_forcelist=self.RETRY_STATUSES, raise_on_status=False)
+        try:
+            retry = Retry(allowed_methods=self.RETRY_METHODS, **retry_args)
+        except TypeError:
+            # urllib3 < 1.26
+            retry = Retry(method_whitelist=self.RETRY_METHODS, **retry_args) # type: ignore
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS,
+                              pool_maxsize=self.POOL_MAXSIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def request(self, method: str, url: str, timeout=None, **kwargs):
+        METRICS.incr('http.requests')
+        try:
+            response = self.session.request(method, url, timeout=timeout or self.DEFAULT_TIMEOUT, **kwargs)
+        except Exception as e:
+            METRICS.incr('http.errors')
+            METRICS.event('http_error', method=method, host=url.split('/')[2] if '//' in url else url,
+                          error=type(e).__name__)
+            raise
+        if response.status_code >= 400:
+            METRICS.incr('http.errors')
+            METRICS.incr(f'http.status_{response.status_code}')
+        return response
+
+    @property
+    def connection_error(self):
+        """The exception raised when a host can't be reached (requests.ConnectionError)"""
+        import requests
+        return requests.ConnectionError
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def patch(self, url: str, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def prewarm(self, url: str):
+        """Open a pooled connection to url's host ahead of time (errors ignored)"""
+        try:
+            self.session.head(url, timeout=5)
+        except Exception:
+            pass
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_http_client = None
+
+
+def get_http() -> HttpClient:
+    """The process-wide HttpClient"""
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClient()
+    return _http_client
+
+
 # ---------- Auto Updater ----------
 class AutoUpdater:
     """Handles automatic updates from GitHub releases"""
@@ -140,8 +395,7 @@ class AutoUpdater:
         Returns: dict with 'available', 'version', 'download_url', 'release_notes'
         """
         try:
-            import requests
-            response = requests.get(self.api_url, timeout=10)
+            response = get_http().get(self.api_url, timeout=10)
             
             if response.status_code != 200:
                 return {'available': False, 'error': 'Failed to check for updates'}
@@ -193,13 +447,11 @@ class AutoUpdater:
         Returns: True if successful, False otherwise
         """
         try:
-            import requests
-            
             if callback:
                 callback("Downloading installer...")
             
             # Download the installer
-            response = requests.get(download_url, stream=True, timeout=60)
+            response = get_http().get(download_url, stream=True, timeout=60)
             
             if response.status_code != 200:
                 if callback:
@@ -251,12 +503,10 @@ class AutoUpdater:
         Returns: Path to downloaded installer or None
         """
         try:
-            import requests
-            
             if callback:
                 callback("Downloading installer...")
             
-            response = requests.get(download_url, stream=True, timeout=60)
+            response = get_http().get(download_url, stream=True, timeout=60)
             
             if response.status_code != 200:
                 return None # type: ignore
@@ -283,20 +533,86 @@ class AutoUpdater:
         except Exception:
             return None # type: ignore
 
+def load_cached_games() -> List['Game']:
+    """Games saved by the last scan (GAMES_CACHE_FILE), or [] if there is no usable cache"""
+    try:
+        if GAMES_CACHE_FILE.exists():
+            with open(GAMES_CACHE_FILE, 'r') as f:
+                data = json.load(f)
+                # --- 'icon' field removed from cache loading ---
+                return [Game(g['name'], g['path'], g['platform'], g.get('exe_path', ''), g.get('exe_paths'))
+                        for g in data]
+    except Exception:
+        pass
+    return []
+
 # Data Models
 class Game:
-    def __init__(self, name: str, path: str, platform: str, exe_path: str = ""):
+    def __init__(self, name: str, path: str, platform: str, exe_path: str = "",
+                 exe_paths: Optional[List[str]] = None):
         self.name = name
         self.path = path
         self.platform = platform
         self.exe_path = exe_path if exe_path else path
+        # Every executable the launcher's own metadata lists for the game (exe_path among them)
+        self.exe_paths = list(exe_paths or [])
 
 # Twitch Integration
+class CategoryCache:
+    """Persistent game name -> Twitch category ID map, so a launch needs no search call"""
+    TTL = 30 * 24 * 3600  # seconds; category IDs almost never change
+
+    def __init__(self, cache_file: Path = CATEGORY_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = {}  # lower-case search name -> {'id': str, 'name': str, 'time': float}
+        self.lock = threading.Lock()
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+        except Exception:
+            self.entries = {}
+
+    def get(self, name: str) -> Optional[str]:
+        with self.lock:
+            entry = self.entries.get(name.strip().lower())
+            if entry and time.time() - entry.get('time', 0) < self.TTL:
+                return entry['id']
+        return None
+
+    def put(self, name: str, category_id: str, category_name: str = "", save: bool = True):
+        """Remember a category; batch callers pass save=False and call save() once at the end"""
+        with self.lock:
+            self.entries[name.strip().lower()] = {'id': category_id, 'name': category_name, 'time': time.time()}
+            if save:
+                self._save()
+
+    def save(self):
+        with self.lock:
+            self._save()
+
+    def _save(self):
+        try:
+            tmp = self.cache_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2)
+            os.replace(tmp, self.cache_file)
+        except Exception:
+            pass
+
+
 class TwitchBot:
     CLIENT_ID = 'll2bpleltqt52whwzu4cidrthdgipj'  # kept as in file
+    API_URL = 'https://api.twitch.tv/helix'
+    REFRESH_MARGIN = 600  # refresh this many seconds before the access token expires
+    TOKEN_FIELDS = ('access_token', 'refresh_token', 'token_timestamp', 'token_expires_at')
     _authenticating = False  # Class-level flag to prevent multiple auth dialogs
 
-    def __init__(self):
+    def __init__(self, interactive: bool = True, background_refresh: bool = True):
+        # interactive=False (daemon): never open the device-flow window, just report failure
+        # background_refresh=False: another process (the daemon) owns token rotation
+        self.interactive = interactive
+        self.background_refresh = background_refresh
         self.config = self.load_config()
         # Decrypt tokens on load
         encrypted_access_token = self.config.get('access_token')
@@ -305,6 +621,12 @@ class TwitchBot:
         self.refresh_token = TokenEncryption.decrypt(encrypted_refresh_token) if encrypted_refresh_token else None
         self.user_id = self.config.get('user_id', None)
         self.token_timestamp = self.config.get('token_timestamp', 0)
+        self.token_expires_at = self.config.get('token_expires_at', 0)
+        self.categories = CategoryCache()
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer = None
+        self.last_change_phases = {}
+        self._schedule_refresh()
 
     def load_config(self) -> dict:
         try:
@@ -316,19 +638,60 @@ class TwitchBot:
             pass
         return {'channel_name': '', 'enabled': False, 'access_token': None, 'user_id': None}
 
-    def save_config(self):
+    def save_config(self, tokens: Optional[bool] = None):
+        """
+        Write the config file. With tokens=False the token fields already on disk are kept
+        (and adopted) instead of ours; that is the default when another process owns token
+        rotation, so a GUI attached to the daemon never writes back a spent token pair.
+        """
+        if tokens is None:
+            tokens = self.background_refresh
         try:
-            # Encrypt tokens before saving
             config_to_save = self.config.copy()
-            if self.access_token:
-                config_to_save['access_token'] = TokenEncryption.encrypt(self.access_token)
-            if self.refresh_token:
-                config_to_save['refresh_token'] = TokenEncryption.encrypt(self.refresh_token)
+            if tokens:
+                # Encrypt tokens before saving
+                if self.access_token:
+                    config_to_save['access_token'] = TokenEncryption.encrypt(self.access_token)
+                if self.refresh_token:
+                    config_to_save['refresh_token'] = TokenEncryption.encrypt(self.refresh_token)
+            else:
+                on_disk = self.load_config()
+                for field in self.TOKEN_FIELDS:
+                    config_to_save[field] = on_disk.get(field)
+                self._adopt_tokens(on_disk)
             with open(TWITCH_CONFIG_FILE, 'w') as f:
                 json.dump(config_to_save, f, indent=2)
         except Exception:
             pass
 
+    def _adopt_tokens(self, cfg: dict):
+        """Take the token fields of a config read from disk"""
+        for field in self.TOKEN_FIELDS:
+            self.config[field] = cfg.get(field)
+        self.access_token = TokenEncryption.decrypt(cfg['access_token']) if cfg.get('access_token') else None
+        self.refresh_token = TokenEncryption.decrypt(cfg['refresh_token']) if cfg.get('refresh_token') else None
+        self.token_timestamp = cfg.get('token_timestamp') or 0
+        self.token_expires_at = cfg.get('token_expires_at') or 0
+
+    def reload_tokens(self):
+        """Pick up the tokens another process (the daemon) last saved"""
+        self._adopt_tokens(self.load_config())
+        self._schedule_refresh()
+
+    def reload_config(self):
+        """
+        Re-read settings another process saved. The tokens on disk only replace ours when
+        they are newer (a login in the GUI) or when we don't own token rotation anyway.
+        """
+        on_disk = self.load_config()
+        for key, value in on_disk.items():
+            if key not in self.TOKEN_FIELDS:
+                self.config[key] = value
+        self.user_id = self.config.get('user_id', self.user_id)
+        if not self.background_refresh or (on_disk.get('token_timestamp') or 0) > self.token_timestamp:
+            self._adopt_tokens(on_disk)
+        self._schedule_refresh()
+
     def update_config(self, channel: str, enabled: bool):
         self.config['channel_name'] = channel
         self.config['enabled'] = enabled
@@ -350,13 +713,13 @@ class TwitchBot:
         if TwitchBot._authenticating:
             return False
         
-        if not self.config.get('channel_name'):
+        if not self.config.get('channel_name') or not self.interactive:
             return False
         
         try:
             TwitchBot._authenticating = True
-            import requests, webbrowser, time, threading
-            r = requests.post('https://id.twitch.tv/oauth2/device',
+            import webbrowser, time, threading
+            r = get_http().post('https://id.twitch.tv/oauth2/device',
                               data={'client_id': self.CLIENT_ID,
                                     'scopes': 'channel:manage:broadcast'},
                               timeout=10)
@@ -392,7 +755,7 @@ class TwitchBot:
                 start = time.time()
                 while time.time() - start < expires_in:
                     time.sleep(interval)
-                    t = requests.post('https://id.twitch.tv/oauth2/token', data={
+                    t = get_http().post('https://id.twitch.tv/oauth2/token', data={
                         'client_id': self.CLIENT_ID,
                         'device_code': device_code,
                         'grant_type': 'urn:ietf:params:oauth:grant-type:device_code'
@@ -406,16 +769,9 @@ class TwitchBot:
             popup.wait_window()
 
             if 'access_token' in token_data:
-                self.access_token = token_data['access_token']
                 self.refresh_token = token_data.get('refresh_token')
-                import time
-                self.token_timestamp = time.time()
-                self.config.update({
-                    'access_token': self.access_token,
-                    'refresh_token': self.refresh_token,
-                    'token_timestamp': self.token_timestamp
-                })
-                self.save_config()
+                self.config['refresh_token'] = self.refresh_token
+                self._store_token(token_data)
                 TwitchBot._authenticating = False
                 return True
             
@@ -425,95 +781,130 @@ class TwitchBot:
             TwitchBot._authenticating = False
             return False
 
-    def refresh_access_token(self) -> bool:
-        """Use stored refresh_token to get a new access_token silently."""
-        if not self.refresh_token:
-            return False
-        try:
-            import requests
-            import time
-            r = requests.post('https://id.twitch.tv/oauth2/token', data={
-                'grant_type': 'refresh_token',
-                'refresh_token': self.refresh_token,
-                'client_id': self.CLIENT_ID
-            }, timeout=10)
-            
-            if r.status_code == 200:
-                d = r.json()
-                self.access_token = d['access_token']
-                self.token_timestamp = time.time()
-                self.config['access_token'] = self.access_token
-                self.config['token_timestamp'] = self.token_timestamp
-                # Twitch ALWAYS returns a new refresh token, so update it
-                if 'refresh_token' in d:
-                    self.refresh_token = d['refresh_token']
-                    self.config['refresh_token'] = self.refresh_token
-                self.save_config()
+    def _store_token(self, token_data: dict):
+        """Keep a new access token plus its expiry (from expires_in) and schedule the next refresh"""
+        self.access_token = token_data['access_token']
+        self.token_timestamp = time.time()
+        expires_in = token_data.get('expires_in')
+        self.token_expires_at = self.token_timestamp + expires_in if expires_in else 0
+        self.config['access_token'] = self.access_token
+        self.config['token_timestamp'] = self.token_timestamp
+        self.config['token_expires_at'] = self.token_expires_at
+        self.save_config(tokens=True)  # a fresh login or refresh: these are the current tokens
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Refresh in the background REFRESH_MARGIN seconds before the token expires"""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if not (self.background_refresh and self.refresh_token and self.token_expires_at):
+            return
+        delay = max(self.token_expires_at - self.REFRESH_MARGIN - time.time(), 1)
+        self._refresh_timer = threading.Timer(delay, self.refresh_access_token)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def refresh_access_token(self, stale_token: Optional[str] = None) -> bool:
+        """
+        Use stored refresh_token to get a new access_token silently.
+        Pass the token that was rejected as stale_token: if another thread already
+        replaced it, that token is used instead of refreshing twice.
+        """
+        with self._refresh_lock:
+            if stale_token and self.access_token and self.access_token != stale_token:
                 return True
-            elif r.status_code == 400:
-                # Refresh token is invalid or expired - need to re-authenticate
-                self.refresh_token = None
-                self.config['refresh_token'] = None
-                self.save_config()
+            if not self.background_refresh:
+                # The daemon rotates the tokens; use its latest pair instead of spending the refresh token
+                self.reload_tokens()
+                return bool(self.access_token) and self.access_token != stale_token
+            if not self.refresh_token:
                 return False
-        except Exception:
-            pass
-        return False
+            try:
+                r = get_http().post('https://id.twitch.tv/oauth2/token', data={
+                    'grant_type': 'refresh_token',
+                    'refresh_token': self.refresh_token,
+                    'client_id': self.CLIENT_ID
+                }, timeout=10)
+
+                if r.status_code == 200:
+                    d = r.json()
+                    # Twitch ALWAYS returns a new refresh token, so update it
+                    if 'refresh_token' in d:
+                        self.refresh_token = d['refresh_token']
+                        self.config['refresh_token'] = self.refresh_token
+                    self._store_token(d)
+                    return True
+                elif r.status_code == 400:
+                    # Refresh token is invalid or expired - need to re-authenticate
+                    self.refresh_token = None
+                    self.config['refresh_token'] = None
+                    self.save_config()
+                    return False
+            except Exception:
+                pass
+            return False
 
     def ensure_token_valid(self) -> bool:
-        """Check token validity, refresh or re-auth if needed. Always tries refresh before re-auth."""
-        import time
-        
-        # Proactive refresh: if token is older than 3 hours (10800 seconds), refresh it
-        # Twitch access tokens typically last ~4 hours, so this prevents expiration
-        token_age = time.time() - self.token_timestamp if self.token_timestamp else float('inf')
-        if token_age > 10800 and self.refresh_token:  # 3 hours = 10800 seconds
-            if self.refresh_access_token():
-                return True
-        
+        """
+        Make sure we hold an access token that isn't about to expire, without any API call
+        in the common case. Tokens saved before expiry tracking are checked once with
+        /oauth2/validate to learn their expiry. A 401 from a real call is handled by _helix.
+        """
         # If no access token, try refresh first (in case we have refresh token)
         if not self.access_token:
             if self.refresh_token and self.refresh_access_token():
                 return True
             return self.authenticate()
 
-        # Try to validate the current access token
+        if not self.token_expires_at:
+            self._learn_token_expiry()
+
+        if self.token_expires_at and time.time() > self.token_expires_at - self.REFRESH_MARGIN:
+            if self.refresh_token and self.refresh_access_token(self.access_token):
+                return True
+            # Still usable for now? Otherwise a new login is needed
+            if time.time() < self.token_expires_at:
+                return True
+            return self.authenticate()
+        return True
+
+    def _learn_token_expiry(self):
         try:
-            import requests
-            h = {'Authorization': f'Bearer {self.access_token}',
-                 'Client-Id': self.CLIENT_ID}
-            r = requests.get('https://api.twitch.tv/helix/users', headers=h, timeout=6)
-            
+            r = get_http().get('https://id.twitch.tv/oauth2/validate',
+                               headers={'Authorization': f'OAuth {self.access_token}'}, timeout=6)
             if r.status_code == 200:
-                # Token is valid
-                return True
+                self.token_expires_at = time.time() + r.json().get('expires_in', 0)
+                self.config['token_expires_at'] = self.token_expires_at
+                self.save_config()
+                self._schedule_refresh()
             elif r.status_code == 401:
-                # Token is invalid/expired - try refresh
-                if self.refresh_token and self.refresh_access_token():
-                    return True
-                # Refresh failed - need to re-authenticate
-                return self.authenticate()
-            else:
-                # Other error - try refresh just in case
-                if self.refresh_token and self.refresh_access_token():
-                    return True
-                return False
+                # Already expired - make the refresh below happen
+                self.token_expires_at = time.time() - 1
         except Exception:
-            # Network error or other exception
-            # Don't immediately re-auth on network errors
-            # The token might still be valid, just couldn't reach API
-            # Return False but don't trigger re-authentication
-            return False
+            # Network error: assume the token is fine, a 401 later will refresh it
+            pass
+
+    def _helix(self, method: str, path: str, **kwargs):
+        """Authenticated Helix call; on 401 refresh the token once and retry"""
+        token = self.access_token
+        headers = dict(kwargs.pop('headers', {}))
+        headers['Client-Id'] = self.CLIENT_ID
+        headers['Authorization'] = f'Bearer {token}'
+        resp = get_http().request(method, f'{self.API_URL}/{path}', headers=headers, **kwargs)
+        if resp.status_code == 401 and self.refresh_access_token(token):
+            headers['Authorization'] = f'Bearer {self.access_token}'
+            resp = get_http().request(method, f'{self.API_URL}/{path}', headers=headers, **kwargs)
+        return resp
 
     def get_user_id(self) -> bool:
         if not self.access_token:
             return False
         try:
-            import requests
             headers = {'Authorization': f'Bearer {self.access_token}'}
             # try /userinfo first
             try:
-                resp = requests.get('https://id.twitch.tv/oauth2/userinfo', headers=headers, timeout=10)
+                resp = get_http().get('https://id.twitch.tv/oauth2/userinfo', headers=headers, timeout=10)
                 if resp.status_code == 200:
                     data = resp.json()
                     self.user_id = data.get('sub')
@@ -523,8 +914,7 @@ class TwitchBot:
             except Exception:
                 pass
 
-            headers = {'Authorization': f'Bearer {self.access_token}', 'Client-Id': self.CLIENT_ID}
-            resp = requests.get('https://api.twitch.tv/helix/users', headers=headers, timeout=10)
+            resp = self._helix('GET', 'users', timeout=10)
             if resp.status_code == 200:
                 data = resp.json()
                 if data.get('data'):
@@ -547,6 +937,7 @@ class TwitchBot:
     def smart_search_game(self, game_name: str, is_game_running=True):
         """
         Smart Twitch category picker:
+        - Cached ID from an earlier lookup (no API call)
         - Exact match first
         - If not found, take top result
         - If no results but a game is running, set to 'Games + Demos'
@@ -561,32 +952,9 @@ class TwitchBot:
         mapped_name = self.GAME_NAME_MAPPING.get(game_name_lower, game_name)
 
         try:
-            import requests
-            headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Client-Id': self.CLIENT_ID
-            }
-
-            # Search Twitch categories
-            r = requests.get(
-                'https://api.twitch.tv/helix/search/categories',
-                params={'query': mapped_name},
-                headers=headers,
-                timeout=6
-            )
-
-            if r.status_code == 200:
-                results = r.json().get('data', [])
-                if results:
-                    lower_query = mapped_name.strip().lower()
-
-                    # 1️⃣ Exact match (case-insensitive)
-                    for item in results:
-                        if item.get('name', '').strip().lower() == lower_query:
-                            return item['id']
-
-                    # 2️⃣ Top result fallback
-                    return results[0]['id']
+            category_id = self.resolve_category(mapped_name)
+            if category_id:
+                return category_id
 
             # 3️⃣ If no result but a game is running → Games + Demos
             if is_game_running:
@@ -600,234 +968,963 @@ class TwitchBot:
             # Network or token error → fallback depending on context
             return "66082" if is_game_running else "509658"
 
+    def resolve_category(self, mapped_name: str, save: bool = True) -> Optional[str]:
+        """
+        Category ID for a (mapped) game name from the cache, else /helix/search/categories.
+        Returns None when Twitch has no match; raises on network/token errors.
+        save=False leaves persisting the category cache to the caller.
+        """
+        cached = self.categories.get(mapped_name)
+        if cached:
+            return cached
+
+        # Search Twitch categories
+        r = self._helix('GET', 'search/categories', params={'query': mapped_name}, timeout=6)
+        if r.status_code != 200:
+            raise RuntimeError(f"category search failed: HTTP {r.status_code}")
 
+        results = r.json().get('data', [])
+        if not results:
+            return None
+        lower_query = mapped_name.strip().lower()
 
+        # 1️⃣ Exact match (case-insensitive), 2️⃣ top result fallback
+        match = next((item for item in results if item.get('name', '').strip().lower() == lower_query),
+                     results[0])
+        self.categories.put(mapped_name, match['id'], match.get('name', ''), save=save)
+        return match['id']
 
+    def prefetch_categories(self, game_names: List[str]):
+        """Resolve category IDs for the whole library in the background so launches only PATCH"""
+        if not self.access_token:
+            return
+        fetched = 0
+        for game_name in game_names:
+            mapped_name = self.GAME_NAME_MAPPING.get(game_name.strip().lower(), game_name)
+            if self.categories.get(mapped_name):
+                continue
+            try:
+                self.resolve_category(mapped_name, save=False)
+                fetched += 1
+            except Exception:
+                # Token expired or offline - the launch path will resolve it instead
+                break
+            time.sleep(0.1)  # stay well inside Helix rate limits
+        if fetched:
+            self.categories.save()
+            print(f"Prefetched {fetched} Twitch categories")
 
     def change_category(self, game_name: str) -> bool:
+        """Set the channel category; phase durations end up in self.last_change_phases"""
+        self.last_change_phases = {}
         if not self.config.get('enabled'):
             return False
-        if not self.ensure_token_valid():
-            return False
-
-        if not self.user_id and not self.get_user_id():
+        with METRICS.timer('twitch.token') as t:
+            ok = self.ensure_token_valid() and (self.user_id or self.get_user_id())
+        self.last_change_phases['token'] = t.elapsed
+        if not ok:
+            print(f"⚠️ Twitch category change to '{game_name}' failed: not authenticated")
             return False
         try:
-            import requests
-            if game_name.lower() == "just chatting":
-                game_id = "509658"
-            else:
-                game_id = self.smart_search_game(game_name, is_game_running=bool(game_name))
-                if not game_id:
-                    game_id = "66082" if game_name else "509658"
-            headers = {'Authorization': f'Bearer {self.access_token}', 'Client-Id': self.CLIENT_ID, 'Content-Type': 'application/json'}
+            with METRICS.timer('twitch.search') as t:
+                if game_name.lower() == "just chatting":
+                    game_id = "509658"
+                else:
+                    game_id = self.smart_search_game(game_name, is_game_running=bool(game_name))
+                    if not game_id:
+                        game_id = "66082" if game_name else "509658"
+            self.last_change_phases['search'] = t.elapsed
             data = {'game_id': game_id}
-            resp = requests.patch(f'https://api.twitch.tv/helix/channels?broadcaster_id={self.user_id}', headers=headers, json=data, timeout=8)
-            return resp.status_code == 204
-        except Exception:
+            with METRICS.timer('twitch.patch') as t:
+                resp = self._helix('PATCH', 'channels', params={'broadcaster_id': self.user_id}, json=data, timeout=8)
+            self.last_change_phases['patch'] = t.elapsed
+            if resp.status_code != 204:
+                print(f"⚠️ Twitch category change to '{game_name}' failed: HTTP {resp.status_code} {resp.text[:120]}")
+                return False
+            return True
+        except Exception as e:
+            print(f"⚠️ Twitch category change to '{game_name}' failed: {e}")
             return False
 
-# Game Scanner
-class GameScanner:
-    # Applications that should NEVER be included in scans
-    PERMANENT_EXCLUSIONS = {
-        'Steamworks Common Redistributables',
-        'Wallpaper Engine',
-        'wallpaper engine',
-    }
-    
-    def __init__(self):
-        self.excluded = self.load_excluded()
+class AsyncTwitchClient:
+    """
+    Sends category changes for a TwitchBot from one asyncio loop on its own thread.
 
-    def load_excluded(self) -> Set[str]:
+    Updates are strictly ordered and coalesced: only the latest requested category
+    is sent, anything superseded while a PATCH is in flight is dropped. A change that
+    fails is retried with backoff until it succeeds or a newer request replaces it, so
+    the channel ends up on the category of the last game event. The blocking Helix
+    calls run in the loop's executor; token refreshes are single-flight
+    (see TwitchBot.refresh_access_token).
+    """
+    RETRY_DELAYS = (2, 5, 15, 30, 60)  # seconds before each retry of a failed change; the last repeats
+
+    def __init__(self, twitch: TwitchBot):
+        self.twitch = twitch
+        self.loop = None
+        self._wanted = None  # latest requested category (game name / "Just Chatting")
+        self._sent = None  # last category the channel was successfully set to
+        self._changed = None  # asyncio.Event, set whenever _wanted changes
+        self._worker_task = None
+        self._detected_at = 0.0
+
+    def start(self):
+        if self.loop:
+            return
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self._changed = asyncio.Event()
+            loop = self.loop
+            self._worker_task = loop.create_task(self._update_worker()) # type: ignore
+            loop.call_soon(ready.set) # type: ignore
+            loop.run_forever() # type: ignore
+            loop.close() # type: ignore
+
+        threading.Thread(target=run, name="twitch-client", daemon=True).start()
+        ready.wait(5)
+
+    def stop(self):
+        loop, self.loop = self.loop, None
+        if loop:
+            loop.call_soon_threadsafe(self._shutdown, loop)
+
+    def _shutdown(self, loop):
+        # Let the cancelled worker unwind for one iteration before the loop stops
+        self._worker_task.cancel() # type: ignore
+        loop.call_soon(loop.stop)
+
+    def request_category(self, game_name: str, detected_at: Optional[float] = None):
+        """
+        Thread-safe: make game_name the category to set; replaces any pending request.
+        detected_at (time.time() of the process event) is used for the latency metrics.
+        """
+        if self.loop:
+            self.loop.call_soon_threadsafe(self._set_wanted, game_name, detected_at or time.time())
+
+    def _set_wanted(self, game_name: str, detected_at: float):
+        if self._wanted != self._sent and self._wanted is not None and self._wanted != game_name:
+            METRICS.incr('twitch.superseded')
+            print(f"Twitch category '{self._wanted}' superseded by '{game_name}' before it was set")
+        self._wanted = game_name
+        self._detected_at = detected_at
+        self._changed.set() # type: ignore
+
+    async def _update_worker(self):
+        import asyncio
+        failures = 0
+        while True:
+            if failures:
+                # Retry the failed category, unless a newer request comes in first
+                delay = self.RETRY_DELAYS[min(failures, len(self.RETRY_DELAYS)) - 1]
+                try:
+                    await asyncio.wait_for(self._changed.wait(), delay) # type: ignore
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self._changed.wait() # type: ignore
+            self._changed.clear() # type: ignore
+            game_name, detected_at = self._wanted, self._detected_at
+            if game_name == self._sent:
+                failures = 0
+                continue
+            ok = await self.loop.run_in_executor(None, self.twitch.change_category, game_name) # type: ignore
+            self._sent = game_name if ok else None
+            if ok or not self.twitch.config.get('enabled'):
+                failures = 0  # nothing to retry while category changes are switched off
+            else:
+                failures += 1
+                delay = self.RETRY_DELAYS[min(failures, len(self.RETRY_DELAYS)) - 1]
+                print(f"Retrying Twitch category '{game_name}' in {delay}s (attempt {failures + 1})")
+            total = time.time() - detected_at
+            METRICS.observe('twitch.detect_to_patch', total)
+            METRICS.incr('twitch.changes' if ok else 'twitch.change_failures')
+            phases = getattr(self.twitch, 'last_change_phases', {})
+            METRICS.event('category_change', game=game_name, ok=ok, total_ms=round(total * 1000, 1),
+                          **{f'{k}_ms': round(v * 1000, 1) for k, v in phases.items()})
+
+
+class DirectoryIndex:
+    """
+    "Find folder by name" index over the game drives.
+
+    Every directory visited is stored with its mtime and subdirectory names (system and
+    volatile trees in SKIP_DIRS are pruned before they are listed or stored). On a rescan,
+    including after a restart, a directory whose mtime is unchanged reuses its stored
+    listing, so only directories that changed since the last run are read again; the
+    rest cost one stat each. The file is only rewritten when a listing changed. Several
+    folder names can be looked up in one traversal.
+    """
+    VERSION = 2
+    # Never descended into: system folders and volatile trees that won't hold a game
+    SKIP_DIRS = {'windows', 'windows.old', '$recycle.bin', '$windows.~bt', '$windows.~ws', '$winreagent',
+                 'system volume information', 'recovery', 'perflogs', 'programdata', 'appdata',
+                 'program files', 'program files (x86)', 'windowsapps', 'temp', 'tmp', '$sysreset',
+                 'node_modules', '.git', '__pycache__'}
+
+    def __init__(self, index_file: Path = LOCATION_INDEX_FILE):
+        self.index_file = index_file
+        self.nodes = {}  # dir path -> [mtime_ns, [subdir names]]
+        self.lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def load(self):
+        self._loaded = True
         try:
-            if EXCLUDED_GAMES_FILE.exists():
-                with open(EXCLUDED_GAMES_FILE, 'r') as f:
-                    return set(json.load(f).get('excluded', []))
+            if self.index_file.exists():
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    self.nodes = data.get('nodes', {})
         except Exception:
-            pass
-        return set()
+            self.nodes = {}
 
-    def save_excluded(self):
+    def save(self):
+        if not self._dirty:
+            return
         try:
-            with open(EXCLUDED_GAMES_FILE, 'w') as f:
-                json.dump({'excluded': list(self.excluded)}, f, indent=2)
+            tmp = self.index_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.VERSION, 'nodes': self.nodes}, f, separators=(',', ':'))
+            os.replace(tmp, self.index_file)
+            self._dirty = False
         except Exception:
             pass
 
-    def exclude(self, name: str):
-        self.excluded.add(name)
-        self.save_excluded()
+    def _listing(self, path: str) -> List[str]:
+        """Subdirectory names of path (skipped ones left out), from the index when its mtime hasn't changed"""
+        mtime = os.stat(path).st_mtime_ns
+        node = self.nodes.get(path)
+        if node and node[0] == mtime:
+            return node[1]
+        with os.scandir(path) as it:
+            children = [e.name for e in it
+                        if e.name.lower() not in self.SKIP_DIRS and e.is_dir(follow_symlinks=False)]
+        self.nodes[path] = [mtime, children]
+        self._dirty = True
+        return children
 
-    def unexclude(self, name: str):
-        if name in self.excluded:
-            self.excluded.remove(name)
-            self.save_excluded()
-            return True
-        return False
+    def find_folders(self, names, roots: List[str], max_depth: int = 6) -> dict:
+        """
+        One traversal of roots (to max_depth) answering every name in names.
+        Returns {name_lower: [matching directory paths]}.
+        """
+        wanted = {n.lower() for n in names}
+        found = {n: [] for n in wanted}
+        with self.lock:
+            if not self._loaded:
+                self.load()
+            visited = set()
+            for root in roots:
+                stack = [(root, 0)]
+                while stack:
+                    path, depth = stack.pop()
+                    try:
+                        children = self._listing(path)
+                    except OSError:
+                        continue
+                    visited.add(path)
+                    for child in children:
+                        child_path = os.path.join(path, child)
+                        if child.lower() in wanted:
+                            found[child.lower()].append(child_path)
+                        if depth + 1 < max_depth:
+                            stack.append((child_path, depth + 1))
 
-    def get_excluded_list(self) -> List[str]:
-        return sorted(list(self.excluded))
+            # Forget directories under these roots that no longer exist
+            for path in [p for p in self.nodes if p not in visited and any(p.startswith(r) for r in roots)]:
+                del self.nodes[path]
+                self._dirty = True
+            self.save()
+        return found
 
-    def is_excluded(self, name: str) -> bool:
-        # Check if in permanent exclusions (case-insensitive)
-        name_lower = name.lower()
-        for perm_exclusion in self.PERMANENT_EXCLUSIONS:
-            if name_lower == perm_exclusion.lower():
-                return True
-        # Check user exclusions
-        return name in self.excluded
+
+# ---------- Platform ----------
+class PlatformBackend:
+    """
+    The OS lookups the launcher scanners need: registry values, mounted drives and
+    well-known folders. Hives are named 'HKCU' / 'HKLM' and keys use backslashes.
+    """
+
+    def registry_value(self, hive: str, key: str, name: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def registry_subkeys(self, hive: str, key: str) -> List[str]:
+        raise NotImplementedError
 
     def get_drives(self) -> List[str]:
-        import string
-        return [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
+        raise NotImplementedError
 
-    def scan_steam(self) -> List[Game]:
-        games = []
-        try:
-            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam")
-            steam_path = Path(winreg.QueryValueEx(key, "SteamPath")[0])
-            winreg.CloseKey(key)
-
-            library_file = steam_path / "steamapps" / "libraryfolders.vdf"
-            if library_file.exists():
-                with open(library_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if '"path"' in line:
-                            path = line.split('"')[3].replace('\\\\', '\\')
-                            steamapps = Path(path) / "steamapps"
-                            if steamapps.exists():
-                                for acf in steamapps.glob("appmanifest_*.acf"):
-                                    try:
-                                        with open(acf, 'r', encoding='utf-8') as af:
-                                            content = af.read()
-                                            name = installdir = None
-                                            for l in content.split('\n'):
-                                                if '"name"' in l:
-                                                    name = l.split('"')[3]
-                                                if '"installdir"' in l:
-                                                    installdir = l.split('"')[3]
-                                            if name and installdir and not self.is_excluded(name):
-                                                gpath = steamapps / "common" / installdir
-                                                if gpath.exists():
-                                                    exe_found = None
-                                                    
-                                                    # Special handling for Marvel Rivals on Steam
-                                                    if "marvel rivals" in name.lower():
-                                                        # NOTE: Game uses "Marvel" not "MarvelRivals" in exe names!
-                                                        marvel_exes = [
-                                                            gpath / "Marvel-Win64-Shipping.exe",
-                                                            gpath / "Marvel" / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
-                                                            gpath / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
-                                                            gpath / "MarvelGame" / "Marvel" / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
-                                                            # Also check for MarvelRivals variant
-                                                            gpath / "MarvelRivals" / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
-                                                            gpath / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
-                                                            gpath / "MarvelRivals-Win64-Shipping.exe",
-                                                        ]
-                                                        for marvel_exe in marvel_exes:
-                                                            if marvel_exe.exists():
-                                                                exe_found = marvel_exe
-                                                                break
-                                                        
-                                                        # If still not found, do a deep search for Marvel Rivals specifically
-                                                        if not exe_found:
-                                                            try:
-                                                                for root, dirs, files in os.walk(gpath):
-                                                                    depth = root[len(str(gpath)):].count(os.sep)
-                                                                    if depth > 5:
-                                                                        dirs.clear()
-                                                                        continue
-                                                                    for file in files:
-                                                                        file_lower = file.lower()
-                                                                        # Look for Marvel-Win64-Shipping.exe OR MarvelRivals-Win64-Shipping.exe
-                                                                        if (file_lower.endswith('-win64-shipping.exe') and 
-                                                                            ('marvel-' in file_lower or 'marvelrivals-' in file_lower)):
-                                                                            exe_found = Path(root) / file
-                                                                            break
-                                                                    if exe_found:
-                                                                        break
-                                                            except Exception:
-                                                                pass
-                                                    
-                                                    # Standard exe detection if not found yet (for non-Marvel games or as fallback)
-                                                    if not exe_found:
-                                                        common_exes = [
-                                                            gpath / f"{installdir}.exe",
-                                                            gpath / f"{name}.exe",
-                                                            gpath / "bin" / f"{installdir}.exe",
-                                                            gpath / "Binaries" / "Win64" / f"{installdir}.exe",
-                                                            gpath / "Binaries" / "Win64" / f"{name}.exe",
-                                                            gpath / f"{installdir}-Win64-Shipping.exe",
-                                                            gpath / "Game" / f"{installdir}.exe",
-                                                            gpath / "Client" / f"{installdir}.exe",
-                                                        ]
-                                                        for exe_path in common_exes:
-                                                            if exe_path.exists():
-                                                                exe_found = exe_path
-                                                                break
-                                                    if not exe_found:
-                                                        try:
-                                                            skip_patterns = ['unins', 'install', 'setup', 'crash', 'report', 'redist', 'dotnet', 'directx', 'vcredist', 'unity', 'unreal', 'launcher']
-                                                            
-                                                            # For Marvel Rivals specifically, ONLY accept shipping exe
-                                                            if "marvel rivals" in name.lower():
-                                                                exes_root = [e for e in gpath.glob("*.exe") 
-                                                                            if 'shipping' in e.stem.lower() and not any(skip in e.stem.lower() for skip in skip_patterns)]
-                                                            else:
-                                                                exes_root = [e for e in gpath.glob("*.exe") 
-                                                                            if not any(skip in e.stem.lower() for skip in skip_patterns)]
-                                                            
-                                                            if exes_root:
-                                                                game_exes = [e for e in exes_root if 'game' in e.stem.lower() or installdir.lower() in e.stem.lower()]
-                                                                exe_found = game_exes[0] if game_exes else exes_root[0]
-                                                            else:
-                                                                for root, dirs, files in os.walk(gpath):
-                                                                    depth = root[len(str(gpath)):].count(os.sep)
-                                                                    if depth > 3:
-                                                                        dirs.clear()
-                                                                        continue
-                                                                    
-                                                                    # For Marvel Rivals, ONLY look for shipping exe
-                                                                    if "marvel rivals" in name.lower():
-                                                                        exe_files = [f for f in files if f.endswith('.exe') 
-                                                                                    and 'shipping' in f.lower()
-                                                                                    and ('marvel-' in f.lower() or 'marvelrivals-' in f.lower())
-                                                                                    and not any(skip in f.lower() for skip in skip_patterns)]
-                                                                    else:
-                                                                        exe_files = [f for f in files if f.endswith('.exe') 
-                                                                                    and not any(skip in f.lower() for skip in skip_patterns)]
-                                                                    
-                                                                    if exe_files:
-                                                                        game_exes = [f for f in exe_files if 'game' in f.lower() or installdir.lower() in f.lower()]
-                                                                        exe_found = Path(root) / (game_exes[0] if game_exes else exe_files[0])
-                                                                        break
-                                                        except Exception:
-                                                            pass
-                                                    games.append(Game(name, str(gpath), "Steam", str(exe_found) if exe_found else ""))
-                                    except Exception:
-                                        continue
+    def program_data(self) -> str:
+        raise NotImplementedError
+
+
+class WindowsPlatform(PlatformBackend):
+    """The real thing: winreg and drive letters"""
+    HIVES = {'HKCU': 'HKEY_CURRENT_USER', 'HKLM': 'HKEY_LOCAL_MACHINE'}
+
+    def _open(self, hive: str, key: str):
+        return winreg.OpenKey(getattr(winreg, self.HIVES[hive]), key)
+
+    def registry_value(self, hive: str, key: str, name: str) -> Optional[str]:
+        try:
+            handle = self._open(hive, key)
+            try:
+                return winreg.QueryValueEx(handle, name)[0]
+            finally:
+                winreg.CloseKey(handle)
+        except Exception:
+            return None
+
+    def registry_subkeys(self, hive: str, key: str) -> List[str]:
+        names = []
+        try:
+            handle = self._open(hive, key)
+            try:
+                i = 0
+                while True:
+                    try:
+                        names.append(winreg.EnumKey(handle, i))
+                    except OSError:
+                        break
+                    i += 1
+            finally:
+                winreg.CloseKey(handle)
         except Exception:
             pass
-        return games
+        return names
 
-    def scan_epic(self) -> List[Game]:
-        games = []
-        manifests = Path(os.environ.get('PROGRAMDATA', 'C:\\ProgramData')) / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
-        if manifests.exists():
-            for manifest in manifests.glob("*.item"):
-                try:
-                    with open(manifest, 'r') as f:
-                        data = json.load(f)
-                        name = data.get('DisplayName')
-                        location = data.get('InstallLocation')
-                        if name and location and Path(location).exists() and not self.is_excluded(name):
-                            gpath = Path(location)
-                            exe_found = None
-                            
-                            # Special handling for Marvel Rivals on Epic
-                            if "marvel rivals" in name.lower():
-                                marvel_exes = [
+    def get_drives(self) -> List[str]:
+        import string
+        return [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
+
+    def program_data(self) -> str:
+        return os.environ.get('PROGRAMDATA', 'C:\\ProgramData')
+
+
+class FakePlatform(PlatformBackend):
+    """
+    In-memory registry with ordinary directories standing in for drives and
+    ProgramData, so scans can run (and be timed) on any OS.
+    """
+
+    def __init__(self, drives: Optional[List[str]] = None, program_data: str = ""):
+        self.drives = list(drives or [])
+        self.program_data_dir = program_data
+        self.registry = {}  # (hive, key lower) -> {value name: value}
+
+    def set_registry_value(self, hive: str, key: str, name: str, value):
+        self.registry.setdefault((hive, key.lower()), {})[name] = value
+
+    def registry_value(self, hive: str, key: str, name: str) -> Optional[str]:
+        return self.registry.get((hive, key.lower()), {}).get(name)
+
+    def registry_subkeys(self, hive: str, key: str) -> List[str]:
+        prefix = key.lower() + '\\'
+        names = []
+        for h, k in self.registry:
+            if h == hive and k.startswith(prefix):
+                child = k[len(prefix):].split('\\')[0]
+                if child not in names:
+                    names.append(child)
+        return names
+
+    def get_drives(self) -> List[str]:
+        return list(self.drives)
+
+    def program_data(self) -> str:
+        return self.program_data_dir
+
+
+# ---------- Steam VDF ----------
+# One token of Valve's text KeyValues format: a quoted string (with backslash escapes),
+# a brace, a // comment, a [$PLATFORM] conditional or a bare word
+_VDF_TOKEN = re.compile(r'"((?:[^"\\]|\\.)*)"?|([{}])|//[^\n]*|\[[^\]\n]*\]|([^\s{}"]+)')
+_VDF_ESCAPES = {'n': '\n', 't': '\t', '\\': '\\', '"': '"'}
+
+
+def iter_vdf_tokens(text: str):
+    """Yield ('str', value), ('{', None) or ('}', None) for each token of a VDF/ACF document"""
+    for match in _VDF_TOKEN.finditer(text):
+        quoted, brace, bare = match.groups()
+        if brace:
+            yield brace, None
+        elif quoted is not None:
+            if '\\' in quoted:
+                quoted = re.sub(r'\\(.)', lambda m: _VDF_ESCAPES.get(m.group(1), m.group(1)), quoted)
+            yield 'str', quoted
+        elif bare is not None:
+            yield 'str', bare
+
+
+def parse_vdf(text: str) -> dict:
+    """Parse a text VDF/ACF document into nested dicts (later duplicate keys win)"""
+    root = {}
+    stack = [root]
+    key = None
+    for kind, value in iter_vdf_tokens(text):
+        if kind == '{':
+            node = {}
+            if key is not None:
+                stack[-1][key] = node
+            stack.append(node)
+            key = None
+        elif kind == '}':
+            if len(stack) > 1:
+                stack.pop()
+            key = None
+        elif key is None:
+            key = value
+        else:
+            stack[-1][key] = value
+            key = None
+    return root
+
+
+def vdf_get(node: dict, key: str, default=None):
+    """Case-insensitive key lookup (Steam isn't consistent about key casing)"""
+    if key in node:
+        return node[key]
+    key = key.lower()
+    for k, v in node.items():
+        if k.lower() == key:
+            return v
+    return default
+
+
+class SteamManifestCache:
+    """
+    Parsed appmanifest_*.acf files, persisted and keyed by (path, mtime, size): an
+    unchanged manifest costs one stat() on rescans. Only the fields the scanner uses
+    are kept. Entries for manifests not seen during a scan are dropped on save.
+    """
+    VERSION = 1
+    FIELDS = ('appid', 'name', 'installdir')
+
+    def __init__(self, cache_file: Path = STEAM_MANIFEST_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = {}  # manifest path -> [mtime_ns, size, {field: value}]
+        self.seen = set()
+        self.lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    def load(self):
+        self._loaded = True
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    self.entries = data.get('entries', {})
+        except Exception:
+            self.entries = {}
+
+    def get(self, manifest: Path) -> Optional[dict]:
+        """The manifest's AppState fields, parsed only if the file changed; None if unreadable"""
+        path = str(manifest)
+        with self.lock:
+            if not self._loaded:
+                self.load()
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            self.seen.add(path)
+            cached = self.entries.get(path)
+            if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                state = vdf_get(parse_vdf(f.read()), 'AppState', {})
+        except OSError:
+            return None
+        info = {field: vdf_get(state, field) for field in self.FIELDS} if isinstance(state, dict) else {}
+        with self.lock:
+            self.entries[path] = [st.st_mtime_ns, st.st_size, info]
+            self._dirty = True
+        return info
+
+    def save(self):
+        with self.lock:
+            for path in [p for p in self.entries if p not in self.seen]:
+                del self.entries[path]
+                self._dirty = True
+            self.seen = set()
+            if not self._dirty:
+                return
+            try:
+                tmp = self.cache_file.with_suffix('.tmp')
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump({'version': self.VERSION, 'entries': self.entries}, f)
+                os.replace(tmp, self.cache_file)
+                self._dirty = False
+            except Exception:
+                pass
+
+
+class SteamAppInfo:
+    """
+    Reader for Steam's binary appcache/appinfo.vdf (format versions 27, 28 and 29).
+    Only the entries of the requested app ids are decoded; every other entry is
+    skipped by its size, so the cost scales with installed games, not with the
+    tens of thousands of apps Steam keeps there.
+    """
+    V27, V28, V29 = 0x07564427, 0x07564428, 0x07564429
+    # Skip launch options that don't start the game itself
+    SKIP_TYPES = {'none', 'server', 'editor', 'vr', 'othervr', 'openvr', 'openxr'}
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._memo = None  # ((path, mtime_ns, size), app ids, {app id: [launch exes]})
+
+    @staticmethod
+    def _read_kv(data: bytes, pos: int, strings: Optional[List[str]]):
+        """Decode one binary KeyValues node starting at pos; returns (dict, end pos)"""
+        node = {}
+        while pos < len(data):
+            kind = data[pos]
+            pos += 1
+            if kind in (0x08, 0x0B):  # end of node
+                return node, pos
+            if strings is None:
+                end = data.index(b'\0', pos)
+                key = data[pos:end].decode('utf-8', 'replace')
+                pos = end + 1
+            else:
+                key = strings[struct.unpack_from('<I', data, pos)[0]]
+                pos += 4
+            if kind == 0x00:
+                value, pos = SteamAppInfo._read_kv(data, pos, strings)
+            elif kind == 0x01:
+                end = data.index(b'\0', pos)
+                value = data[pos:end].decode('utf-8', 'replace')
+                pos = end + 1
+            elif kind in (0x02, 0x04, 0x06):
+                value = struct.unpack_from('<i', data, pos)[0]
+                pos += 4
+            elif kind == 0x03:
+                value = struct.unpack_from('<f', data, pos)[0]
+                pos += 4
+            elif kind == 0x07:
+                value = struct.unpack_from('<Q', data, pos)[0]
+                pos += 8
+            elif kind == 0x0A:
+                value = struct.unpack_from('<q', data, pos)[0]
+                pos += 8
+            elif kind == 0x05:
+                end = pos
+                while data[end:end + 2] != b'\0\0':
+                    end += 2
+                value = data[pos:end].decode('utf-16-le', 'replace')
+                pos = end + 2
+            else:
+                raise ValueError(f"unknown KeyValues type 0x{kind:02x} at {pos - 1}")
+            node[key] = value
+        return node, pos
+
+    def read_apps(self, path, app_ids) -> dict:
+        """{app id: appinfo dict} for the wanted app ids present in the file"""
+        import mmap
+        wanted = {int(a) for a in app_ids}
+        apps = {}
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, _universe = struct.unpack_from('<II', data, 0)
+            if magic not in (self.V27, self.V28, self.V29):
+                raise ValueError(f"unsupported appinfo.vdf version 0x{magic:08x}")
+            strings = None
+            pos = 8
+            if magic == self.V29:
+                # Keys are indices into a string table stored at the end of the file
+                table_offset = struct.unpack_from('<q', data, pos)[0]
+                pos += 8
+                count = struct.unpack_from('<I', data, table_offset)[0]
+                table = data[table_offset + 4:].split(b'\0', count)[:count]
+                strings = [s.decode('utf-8', 'replace') for s in table]
+            # appid, size, then size bytes: info state, last updated, PICS token, text SHA-1,
+            # change number, [binary SHA-1 from v28], KeyValues
+            header_size = 40 if magic == self.V27 else 60
+            end = len(data)
+            while wanted and pos + 8 <= end:
+                app_id, size = struct.unpack_from('<II', data, pos)
+                pos += 8
+                if app_id == 0:
+                    break
+                if app_id in wanted:
+                    node, _ = self._read_kv(data[pos:pos + size], header_size, strings)
+                    apps[app_id] = vdf_get(node, 'appinfo', node)
+                    wanted.discard(app_id)
+                pos += size
+        return apps
+
+    @classmethod
+    def launch_executables(cls, appinfo: dict) -> List[str]:
+        """
+        Windows launch executables (relative to the install dir, OS separators) in
+        preference order: default launch type before options, 64-bit before 32-bit,
+        then Steam's own order.
+        """
+        launch = vdf_get(vdf_get(appinfo, 'config', {}) or {}, 'launch', {}) or {}
+        ranked = []
+        for index, entry in launch.items():
+            if not isinstance(entry, dict):
+                continue
+            exe = vdf_get(entry, 'executable')
+            if not isinstance(exe, str) or not exe.lower().endswith('.exe'):
+                continue
+            config = vdf_get(entry, 'config', {}) or {}
+            oslist = str(vdf_get(config, 'oslist', '')).lower()
+            if oslist and 'windows' not in oslist:
+                continue
+            kind = str(vdf_get(entry, 'type', 'default')).lower()
+            if kind in cls.SKIP_TYPES:
+                continue
+            rank = (0 if kind == 'default' else 1,
+                    0 if str(vdf_get(config, 'osarch', '64')) in ('', '64') else 1,
+                    1 if vdf_get(config, 'betakey') else 0,
+                    int(index) if str(index).isdigit() else 999)
+            parts = [p for p in exe.replace('\\', '/').split('/') if p not in ('', '.')]
+            if parts:
+                ranked.append((rank, os.path.join(*parts)))
+        exes = []
+        for _, exe in sorted(ranked):
+            if exe not in exes:
+                exes.append(exe)
+        return exes
+
+    def launch_map(self, path, app_ids) -> dict:
+        """{app id: [launch exes]}, re-read only when appinfo.vdf or the wanted ids change"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return {}
+        stamp = (str(path), st.st_mtime_ns, st.st_size)
+        wanted = frozenset(int(a) for a in app_ids)
+        with self.lock:
+            if self._memo and self._memo[0] == stamp and wanted <= self._memo[1]:
+                return self._memo[2]
+            try:
+                apps = self.read_apps(path, wanted)
+            except Exception as e:
+                print(f"Could not read {path}: {e}")
+                apps = {}
+            launch = {app_id: self.launch_executables(info) for app_id, info in apps.items()}
+            self._memo = (stamp, wanted, launch)
+            return launch
+
+
+class ScanResult:
+    """Outcome of a single launcher scanner: its games, error (if any) and wall time"""
+    def __init__(self, scanner: str, games: List[Game], error: Optional[str] = None, duration: float = 0.0):
+        self.scanner = scanner
+        self.games = games
+        self.error = error
+        self.duration = duration
+
+# Game Scanner
+class GameScanner:
+    # Applications that should NEVER be included in scans
+    PERMANENT_EXCLUSIONS = {
+        'Steamworks Common Redistributables',
+        'Wallpaper Engine',
+        'wallpaper engine',
+    }
+    
+    # Upper bound on concurrent launcher scanners (they're all disk-bound)
+    SCAN_WORKERS = 8
+
+    # Folder names looked up across all drives for standalone (non-launcher) installs.
+    # They are answered together by a single DirectoryIndex traversal per scan.
+    STANDALONE_FOLDERS = {'marvel rivals'}
+
+    def __init__(self, platform: Optional[PlatformBackend] = None):
+        self.platform = platform or WindowsPlatform()
+        self.excluded = self.load_excluded()
+        # Search drives for Riot / Battle.net installs their launchers don't know about (slow)
+        self.drive_sweep = self.load_settings().get('drive_sweep', False)
+        self.last_scan_results: List[ScanResult] = []
+        self.location_index = DirectoryIndex()
+        self.steam_manifests = SteamManifestCache()
+        self.steam_appinfo = SteamAppInfo()
+        self._standalone_lock = threading.Lock()
+        self._standalone_folders = None
+
+    def load_excluded(self) -> Set[str]:
+        try:
+            if EXCLUDED_GAMES_FILE.exists():
+                with open(EXCLUDED_GAMES_FILE, 'r') as f:
+                    return set(json.load(f).get('excluded', []))
+        except Exception:
+            pass
+        return set()
+
+    def save_excluded(self):
+        try:
+            with open(EXCLUDED_GAMES_FILE, 'w') as f:
+                json.dump({'excluded': list(self.excluded)}, f, indent=2)
+        except Exception:
+            pass
+
+    def load_settings(self) -> dict:
+        try:
+            if SCAN_SETTINGS_FILE.exists():
+                with open(SCAN_SETTINGS_FILE, 'r') as f:
+                    return json.load(f)
+        except Exception:
+            pass
+        return {}
+
+    def set_drive_sweep(self, enabled: bool):
+        self.drive_sweep = enabled
+        try:
+            settings = self.load_settings()
+            settings['drive_sweep'] = enabled
+            with open(SCAN_SETTINGS_FILE, 'w') as f:
+                json.dump(settings, f, indent=2)
+        except Exception:
+            pass
+
+    def exclude(self, name: str):
+        self.excluded.add(name)
+        self.save_excluded()
+
+    def unexclude(self, name: str):
+        if name in self.excluded:
+            self.excluded.remove(name)
+            self.save_excluded()
+            return True
+        return False
+
+    def get_excluded_list(self) -> List[str]:
+        return sorted(list(self.excluded))
+
+    def is_excluded(self, name: str) -> bool:
+        # Check if in permanent exclusions (case-insensitive)
+        name_lower = name.lower()
+        for perm_exclusion in self.PERMANENT_EXCLUSIONS:
+            if name_lower == perm_exclusion.lower():
+                return True
+        # Check user exclusions
+        return name in self.excluded
+
+    def get_drives(self) -> List[str]:
+        return self.platform.get_drives()
+
+    def scan_steam(self) -> List[Game]:
+        return list(self.iter_steam())
+
+    def iter_steam(self):
+        try:
+            steam_path = self.platform.registry_value('HKCU', r"Software\Valve\Steam", "SteamPath")
+            if not steam_path:
+                return
+            try:
+                libraries = list(self._steam_libraries(Path(steam_path)))
+                # Launch executables Steam has configured for every installed app
+                app_ids = {m.stem.split('_', 1)[-1] for _, manifests in libraries for m in manifests}
+                launch = self.steam_appinfo.launch_map(
+                    Path(steam_path) / "appcache" / "appinfo.vdf", [a for a in app_ids if a.isdigit()])
+                for steamapps, manifests in libraries:
+                    for manifest in manifests:
+                        try:
+                            info = self.steam_manifests.get(manifest)
+                            if not info:
+                                continue
+                            name, installdir = info.get('name'), info.get('installdir')
+                            if name and installdir and not self.is_excluded(name):
+                                gpath = steamapps / "common" / installdir
+                                if gpath.exists():
+                                    app_id = manifest.stem.split('_', 1)[-1]
+                                    launch_exes = self._existing_exes(
+                                        str(gpath), launch.get(int(app_id), []) if app_id.isdigit() else [])
+                                    exe_found = launch_exes[0] if launch_exes else None
+                                    if not exe_found:
+                                        exe_found = self._find_steam_exe(gpath, name, installdir)
+                                    yield Game(name, str(gpath), "Steam", str(exe_found) if exe_found else "", launch_exes)
+                        except Exception:
+                            continue
+            finally:
+                self.steam_manifests.save()
+        except Exception:
+            pass
+
+    def _steam_libraries(self, steam_path: Path):
+        """
+        (steamapps dir, [appmanifest paths]) for every Steam library. libraryfolders.vdf
+        lists each library's installed app ids under "apps", which name the manifests
+        directly; old-format files (or libraries without an apps map) fall back to a glob.
+        """
+        library_file = steam_path / "steamapps" / "libraryfolders.vdf"
+        folders = {}
+        if library_file.exists():
+            with open(library_file, 'r', encoding='utf-8', errors='replace') as f:
+                folders = vdf_get(parse_vdf(f.read()), 'libraryfolders', {})
+        libraries = []
+        for index, entry in (folders.items() if isinstance(folders, dict) else []):
+            if not index.isdigit():
+                continue  # "contentstatsid" and friends
+            if isinstance(entry, dict):
+                path, apps = vdf_get(entry, 'path'), vdf_get(entry, 'apps')
+            else:
+                path, apps = entry, None  # pre-2021 format: "1" "D:\\SteamLibrary"
+            if isinstance(path, str) and path:
+                libraries.append((Path(path), apps if isinstance(apps, dict) else None))
+        libraries.append((steam_path, None))  # old format doesn't list Steam's own folder
+
+        seen = set()
+        for path, apps in libraries:
+            steamapps = path / "steamapps"
+            key = os.path.normcase(os.path.normpath(str(steamapps)))
+            if key in seen or not steamapps.exists():
+                continue
+            seen.add(key)
+            if apps is not None:
+                manifests = [steamapps / f"appmanifest_{app_id}.acf" for app_id in apps]
+            else:
+                manifests = list(steamapps.glob("appmanifest_*.acf"))
+            yield steamapps, manifests
+
+    @staticmethod
+    def _existing_exes(root: str, relative_paths) -> List[str]:
+        """Launcher-listed executables (relative to the install root) that exist, in order"""
+        exes = []
+        for relative in relative_paths:
+            if not isinstance(relative, str) or not relative.lower().endswith('.exe'):
+                continue
+            parts = [p for p in relative.replace('\\', '/').split('/') if p not in ('', '.')]
+            exe_path = os.path.normpath(os.path.join(root, *parts)) if parts else ''
+            if exe_path and exe_path not in exes and os.path.isfile(exe_path):
+                exes.append(exe_path)
+        return exes
+
+    def _find_steam_exe(self, gpath: Path, name: str, installdir: str):
+        """Heuristic guess at the game exe inside a Steam install folder (None if nothing fits).
+        Only used when appinfo.vdf has no usable launch entry for the app."""
+        exe_found = None
+        
+        # Special handling for Marvel Rivals on Steam
+        if "marvel rivals" in name.lower():
+            # NOTE: Game uses "Marvel" not "MarvelRivals" in exe names!
+            marvel_exes = [
+                gpath / "Marvel-Win64-Shipping.exe",
+                gpath / "Marvel" / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
+                gpath / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
+                gpath / "MarvelGame" / "Marvel" / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
+                # Also check for MarvelRivals variant
+                gpath / "MarvelRivals" / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
+                gpath / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
+                gpath / "MarvelRivals-Win64-Shipping.exe",
+            ]
+            for marvel_exe in marvel_exes:
+                if marvel_exe.exists():
+                    exe_found = marvel_exe
+                    break
+            
+            # If still not found, do a deep search for Marvel Rivals specifically
+            if not exe_found:
+                try:
+                    for root, dirs, files in os.walk(gpath):
+                        depth = root[len(str(gpath)):].count(os.sep)
+                        if depth > 5:
+                            dirs.clear()
+                            continue
+                        for file in files:
+                            file_lower = file.lower()
+                            # Look for Marvel-Win64-Shipping.exe OR MarvelRivals-Win64-Shipping.exe
+                            if (file_lower.endswith('-win64-shipping.exe') and 
+                                ('marvel-' in file_lower or 'marvelrivals-' in file_lower)):
+                                exe_found = Path(root) / file
+                                break
+                        if exe_found:
+                            break
+                except Exception:
+                    pass
+        
+        # Standard exe detection if not found yet (for non-Marvel games or as fallback)
+        if not exe_found:
+            # Relative candidates, probed as plain strings; most games hit the first one
+            common_exes = [
+                (f"{installdir}.exe",),
+                (f"{name}.exe",),
+                ("bin", f"{installdir}.exe"),
+                ("Binaries", "Win64", f"{installdir}.exe"),
+                ("Binaries", "Win64", f"{name}.exe"),
+                (f"{installdir}-Win64-Shipping.exe",),
+                ("Game", f"{installdir}.exe"),
+                ("Client", f"{installdir}.exe"),
+            ]
+            install_root = str(gpath)
+            for parts in common_exes:
+                exe_path = os.path.join(install_root, *parts)
+                if os.path.exists(exe_path):
+                    exe_found = Path(exe_path)
+                    break
+        if not exe_found:
+            try:
+                skip_patterns = ['unins', 'install', 'setup', 'crash', 'report', 'redist', 'dotnet', 'directx', 'vcredist', 'unity', 'unreal', 'launcher']
+                
+                # For Marvel Rivals specifically, ONLY accept shipping exe
+                if "marvel rivals" in name.lower():
+                    exes_root = [e for e in gpath.glob("*.exe") 
+                                if 'shipping' in e.stem.lower() and not any(skip in e.stem.lower() for skip in skip_patterns)]
+                else:
+                    exes_root = [e for e in gpath.glob("*.exe") 
+                                if not any(skip in e.stem.lower() for skip in skip_patterns)]
+                
+                if exes_root:
+                    game_exes = [e for e in exes_root if 'game' in e.stem.lower() or installdir.lower() in e.stem.lower()]
+                    exe_found = game_exes[0] if game_exes else exes_root[0]
+                else:
+                    for root, dirs, files in os.walk(gpath):
+                        depth = root[len(str(gpath)):].count(os.sep)
+                        if depth > 3:
+                            dirs.clear()
+                            continue
+                        
+                        # For Marvel Rivals, ONLY look for shipping exe
+                        if "marvel rivals" in name.lower():
+                            exe_files = [f for f in files if f.endswith('.exe') 
+                                        and 'shipping' in f.lower()
+                                        and ('marvel-' in f.lower() or 'marvelrivals-' in f.lower())
+                                        and not any(skip in f.lower() for skip in skip_patterns)]
+                        else:
+                            exe_files = [f for f in files if f.endswith('.exe') 
+                                        and not any(skip in f.lower() for skip in skip_patterns)]
+                        
+                        if exe_files:
+                            game_exes = [f for f in exe_files if 'game' in f.lower() or installdir.lower() in f.lower()]
+                            exe_found = Path(root) / (game_exes[0] if game_exes else exe_files[0])
+                            break
+            except Exception:
+                pass
+        return exe_found
+
+    def scan_epic(self) -> List[Game]:
+        return list(self.iter_epic())
+
+    def iter_epic(self):
+        manifests = Path(self.platform.program_data()) / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
+        if manifests.exists():
+            for manifest in manifests.glob("*.item"):
+                try:
+                    with open(manifest, 'r') as f:
+                        data = json.load(f)
+                        name = data.get('DisplayName')
+                        location = data.get('InstallLocation')
+                        if name and location and Path(location).exists() and not self.is_excluded(name):
+                            gpath = Path(location)
+                            # The manifest names the exe the launcher starts; the guesses below
+                            # are only for manifests without a usable LaunchExecutable
+                            launch_exes = self._existing_exes(location, [data.get('LaunchExecutable')])
+                            exe_found = Path(launch_exes[0]) if launch_exes else None
+                            
+                            # Special handling for Marvel Rivals on Epic
+                            if not exe_found and "marvel rivals" in name.lower():
+                                marvel_exes = [
                                     gpath / "MarvelRivals" / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
                                     gpath / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
                                     gpath / "MarvelRivals-Win64-Shipping.exe",
@@ -855,7 +1952,7 @@ class GameScanner:
                                         pass
                             
                             # Special handling for Fortnite
-                            elif "fortnite" in name.lower():
+                            elif not exe_found and "fortnite" in name.lower():
                                 fortnite_exes = [
                                     gpath / "FortniteGame" / "Binaries" / "Win64" / "FortniteClient-Win64-Shipping.exe",
                                     gpath / "Binaries" / "Win64" / "FortniteClient-Win64-Shipping.exe",
@@ -895,507 +1992,2015 @@ class GameScanner:
                                         exe_found = exe
                                         break
                             
-                            games.append(Game(name, location, "Epic Games", str(exe_found) if exe_found else ""))
+                            yield Game(name, location, "Epic Games", str(exe_found) if exe_found else "", launch_exes)
                 except Exception:
                     continue
-        return games
 
     def scan_gog(self) -> List[Game]:
-        games = []
-        try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\GOG.com\Games")
-            i = 0
-            while True:
-                try:
-                    subkey = winreg.OpenKey(key, winreg.EnumKey(key, i))
-                    name = winreg.QueryValueEx(subkey, "gameName")[0]
-                    path = winreg.QueryValueEx(subkey, "path")[0]
-                    exe = winreg.QueryValueEx(subkey, "exe")[0]
-                    winreg.CloseKey(subkey)
-                    if Path(path).exists() and not self.is_excluded(name):
-                        exe_path = str(Path(path) / exe)
-                        games.append(Game(name, path, "GOG", exe_path))
-                    i += 1
-                except OSError:
-                    break
-            winreg.CloseKey(key)
-        except Exception:
-            pass
-        return games
-
-    def scan_riot(self) -> List[Game]:
-        games = []
-        for drive in self.get_drives():
-            paths = [
-                Path(drive) / "Riot Games",
-                Path(drive) / "Program Files" / "Riot Games",
-                Path(drive) / "ProgramData" / "Riot Games"
-            ]
-            for riot_path in paths:
-                if riot_path.exists():
-                    for folder in riot_path.iterdir():
-                        if folder.is_dir() and folder.name.lower() not in ['riot client', 'metadata']:
-                            exes = list(folder.rglob("*.exe"))
-                            if exes and not self.is_excluded(folder.name):
-                                if not any(g.name == folder.name for g in games):
-                                    exe_found = None
-                                    
-                                    # Special handling for VALORANT - find the actual game exe
-                                    if folder.name.lower() == "valorant":
-                                        valorant_patterns = [
-                                            folder / "live" / "ShooterGame" / "Binaries" / "Win64" / "VALORANT-Win64-Shipping.exe",
-                                            folder / "live" / "VALORANT-Win64-Shipping.exe",
-                                            folder / "VALORANT-Win64-Shipping.exe",
-                                            folder / "VALORANT.exe",
-                                        ]
-                                        
-                                        for pattern in valorant_patterns:
-                                            if pattern.exists() and pattern.is_file():
-                                                exe_found = pattern
-                                                break
-                                        
-                                        # Deep search if not found
-                                        if not exe_found:
-                                            for root, dirs, files in os.walk(folder):
-                                                for file in files:
-                                                    file_lower = file.lower()
-                                                    if file_lower == "valorant-win64-shipping.exe" or file_lower == "valorant.exe":
-                                                        # Make sure it's not the launcher
-                                                        if "riotclient" not in file_lower:
-                                                            exe_found = Path(root) / file
-                                                            break
-                                                if exe_found:
-                                                    break
-                                    
-                                    # Standard detection for other Riot games
-                                    if not exe_found:
-                                        for exe in folder.glob("*.exe"):
-                                            if not any(skip in exe.stem.lower() for skip in ['unins', 'install', 'setup', 'riotclient']):
-                                                exe_found = exe
-                                                break
-                                    
-                                    games.append(Game(folder.name, str(folder), "Riot Games", str(exe_found) if exe_found else ""))
-        return games
+        return list(self.iter_gog())
 
-    def scan_battlenet(self) -> List[Game]:
-        games = []
-        blizz_games = [
-            {"name": "Overwatch", "folders": ["Overwatch", "Overwatch 2"], "exe": "Overwatch.exe"},
-            {"name": "World of Warcraft", "folders": ["World of Warcraft"], "exe": "Wow.exe"},
-            {"name": "Diablo III", "folders": ["Diablo III"], "exe": "Diablo III64.exe"},
-            {"name": "Diablo IV", "folders": ["Diablo IV"], "exe": "Diablo IV.exe"},
-            {"name": "Hearthstone", "folders": ["Hearthstone"], "exe": "Hearthstone.exe"},
-            {"name": "StarCraft II", "folders": ["StarCraft II"], "exe": "SC2_x64.exe"},
-            {"name": "Warcraft III", "folders": ["Warcraft III"], "exe": "Warcraft III.exe"},
-            {"name": "Heroes of the Storm", "folders": ["Heroes of the Storm"], "exe": "HeroesOfTheStorm_x64.exe"}
-        ]
-        for drive in self.get_drives():
-            drive_path = Path(drive)
+    def iter_gog(self):
+        gog_key = r"SOFTWARE\WOW6432Node\GOG.com\Games"
+        for subkey in self.platform.registry_subkeys('HKLM', gog_key):
             try:
-                for item in drive_path.iterdir():
-                    if not item.is_dir():
+                key = gog_key + '\\' + subkey
+                name = self.platform.registry_value('HKLM', key, "gameName")
+                path = self.platform.registry_value('HKLM', key, "path")
+                exe = self.platform.registry_value('HKLM', key, "exe")
+                if name and path and Path(path).exists() and not self.is_excluded(name):
+                    game_id = self.platform.registry_value('HKLM', key, "gameID") or subkey
+                    exe_paths = self._existing_exes(path, [exe] if exe else [])
+                    for task_exe in self._gog_play_tasks(path, str(game_id)):
+                        if task_exe not in exe_paths:
+                            exe_paths.append(task_exe)
+                    if exe:
+                        exe_path = str(Path(path) / exe)
+                    elif exe_paths:
+                        exe_path = exe_paths[0]
+                    else:
                         continue
-                    for game_info in blizz_games:
-                        for folder_variant in game_info["folders"]:
-                            if item.name.lower() == folder_variant.lower():
-                                exe_found = None
-                                direct_exe = item / game_info["exe"]
-                                if direct_exe.exists() and direct_exe.is_file():
-                                    exe_found = direct_exe
-                                else:
-                                    try:
-                                        for root, dirs, files in os.walk(item):
-                                            depth = root[len(str(item)):].count(os.sep)
-                                            if depth > 3:
-                                                dirs.clear()
-                                                continue
-                                            if game_info["exe"] in files:
-                                                exe_found = Path(root) / game_info["exe"]
-                                                break
-                                    except Exception:
-                                        pass
-                                if exe_found and not self.is_excluded(game_info["name"]):
-                                    if not any(g.name == game_info["name"] for g in games):
-                                        games.append(Game(game_info["name"], str(item), "Battle.net", str(exe_found)))
-                                        break
+                    yield Game(name, path, "GOG", exe_path, exe_paths)
             except Exception:
-                pass
-        return games
+                continue
 
-    def scan_xbox(self) -> List[Game]:
-        games = []
-        for drive in self.get_drives():
-            search_paths = [
-                Path(drive) / "xbox",
-                Path(drive) / "Xbox",
-                Path(drive) / "Games" / "xbox",
-                Path(drive) / "Games" / "Xbox"
-            ]
-            for xbox_folder in search_paths:
-                if not xbox_folder.exists():
+    def _gog_play_tasks(self, root: str, game_id: str) -> List[str]:
+        """
+        Executables from the goggame-*.info files in the install root: the game's primary
+        play task first, then its other game tasks, then secondary ones (launchers, tools,
+        DOSBox/ScummVM wrappers). A task path that isn't found relative to the install
+        root is tried relative to its working dir.
+        """
+        tasks = []
+        try:
+            with os.scandir(root) as it:
+                info_files = sorted(e.name for e in it
+                                    if e.name.lower().startswith('goggame-') and e.name.lower().endswith('.info'))
+        except OSError:
+            return []
+        for file_name in info_files:
+            try:
+                with open(os.path.join(root, file_name), 'r', encoding='utf-8-sig') as f:
+                    info = json.load(f)
+            except Exception:
+                continue
+            own = str(info.get('gameId', '')) == game_id
+            for order, task in enumerate(info.get('playTasks') or []):
+                if not isinstance(task, dict) or task.get('type', 'FileTask') != 'FileTask':
                     continue
-                for game_folder in xbox_folder.iterdir():
-                    if not game_folder.is_dir():
-                        continue
-                    game_name = game_folder.name
-                    content_folder = game_folder / "Content"
-                    if not content_folder.exists():
-                        content_folder = game_folder / "content"
-                    if content_folder.exists():
-                        exes = list(content_folder.glob("*.exe"))
-                        if exes and not self.is_excluded(game_name):
-                            if not any(g.name == game_name for g in games):
-                                games.append(Game(game_name, str(content_folder), "Xbox", str(exes[0])))
-        return games
+                rank = (0 if own else 1,
+                        0 if task.get('isPrimary') else 1 if task.get('category', 'game') == 'game' else 2,
+                        order)
+                tasks.append((rank, task.get('path'), task.get('workingDir') or ''))
+        exes = []
+        for _, path, working_dir in sorted(tasks, key=lambda t: t[0]):
+            found = self._existing_exes(root, [path])
+            if not found and working_dir and isinstance(path, str):
+                found = self._existing_exes(os.path.join(root, working_dir), [path])
+            for exe_path in found:
+                if exe_path not in exes:
+                    exes.append(exe_path)
+        return exes
 
-    def scan_marvel_rivals_universal(self) -> List[Game]:
-        """Scan all drives for Marvel Rivals standalone install (excluding Steam/Epic)."""
-        games = []
-        found_paths = set()
-        import string
+    def scan_riot(self) -> List[Game]:
+        return list(self.iter_riot())
 
-        drives = [f"{d}:\\" for d in string.ascii_uppercase if os.path.exists(f"{d}:\\")]
+    # Riot install folders are <root>/<Game>/<patchline> for some titles (VALORANT/live)
+    RIOT_PATCHLINES = {'live', 'pbe'}
 
-        for drive in drives:
+    def iter_riot(self):
+        seen = set()
+        folders = self._riot_installs()
+        if self.drive_sweep:
+            folders += self._riot_sweep()
+        for folder in folders:
             try:
-                for root, dirs, files in os.walk(drive):
-                    skip = ['windows', '$recycle.bin', 'system volume information', 'program files', 'program files (x86)']
-                    dirs[:] = [d for d in dirs if d.lower() not in skip]
-
-                    if root.count(os.sep) - drive.count(os.sep) > 6:
-                        dirs.clear()
-                        continue
+                key = os.path.normcase(os.path.normpath(str(folder)))
+                if key in seen or folder.name.lower() in ('riot client', 'metadata'):
+                    continue
+                seen.add(key)
+                if not folder.is_dir() or self.is_excluded(folder.name):
+                    continue
+                exe_found = self._find_riot_exe(folder)
+                if not exe_found:
+                    continue  # left-over or partial install, nothing to monitor
+                yield Game(folder.name, str(folder), "Riot Games", str(exe_found))
+            except Exception:
+                continue
+
+    def _riot_installs(self) -> List[Path]:
+        """
+        Game folders from the Riot Client's own records: the product_settings.yaml of each
+        installed product under ProgramData/Riot Games/Metadata, plus the installs listed
+        in RiotClientInstalls.json
+        """
+        riot_data = Path(self.platform.program_data()) / "Riot Games"
+        install_dirs = []
+        try:
+            for settings in sorted((riot_data / "Metadata").glob("*/*.product_settings.yaml")):
+                path = self._read_yaml_scalars(settings).get('product_install_full_path')
+                if path:
+                    install_dirs.append(path)
+        except Exception:
+            pass
+        try:
+            with open(riot_data / "RiotClientInstalls.json", 'r', encoding='utf-8') as f:
+                installs = json.load(f)
+            install_dirs.extend((installs.get('associated_client') or {}).keys())
+        except Exception:
+            pass
+
+        folders = []
+        for install_dir in install_dirs:
+            folder = Path(os.path.normpath(install_dir))
+            if folder.name.lower() in self.RIOT_PATCHLINES:
+                folder = folder.parent
+            folders.append(folder)
+        return folders
+
+    @staticmethod
+    def _read_yaml_scalars(path) -> dict:
+        """Top-level `key: value` pairs of a simple YAML file (all Riot's settings files need)"""
+        values = {}
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                if not line[:1].strip() or line.startswith('#') or ':' not in line:
+                    continue
+                key, value = line.split(':', 1)
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+                    value = value[1:-1]
+                values[key.strip()] = value
+        return values
+
+    def _riot_sweep(self) -> List[Path]:
+        """Opt-in fallback: Riot Games folders at the usual places on every drive"""
+        folders = []
+        for drive in self.get_drives():
+            for riot_path in (Path(drive) / "Riot Games",
+                              Path(drive) / "Program Files" / "Riot Games",
+                              Path(drive) / "ProgramData" / "Riot Games"):
+                try:
+                    if riot_path.exists():
+                        folders.extend(f for f in riot_path.iterdir() if f.is_dir())
+                except OSError:
+                    continue
+        return folders
+
+    def _find_riot_exe(self, folder: Path):
+        exe_found = None
+
+        # Special handling for VALORANT - find the actual game exe
+        if folder.name.lower() == "valorant":
+            valorant_patterns = [
+                folder / "live" / "ShooterGame" / "Binaries" / "Win64" / "VALORANT-Win64-Shipping.exe",
+                folder / "live" / "VALORANT-Win64-Shipping.exe",
+                folder / "VALORANT-Win64-Shipping.exe",
+                folder / "VALORANT.exe",
+            ]
+
+            for pattern in valorant_patterns:
+                if pattern.exists() and pattern.is_file():
+                    exe_found = pattern
+                    break
+
+            # Deep search if not found
+            if not exe_found:
+                for root, dirs, files in os.walk(folder):
+                    for file in files:
+                        file_lower = file.lower()
+                        if file_lower == "valorant-win64-shipping.exe" or file_lower == "valorant.exe":
+                            # Make sure it's not the launcher
+                            if "riotclient" not in file_lower:
+                                exe_found = Path(root) / file
+                                break
+                    if exe_found:
+                        break
+
+        # Standard detection for other Riot games
+        if not exe_found:
+            for exe in folder.glob("*.exe"):
+                if not any(skip in exe.stem.lower() for skip in ['unins', 'install', 'setup', 'riotclient']):
+                    exe_found = exe
+                    break
+        return exe_found
+
+    def scan_battlenet(self) -> List[Game]:
+        return list(self.iter_battlenet())
+
+    # Titles we know the game exe of, by product.db product code (not the uid, e.g. Hearthstone
+    # is uid "hs_beta", code "hsb") and usual folder names
+    BLIZZARD_GAMES = [
+        {"name": "Overwatch", "product": "pro", "folders": ["Overwatch", "Overwatch 2"], "exe": "Overwatch.exe"},
+        {"name": "World of Warcraft", "product": "wow", "folders": ["World of Warcraft"], "exe": "Wow.exe"},
+        {"name": "Diablo III", "product": "d3", "folders": ["Diablo III"], "exe": "Diablo III64.exe"},
+        {"name": "Diablo IV", "product": "fen", "folders": ["Diablo IV"], "exe": "Diablo IV.exe"},
+        {"name": "Hearthstone", "product": "hsb", "folders": ["Hearthstone"], "exe": "Hearthstone.exe"},
+        {"name": "StarCraft II", "product": "s2", "folders": ["StarCraft II"], "exe": "SC2_x64.exe"},
+        {"name": "Warcraft III", "product": "w3", "folders": ["Warcraft III"], "exe": "Warcraft III.exe"},
+        {"name": "Heroes of the Storm", "product": "hero", "folders": ["Heroes of the Storm"], "exe": "HeroesOfTheStorm_x64.exe"}
+    ]
+
+    def iter_battlenet(self):
+        seen = set()
+        candidates = self._battlenet_installs()
+        if self.drive_sweep:
+            candidates += self._battlenet_sweep()
+        for game_info, item in candidates:
+            try:
+                if game_info["name"] in seen or self.is_excluded(game_info["name"]) or not item.is_dir():
+                    continue
+                exe_found = self._find_battlenet_exe(item, game_info["exe"])
+                if exe_found:
+                    seen.add(game_info["name"])
+                    yield Game(game_info["name"], str(item), "Battle.net", str(exe_found))
+            except Exception:
+                continue
+
+    def _battlenet_installs(self) -> list:
+        """(game info, install folder) for each known title in the Battle.net agent's product.db"""
+        by_product = {g["product"]: g for g in self.BLIZZARD_GAMES}
+        installs = []
+        try:
+            with open(Path(self.platform.program_data()) / "Battle.net" / "Agent" / "product.db", 'rb') as f:
+                data = f.read()
+        except OSError:
+            return installs
+        try:
+            # Database { repeated ProductInstall product_install = 1 }
+            # ProductInstall { string uid = 1; string product_code = 2; UserSettings settings = 3 }
+            # UserSettings { string install_path = 1 }
+            for install in self._protobuf_fields(data).get(1, []):
+                fields = self._protobuf_fields(install)
+                code = fields.get(2, [b''])[0].decode('utf-8', 'replace').lower()
+                settings = self._protobuf_fields(fields.get(3, [b''])[0])
+                path = settings.get(1, [b''])[0].decode('utf-8', 'replace')
+                if code in by_product and path:
+                    installs.append((by_product[code], Path(os.path.normpath(path))))
+        except Exception as e:
+            print(f"Could not read Battle.net product.db: {e}")
+        return installs
+
+    @staticmethod
+    def _protobuf_fields(data: bytes) -> dict:
+        """{field number: [values]} of one protobuf message (length-delimited values as bytes)"""
+        fields = {}
+        pos, end = 0, len(data)
+
+        def varint():
+            nonlocal pos
+            result = shift = 0
+            while True:
+                byte = data[pos]
+                pos += 1
+                result |= (byte & 0x7F) << shift
+                if not byte & 0x80:
+                    return result
+                shift += 7
+
+        while pos < end:
+            tag = varint()
+            number, wire_type = tag >> 3, tag & 7
+            if wire_type == 0:
+                value = varint()
+            elif wire_type == 1:
+                value = data[pos:pos + 8]
+                pos += 8
+            elif wire_type == 2:
+                length = varint()
+                value = data[pos:pos + length]
+                pos += length
+            elif wire_type == 5:
+                value = data[pos:pos + 4]
+                pos += 4
+            else:
+                raise ValueError(f"unsupported protobuf wire type {wire_type}")
+            fields.setdefault(number, []).append(value)
+        return fields
+
+    def _battlenet_sweep(self) -> list:
+        """Opt-in fallback: known title folders at the root of every drive"""
+        by_folder = {f.lower(): g for g in self.BLIZZARD_GAMES for f in g["folders"]}
+        found = []
+        for drive in self.get_drives():
+            try:
+                for item in Path(drive).iterdir():
+                    game_info = by_folder.get(item.name.lower())
+                    if game_info:
+                        found.append((game_info, item))
+            except Exception:
+                pass
+        return found
+
+    @staticmethod
+    def _find_battlenet_exe(item: Path, exe: str):
+        direct_exe = item / exe
+        if direct_exe.exists() and direct_exe.is_file():
+            return direct_exe
+        try:
+            for root, dirs, files in os.walk(item):
+                depth = root[len(str(item)):].count(os.sep)
+                if depth > 3:
+                    dirs.clear()
+                    continue
+                if exe in files:
+                    return Path(root) / exe
+        except Exception:
+            pass
+        return None
+
+    def scan_xbox(self) -> List[Game]:
+        return list(self.iter_xbox())
+
+    def iter_xbox(self):
+        seen = set()
+        for drive in self.get_drives():
+            search_paths = [
+                Path(drive) / "xbox",
+                Path(drive) / "Xbox",
+                Path(drive) / "Games" / "xbox",
+                Path(drive) / "Games" / "Xbox"
+            ]
+            for xbox_folder in search_paths:
+                if not xbox_folder.exists():
+                    continue
+                for game_folder in xbox_folder.iterdir():
+                    if not game_folder.is_dir():
+                        continue
+                    game_name = game_folder.name
+                    content_folder = game_folder / "Content"
+                    if not content_folder.exists():
+                        content_folder = game_folder / "content"
+                    if content_folder.exists():
+                        exes = list(content_folder.glob("*.exe"))
+                        if exes and not self.is_excluded(game_name):
+                            if game_name not in seen:
+                                seen.add(game_name)
+                                yield Game(game_name, str(content_folder), "Xbox", str(exes[0]))
+
+    def find_standalone_folders(self, name: str) -> List[str]:
+        """Paths of folders called `name` on any drive. The first call in a scan runs one
+        shared traversal for every name in STANDALONE_FOLDERS; later calls reuse it."""
+        with self._standalone_lock:
+            if self._standalone_folders is None:
+                try:
+                    self._standalone_folders = self.location_index.find_folders(
+                        self.STANDALONE_FOLDERS | {name.lower()}, self.get_drives())
+                except Exception:
+                    self._standalone_folders = {}
+            return self._standalone_folders.get(name.lower(), [])
+
+    def scan_marvel_rivals_universal(self) -> List[Game]:
+        return list(self.iter_marvel_rivals_universal())
+
+    def iter_marvel_rivals_universal(self):
+        """Find Marvel Rivals standalone installs (excluding Steam/Epic) via the location index."""
+
+        for root in self.find_standalone_folders("marvel rivals"):
+            try:
+                root_lower = root.lower()
+                if "steamapps" in root_lower or "epic" in root_lower:
+                    continue  # skip Steam / Epic
+
+                game_path = Path(root)
+                exe_found = None
+
+                # Look specifically for the shipping exe
+                # NOTE: Game uses "Marvel" not "MarvelRivals" in exe names!
+                for r, d2, f2 in os.walk(game_path):
+                    for file in f2:
+                        file_lower = file.lower()
+                        # Look for Marvel-Win64-Shipping.exe OR MarvelRivals-Win64-Shipping.exe
+                        if (file_lower.endswith('-win64-shipping.exe') and 
+                            ('marvel-' in file_lower or 'marvelrivals-' in file_lower)):
+                            exe_found = Path(r) / file
+                            break
+                    if exe_found:
+                        break
+
+                # Fallback - ONLY accept shipping exe, NOT launcher
+                if not exe_found:
+                    for r, d2, f2 in os.walk(game_path):
+                        for file in f2:
+                            file_lower = file.lower()
+                            # MUST have "shipping" in the name to be accepted
+                            if (file_lower.endswith(".exe") and 
+                                "shipping" in file_lower and 
+                                ("marvel" in file_lower or "marvelrivals" in file_lower)):
+                                exe_found = Path(r) / file
+                                break
+                        if exe_found:
+                            break
+
+                platform = "NetEase" if "netease" in root_lower else "Other"
+
+                # Save real EXE path
+                yield Game("Marvel Rivals", str(game_path), platform, str(exe_found) if exe_found else "")
+
+            except Exception:
+                continue
+
+
+    def scanners(self) -> list:
+        """(name, game generator) pairs, in the order their games are listed"""
+        return [
+            ("Steam", self.iter_steam),
+            ("Epic Games", self.iter_epic),
+            ("GOG", self.iter_gog),
+            ("Riot Games", self.iter_riot),
+            ("Battle.net", self.iter_battlenet),
+            ("Xbox", self.iter_xbox),
+            ("Marvel Rivals", self.iter_marvel_rivals_universal),
+        ]
+
+    def _run_scanner(self, name: str, iter_fn, on_game=None) -> ScanResult:
+        start = time.perf_counter()
+        games, error = [], None
+        try:
+            for game in iter_fn():
+                games.append(game)
+                if on_game:
+                    on_game(game)
+        except Exception as e:
+            error = str(e) or e.__class__.__name__
+        return ScanResult(name, games, error, time.perf_counter() - start)
+
+    def iter_scan_results(self, on_game=None):
+        """Run every launcher scanner in a bounded thread pool, yielding each ScanResult as it finishes.
+        on_game(Game) is called from the worker threads the moment each game is found."""
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        scanners = self.scanners()
+        workers = max(1, min(self.SCAN_WORKERS, len(scanners)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            futures = [pool.submit(self._run_scanner, name, fn, on_game) for name, fn in scanners]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def iter_games(self):
+        """Yield each Game as soon as any scanner discovers it (scanners run concurrently)"""
+        found = queue.Queue()
+        done = object()
+
+        def run():
+            try:
+                self.scan_all(on_game=found.put)
+            finally:
+                found.put(done)
+
+        threading.Thread(target=run, daemon=True).start()
+        while True:
+            game = found.get()
+            if game is done:
+                return
+            yield game
+
+    def scan_all(self, on_result=None, on_game=None) -> List[Game]:
+        """Scan every launcher concurrently. on_game(Game) is called for each game as it's found
+        and on_result(ScanResult) as each scanner finishes."""
+        start = time.perf_counter()
+        self._standalone_folders = None  # fresh drive lookup each scan
+        order = [name for name, _ in self.scanners()]
+        results = {}
+        for result in self.iter_scan_results(on_game):
+            results[result.scanner] = result
+            if result.error:
+                print(f"  ✗ {result.scanner} scan failed after {result.duration:.2f}s: {result.error}")
+            else:
+                print(f"  ✓ {result.scanner}: {len(result.games)} games in {result.duration:.2f}s")
+            if on_result:
+                try:
+                    on_result(result)
+                except Exception:
+                    pass
+
+        # Keep the usual launcher order in the final list, whatever order scanners finished in
+        self.last_scan_results = [results[name] for name in order if name in results]
+        all_games = []
+        for result in self.last_scan_results:
+            all_games.extend(result.games)
+        print(f"Scan finished: {len(all_games)} games in {time.perf_counter() - start:.2f}s")
+        return all_games
+
+# ---------- Executable Matching ----------
+# Games whose launcher-reported exe isn't the process that actually runs.
+# Each pattern matches an .exe inside the install root:
+#   glob     fnmatch pattern for the (lower-case) file name
+#   require  tokens that must all appear in the file name
+#   any_of   at least one of these tokens must appear in the file name
+#   forbid   tokens that must not appear in the file name
+#   in_dirs  tokens that must all appear in the (lower-case) directory path
+#   depth    deepest directory level below the install root to look in
+# exclusive: only the matched exes identify the game (skip exe_path and its siblings)
+# allow_launcher: sibling exes named *launcher* still count for this game
+EXE_RULES = [
+    {
+        'game': ('marvel rivals',),
+        'exclusive': True,
+        'patterns': [
+            # The game uses "Marvel" not "MarvelRivals" in exe names (some builds use both)
+            {'glob': 'marvel.exe', 'depth': 0},
+            {'glob': 'marvelrivals.exe', 'depth': 0},
+            {'glob': '*.exe', 'require': ('shipping',), 'any_of': ('marvel-', 'marvelrivals-'),
+             'forbid': ('launcher',), 'depth': 6},
+        ],
+    },
+    {
+        'game': ('valorant',),
+        'exclusive': True,
+        'patterns': [
+            # VALORANT-Win64-Shipping.exe, never RiotClientServices.exe
+            {'glob': 'valorant.exe', 'depth': 6},
+            {'glob': '*.exe', 'require': ('valorant', 'shipping'), 'forbid': ('riotclient',), 'depth': 6},
+        ],
+    },
+    {
+        'game': ('fortnite',),
+        'allow_launcher': True,
+        'patterns': [
+            {'glob': '*.exe', 'any_of': ('fortniteclient', 'shipping'), 'depth': 5},
+            {'glob': '*.exe', 'in_dirs': ('fortnitegame', 'binaries'), 'depth': 5},
+        ],
+    },
+]
+
+
+class ExeRule:
+    """One compiled EXE_RULES entry"""
+
+    def __init__(self, spec: dict):
+        import fnmatch
+        import re
+        self.game_tokens = tuple(t.lower() for t in spec['game'])
+        self.exclusive = spec.get('exclusive', False)
+        self.allow_launcher = spec.get('allow_launcher', False)
+        self.patterns = []  # (compiled glob, require, any_of, forbid, in_dirs, depth)
+        for pat in spec['patterns']:
+            self.patterns.append((
+                re.compile(fnmatch.translate(pat.get('glob', '*.exe').lower())),
+                tuple(pat.get('require', ())),
+                tuple(pat.get('any_of', ())),
+                tuple(pat.get('forbid', ())),
+                tuple(pat.get('in_dirs', ())),
+                pat.get('depth', 6),
+            ))
+        self.max_depth = max(p[5] for p in self.patterns)
+
+    def applies_to(self, game_name: str) -> bool:
+        name = game_name.lower()
+        return any(token in name for token in self.game_tokens)
+
+    def matches(self, file_lower: str, dir_lower: str, depth: int) -> bool:
+        for glob, require, any_of, forbid, in_dirs, max_depth in self.patterns:
+            if (depth <= max_depth and glob.match(file_lower)
+                    and all(t in file_lower for t in require)
+                    and (not any_of or any(t in file_lower for t in any_of))
+                    and not any(t in file_lower for t in forbid)
+                    and all(t in dir_lower for t in in_dirs)):
+                return True
+        return False
+
+
+class ExeMatcher:
+    """EXE_RULES compiled once; finds every rule's exes with one bounded walk per install root"""
+
+    def __init__(self, rules: List[dict]):
+        self.rules = [ExeRule(spec) for spec in rules]
+
+    def rule_for(self, game_name: str) -> Optional[ExeRule]:
+        for rule in self.rules:
+            if rule.applies_to(game_name):
+                return rule
+        return None
+
+    def scan(self, root: str, entries: list):
+        """
+        Walk root once (to the deepest depth any entry needs) and yield (exe path, game)
+        for every file matched by one of the (game, rule) entries.
+        """
+        max_depth = max(rule.max_depth for _, rule in entries)
+        stack = [(root, 0)]
+        while stack:
+            path, depth = stack.pop()
+            dir_lower = path.lower()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if depth < max_depth:
+                                    stack.append((entry.path, depth + 1))
+                                continue
+                        except OSError:
+                            continue
+                        file_lower = entry.name.lower()
+                        if not file_lower.endswith('.exe'):
+                            continue
+                        for game, rule in entries:
+                            if rule.matches(file_lower, dir_lower, depth):
+                                yield os.path.normpath(entry.path), game
+            except OSError:
+                pass
+
+
+EXE_MATCHER = ExeMatcher(EXE_RULES)
+
+
+# ---------- Process Event Sources ----------
+class ProcessEvent:
+    """A process start/exit notification consumed by GameMonitor"""
+    START = "start"
+    EXIT = "exit"
+    REMATCH = "rematch"  # exe map changed, re-check running processes
+    WAKE = "wake"        # no-op, just unblocks the consumer
+
+    __slots__ = ("kind", "pid", "exe", "time")
+
+    def __init__(self, kind: str, pid: int = 0, exe: str = ""):
+        self.kind = kind
+        self.pid = pid
+        self.exe = exe
+        self.time = time.time()
+
+
+class ProcessEventSource:
+    """Base class for process start/exit feeds. Backends push ProcessEvents onto self.events."""
+    name = "base"
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.active = False
+        self.failed = False  # set by a backend that died after starting
+
+    def start(self) -> bool:
+        """Begin producing events. Returns False if the backend can't run on this machine."""
+        self.active = True
+        return True
+
+    def stop(self):
+        self.active = False
+        self.wake()
+
+    def wake(self):
+        self.events.put(ProcessEvent(ProcessEvent.WAKE))
+
+    def pin(self, pid: int):
+        """Hint that the monitor is tracking this PID"""
+        pass
+
+    def unpin(self, pid: int):
+        pass
+
+    def emit_start(self, pid: int, exe: str):
+        self.events.put(ProcessEvent(ProcessEvent.START, pid, exe))
+
+    def emit_exit(self, pid: int):
+        self.events.put(ProcessEvent(ProcessEvent.EXIT, pid))
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ProcessEvent]:
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def emit_running(self):
+        """Report every process that is already running (games launched before the monitor)"""
+        try:
+            import psutil
+        except Exception:
+            return
+        for proc in psutil.process_iter(['pid', 'exe']):
+            try:
+                if proc.info.get('exe'):
+                    self.emit_start(proc.info['pid'], proc.info['exe'])
+            except Exception:
+                pass
+
+
+class PollingProcessSource(ProcessEventSource):
+    """Fallback backend: diff the psutil process table every few seconds.
+
+    Keeps a pid -> (create_time, normalised exe) snapshot, so a poll only resolves the
+    exes of PIDs that are new (or reused) since the last one and vanished PIDs fall out
+    as a set difference.
+    """
+    name = "polling"
+    SWEEP_SECONDS = 60  # every untracked PID is re-checked for reuse once per this period
+
+    def __init__(self, interval: float = 3.5, psutil_module=None):
+        super().__init__()
+        self.interval = interval
+        self.snapshot = {}
+        self.pinned = set()  # PIDs the monitor tracks; re-checked for PID reuse every poll
+        self._sweep = []  # PIDs left to re-check in the current reuse sweep
+        self._psutil = psutil_module
+        self._stop_event = threading.Event()
+
+    def start(self) -> bool:
+        if self._psutil is None:
+            try:
+                import psutil
+                self._psutil = psutil
+            except Exception:
+                return False
+        self.active = True
+        self._stop_event.clear()
+        threading.Thread(target=self._poll_loop, daemon=True).start()
+        return True
+
+    def stop(self):
+        self._stop_event.set()
+        super().stop()
+
+    def pin(self, pid: int):
+        self.pinned.add(pid)
+
+    def unpin(self, pid: int):
+        self.pinned.discard(pid)
+
+    def _poll_loop(self):
+        while self.active:
+            try:
+                self.poll_once()
+            except Exception:
+                pass
+            self._stop_event.wait(self.interval)
+
+    def poll_once(self) -> int:
+        """Diff the process table against the snapshot. Returns the number of PIDs resolved."""
+        started = time.perf_counter()
+        current = set(self._psutil.pids())
+        snapshot = self.snapshot
+
+        for pid in snapshot.keys() - current:
+            del snapshot[pid]
+            self.emit_exit(pid)
+
+        # A PID that exited and got reused between two polls has a new create_time. Tracked
+        # PIDs are checked every poll; the rest by a round-robin sweep that gets through the
+        # whole table every SWEEP_SECONDS, so a poll stays proportional to the churn.
+        for pid in (self.pinned | self._sweep_slice()) & current:
+            entry = snapshot.get(pid)
+            if entry and self._create_time(pid) != entry[0]:
+                del snapshot[pid]
+                self.emit_exit(pid)
+
+        new_pids = current - snapshot.keys()
+        for pid in new_pids:
+            entry = self._resolve(pid)
+            if entry is None:
+                continue
+            # Inaccessible processes are kept with an empty exe so they aren't retried every poll
+            snapshot[pid] = entry
+            if entry[1]:
+                self.emit_start(pid, entry[1])
+        METRICS.observe('monitor.tick', time.perf_counter() - started)
+        METRICS.gauge('monitor.processes', len(current))
+        METRICS.gauge('monitor.pids_resolved', len(new_pids))
+        return len(new_pids)
+
+    def _sweep_slice(self) -> Set[int]:
+        """The next batch of snapshot PIDs for the reuse sweep"""
+        if not self._sweep:
+            self._sweep = list(self.snapshot)
+        polls = max(1, int(self.SWEEP_SECONDS / max(self.interval, 0.1)))
+        count = -(-len(self.snapshot) // polls)
+        if not count:
+            return set()
+        batch = set(self._sweep[-count:])
+        del self._sweep[-count:]
+        return batch
+
+    def _create_time(self, pid: int):
+        try:
+            return self._psutil.Process(pid).create_time()
+        except Exception:
+            return None
+
+    def _resolve(self, pid: int):
+        try:
+            proc = self._psutil.Process(pid)
+            create_time = proc.create_time()
+        except Exception:
+            return None  # already gone
+        try:
+            exe = proc.exe()
+            norm_exe = os.path.normpath(exe).lower() if exe else ""
+        except Exception:
+            norm_exe = ""
+        return (create_time, norm_exe)
+
+
+class WmiProcessEventSource(ProcessEventSource):
+    """
+    Win32_Process creation/deletion events delivered by WMI (needs pywin32). Unlike the
+    Win32_ProcessTrace classes these work without admin rights; WMI checks for changes
+    every WITHIN seconds.
+    """
+    name = "wmi"
+    WITHIN = 1
+    QUERIES = (
+        f"SELECT * FROM __InstanceCreationEvent WITHIN {WITHIN} WHERE TargetInstance ISA 'Win32_Process'",
+        f"SELECT * FROM __InstanceDeletionEvent WITHIN {WITHIN} WHERE TargetInstance ISA 'Win32_Process'",
+    )
+    WBEM_E_TIMED_OUT = -2147209215  # 0x80043001, NextEvent() timed out
+    MAX_ERRORS = 10
+
+    def __init__(self, startup_timeout: float = 3.0):
+        super().__init__()
+        self.startup_timeout = startup_timeout
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._ok = False
+        self.error = None  # why the source couldn't start, for the fallback log line
+
+    def start(self) -> bool:
+        self.active = True
+        threading.Thread(target=self._watch_loop, daemon=True).start()
+        self._ready.wait(self.startup_timeout)
+        with self._lock:
+            if not self._ok:
+                self.error = self.error or f"no answer within {self.startup_timeout:g}s"
+                # Gave up waiting: the watcher thread sees active=False and exits without
+                # emitting anything, so it can't run alongside the polling fallback
+                self.active = False
+        return self._ok
+
+    def _watch_loop(self):
+        try:
+            import pythoncom
+            import win32com.client
+            import psutil
+        except Exception as e:
+            self.error = f"pywin32/psutil missing ({e})"
+            self._ready.set()
+            return
+        try:
+            pythoncom.CoInitialize()
+            try:
+                wmi = win32com.client.GetObject("winmgmts:")
+                watchers = [wmi.ExecNotificationQuery(query) for query in self.QUERIES]
+            except Exception as e:
+                self.error = f"WMI subscription failed ({e})"
+                self._ready.set()
+                return
+            with self._lock:
+                if not self.active:
+                    return  # start() already timed out and fell back
+                self._ok = True
+            self._ready.set()
+            self._watch(watchers, psutil)
+        finally:
+            try:
+                pythoncom.CoUninitialize()
+            except Exception:
+                pass
+
+    def _watch(self, watchers, psutil):
+        """Translate instance events into ProcessEvents until stopped or WMI keeps failing"""
+        # Subscribe first, then report what's already running, so nothing slips between the two
+        self.emit_running()
+
+        created, deleted = watchers
+        errors = 0
+        while self.active:
+            for watcher in (created, deleted):
+                try:
+                    event = watcher.NextEvent(250)
+                    errors = 0
+                except Exception as e:
+                    excepinfo = getattr(e, 'excepinfo', None) or ()
+                    if len(excepinfo) > 5 and excepinfo[5] == self.WBEM_E_TIMED_OUT:
+                        continue
+                    errors += 1
+                    if errors >= self.MAX_ERRORS:
+                        self.failed = True
+                        self.wake()
+                        return
+                    time.sleep(0.5)
+                    continue
+
+                try:
+                    process = event.TargetInstance
+                    pid = int(process.ProcessId)
+                    if watcher is deleted:
+                        self.emit_exit(pid)
+                    else:
+                        # ExecutablePath is empty for other users' processes without admin rights
+                        exe = process.ExecutablePath or psutil.Process(pid).exe()
+                        if exe:
+                            self.emit_start(pid, exe)
+                except Exception:
+                    # Process already gone or access denied
+                    pass
+
+
+class FakeProcessEventSource(ProcessEventSource):
+    """Scripted event feed for exercising GameMonitor without real processes"""
+    name = "fake"
+
+    def __init__(self, running: Optional[dict] = None):
+        super().__init__()
+        self.running = dict(running or {})
+
+    def start(self) -> bool:
+        self.active = True
+        for pid, exe in self.running.items():
+            self.emit_start(pid, exe)
+        return True
+
+    def launch(self, pid: int, exe: str):
+        self.running[pid] = exe
+        self.emit_start(pid, exe)
+
+    def close(self, pid: int):
+        self.running.pop(pid, None)
+        self.emit_exit(pid)
+
+
+# Tried in order until one starts
+PROCESS_EVENT_BACKENDS = (WmiProcessEventSource, PollingProcessSource)
+
+# Game Monitor
+class GameMonitor:
+    CLOSE_GRACE_SECONDS = 5
+    IDLE_WAIT_SECONDS = 30.0
+
+    def __init__(self, games: List[Game], twitch: TwitchBot, status_callback,
+                 event_source: Optional[ProcessEventSource] = None):
+        self.games = games
+        self.twitch = twitch
+        self.twitch_client = AsyncTwitchClient(twitch)
+        self.status_callback = status_callback
+        self.event_source = event_source
+        self.active = False
+        self.tracked_pids = {}  # pid -> game; written by the monitor thread, read elsewhere via tracked_games()
+        self.tracked_lock = threading.Lock()
+        self.running = {}  # pid -> exe of every live process we've been told about
+        self.exe_map = {}
+        self.id_map = {}  # (st_dev, st_ino) of each exe_map file -> game, survives junctions/symlinks/casing
+        self.pid_file_ids = {}  # pid -> file identity of its exe (None if it couldn't be stat'ed)
+        self.close_timers = {}
+
+    # Sibling exes that are never the game itself
+    SIBLING_SKIP = ('unins', 'install', 'setup', 'crash', 'report')
+
+    def build_exe_map(self):
+        """
+        Map every known game executable to its game. Per-game results are kept in
+        EXE_MAP_FILE with the mtimes of the directories they came from, so only games
+        whose install folders changed (or that are new) are indexed again.
+        """
+        index = self._load_exe_index()
+        fresh = {}
+        stale_roots = {}  # install root -> [(game, rule)]; one walk serves every rule game there
+        for game in self.games:
+            key = self._exe_index_key(game)
+            cached = index.get(key)
+            if cached and self._stamps_current(cached['stamps']):
+                fresh[key] = cached
+                continue
+            rule = EXE_MATCHER.rule_for(game.name)
+            if rule and rule.exclusive:
+                entry = {'primary': [], 'siblings': [], 'matched': [], 'ids': {}}
+            else:
+                entry = self._standard_exes(game, rule)
+                self._listed_exes(game, entry)
+            fresh[key] = entry
+            if rule and game.path:
+                stale_roots.setdefault(os.path.normpath(game.path), []).append((game, rule))
+
+        for root, entries in stale_roots.items():
+            matched_dirs = {}
+            for exe_path, game in EXE_MATCHER.scan(root, entries):
+                self._add_exe(fresh[self._exe_index_key(game)], 'matched', exe_path)
+                matched_dirs.setdefault(game.name, set()).add(os.path.dirname(exe_path))
+            for game, _ in entries:
+                entry = fresh[self._exe_index_key(game)]
+                entry['stamps'] = self._stamp_dirs(game, matched_dirs.get(game.name, ()))
+        for game in self.games:
+            entry = fresh[self._exe_index_key(game)]
+            if 'stamps' not in entry:
+                entry['stamps'] = self._stamp_dirs(game, ())
+
+        self.exe_map.clear()
+        for game in self.games:
+            entry = fresh[self._exe_index_key(game)]
+            for exe_norm in entry['primary']:
+                self.exe_map[exe_norm] = game.name
+            for exe_norm in entry['siblings']:
+                self.exe_map.setdefault(exe_norm, game.name)
+        for game in self.games:
+            for exe_norm in fresh[self._exe_index_key(game)]['matched']:
+                self.exe_map[exe_norm] = game.name
+
+        if fresh != index:
+            self._save_exe_index(fresh)
+
+        # Same winners as exe_map, keyed by file identity
+        file_ids = {}
+        for entry in fresh.values():
+            file_ids.update(entry['ids'])
+        self.id_map.clear()
+        for exe_norm, game_name in self.exe_map.items():
+            file_id = file_ids.get(exe_norm)
+            if file_id:
+                self.id_map.setdefault(tuple(file_id), game_name)
+
+        # Games added while monitoring may already be running
+        if self.active and self.event_source:
+            self.event_source.events.put(ProcessEvent(ProcessEvent.REMATCH))
+
+    def _standard_exes(self, game: Game, rule: Optional[ExeRule]) -> dict:
+        """The launcher-reported exe plus other executables next to it"""
+        entry = {'primary': [], 'siblings': [], 'matched': [], 'ids': {}}
+        if not (game.exe_path and os.path.exists(game.exe_path)):
+            return entry
+        primary = self._add_exe(entry, 'primary', os.path.normpath(game.exe_path))
+
+        # Also add the parent directory's other executables for games with multiple EXEs
+        skip_patterns = self.SIBLING_SKIP if rule and rule.allow_launcher else self.SIBLING_SKIP + ('launcher',)
+        for exe_path in self._list_exes(os.path.dirname(game.exe_path)):
+            exe_name = os.path.splitext(os.path.basename(exe_path))[0].lower()
+            if exe_path.lower() != primary and not any(skip in exe_name for skip in skip_patterns):
+                self._add_exe(entry, 'siblings', exe_path)
+
+        if game.platform == "Xbox":
+            for exe_path in self._list_exes(game.path):
+                self._add_exe(entry, 'siblings', exe_path)
+        return entry
+
+    def _listed_exes(self, game: Game, entry: dict):
+        """Executables from launcher metadata (Epic LaunchExecutable, GOG playTasks) are primary"""
+        for exe_path in game.exe_paths:
+            exe_norm = os.path.normpath(exe_path).lower()
+            if exe_norm not in entry['primary'] and os.path.isfile(exe_path):
+                self._add_exe(entry, 'primary', os.path.normpath(exe_path))
+
+    def _add_exe(self, entry: dict, kind: str, exe_path: str) -> str:
+        """Record an exe under entry[kind] by normalized path, plus its file identity"""
+        exe_norm = exe_path.lower()
+        entry[kind].append(exe_norm)
+        file_id = self._file_id(exe_path)
+        if file_id:
+            entry['ids'][exe_norm] = file_id
+        return exe_norm
+
+    @staticmethod
+    def _list_exes(directory: str) -> List[str]:
+        try:
+            with os.scandir(directory) as it:
+                return [os.path.normpath(e.path) for e in it
+                        if e.name.lower().endswith('.exe') and e.is_file()]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _file_id(path: str):
+        """(volume, file index) on Windows / (device, inode) elsewhere, following links"""
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        return (st.st_dev, st.st_ino) if st.st_ino else None
+
+    def _match_process(self, pid: int, exe: str) -> Optional[str]:
+        if pid not in self.pid_file_ids:
+            self.pid_file_ids[pid] = self._file_id(exe) if exe else None
+        file_id = self.pid_file_ids[pid]
+        if file_id:
+            game_name = self.id_map.get(file_id)
+            if game_name:
+                return game_name
+        # Path string fallback (file couldn't be stat'ed or has no stable id)
+        try:
+            return self.exe_map.get(os.path.normpath(exe).lower())
+        except Exception:
+            return None
+
+    # ---------- persisted exe index ----------
+    EXE_INDEX_VERSION = 2
+
+    @staticmethod
+    def _exe_index_key(game: Game) -> str:
+        key = f"{game.name}|{game.path}|{game.exe_path}|{game.platform}"
+        return key + '|' + ';'.join(game.exe_paths) if game.exe_paths else key
+
+    @staticmethod
+    def _dir_mtime(path: str):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _stamp_dirs(self, game: Game, matched_dirs) -> list:
+        """Directories whose contents the entry was built from, with their current mtimes"""
+        dirs = set(matched_dirs)
+        if game.exe_path:
+            dirs.add(os.path.dirname(game.exe_path))
+        for exe_path in game.exe_paths:
+            dirs.add(os.path.dirname(exe_path))
+        if game.path:
+            dirs.add(game.path)
+        return [[d, self._dir_mtime(d)] for d in sorted(dirs)]
+
+    def _stamps_current(self, stamps: list) -> bool:
+        return all(self._dir_mtime(d) == mtime for d, mtime in stamps)
+
+    def _rules_signature(self) -> str:
+        return hashlib.sha1(json.dumps(EXE_RULES, sort_keys=True).encode()).hexdigest()
+
+    def _load_exe_index(self) -> dict:
+        try:
+            with open(EXE_MAP_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == self.EXE_INDEX_VERSION and data.get('rules') == self._rules_signature():
+                return data.get('games', {})
+        except Exception:
+            pass
+        return {}
+
+    def _save_exe_index(self, games: dict):
+        try:
+            tmp = EXE_MAP_FILE.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.EXE_INDEX_VERSION, 'rules': self._rules_signature(),
+                           'games': games}, f)
+            os.replace(tmp, EXE_MAP_FILE)
+        except Exception:
+            pass
+
+    def start(self):
+        self.active = True
+        self.build_exe_map()
+        self.twitch_client.start()
+        threading.Thread(target=self._monitor_loop, daemon=True).start()
+        # Have a keep-alive connection to the Twitch API ready before the first game launches
+        if self.twitch.config.get('enabled'):
+            threading.Thread(target=get_http().prewarm, args=(TwitchBot.API_URL,), daemon=True).start()
+
+    def stop(self):
+        self.active = False
+        if self.event_source:
+            self.event_source.stop()
+        self.twitch_client.stop()
+        with self.tracked_lock:
+            self.tracked_pids.clear()
+        self.running.clear()
+        self.pid_file_ids.clear()
+        self.close_timers.clear()
+
+    def _start_event_source(self) -> bool:
+        """Start the injected source, or the first backend from PROCESS_EVENT_BACKENDS that works"""
+        if self.event_source is not None:
+            candidates = [self.event_source]
+        else:
+            candidates = [backend() for backend in PROCESS_EVENT_BACKENDS]
+        for source in candidates:
+            try:
+                if source.start():
+                    self.event_source = source
+                    print(f"Process events: {source.name}")
+                    METRICS.event('monitor.backend', backend=source.name)
+                    return True
+                reason = getattr(source, 'error', None) or "failed to start"
+            except Exception as e:
+                reason = str(e)
+            print(f"Process events: {source.name} unavailable ({reason}), trying the next backend")
+            METRICS.event('monitor.backend_unavailable', backend=source.name, reason=reason)
+        return False
+
+    def _fall_back_to_polling(self):
+        print(f"Process events: {self.event_source.name} stopped working, falling back to polling") # type: ignore
+        METRICS.event('monitor.backend_unavailable', backend=self.event_source.name, reason="failed while running") # type: ignore
+        try:
+            self.event_source.stop() # type: ignore
+        except Exception:
+            pass
+        self.running.clear()
+        with self.tracked_lock:
+            self.tracked_pids.clear()
+        self.pid_file_ids.clear()
+        self.event_source = PollingProcessSource()
+        if not self.event_source.start():
+            self.active = False
+
+    def _monitor_loop(self):
+        if not self._start_event_source():
+            self.active = False
+            return
 
-                    # Look for folder name Marvel Rivals
-                    if os.path.basename(root).lower() == "marvel rivals":
-                        root_lower = root.lower()
-                        if "steamapps" in root_lower or "epic" in root_lower:
-                            continue  # skip Steam / Epic
-
-                        game_path = Path(root)
-                        exe_found = None
-
-                        # Look specifically for the shipping exe
-                        # NOTE: Game uses "Marvel" not "MarvelRivals" in exe names!
-                        for r, d2, f2 in os.walk(game_path):
-                            for file in f2:
-                                file_lower = file.lower()
-                                # Look for Marvel-Win64-Shipping.exe OR MarvelRivals-Win64-Shipping.exe
-                                if (file_lower.endswith('-win64-shipping.exe') and 
-                                    ('marvel-' in file_lower or 'marvelrivals-' in file_lower)):
-                                    exe_found = Path(r) / file
-                                    break
-                            if exe_found:
-                                break
+        while self.active:
+            try:
+                event = self.event_source.get(self._next_wait()) # type: ignore
+                if not self.active:
+                    break
+                if event:
+                    with METRICS.timer('monitor.event'):
+                        self._handle_event(event)
+                    METRICS.incr('monitor.events')
+                if self.event_source.failed: # type: ignore
+                    self._fall_back_to_polling()
+                self._expire_close_timers()
+            except Exception:
+                time.sleep(1)
 
-                        # Fallback - ONLY accept shipping exe, NOT launcher
-                        if not exe_found:
-                            for r, d2, f2 in os.walk(game_path):
-                                for file in f2:
-                                    file_lower = file.lower()
-                                    # MUST have "shipping" in the name to be accepted
-                                    if (file_lower.endswith(".exe") and 
-                                        "shipping" in file_lower and 
-                                        ("marvel" in file_lower or "marvelrivals" in file_lower)):
-                                        exe_found = Path(r) / file
-                                        break
-                                if exe_found:
-                                    break
+    def _next_wait(self) -> float:
+        """Sleep until the next close timer is due, or until an event arrives"""
+        if not self.close_timers:
+            return self.IDLE_WAIT_SECONDS
+        due = min(self.close_timers.values()) + self.CLOSE_GRACE_SECONDS
+        return max(0.0, due - time.time())
 
-                        platform = "NetEase" if "netease" in root_lower else "Other"
+    def _handle_event(self, event: ProcessEvent):
+        if event.kind == ProcessEvent.START:
+            self.running[event.pid] = event.exe
+            self._on_process_start(event.pid, event.exe, event.time)
+        elif event.kind == ProcessEvent.EXIT:
+            self.running.pop(event.pid, None)
+            self._on_process_exit(event.pid)
+        elif event.kind == ProcessEvent.REMATCH:
+            for pid, exe in list(self.running.items()):
+                self._on_process_start(pid, exe)
 
-                        # Save real EXE path
-                        games.append(
-                            Game("Marvel Rivals", str(game_path), platform, str(exe_found) if exe_found else "")
-                        )
+    def _on_process_start(self, pid: int, exe: str, detected_at: Optional[float] = None):
+        game_name = self._match_process(pid, exe)
+        if not game_name:
+            return
+        if game_name in self.close_timers:
+            del self.close_timers[game_name]
+        if pid not in self.tracked_pids:
+            with self.tracked_lock:
+                self.tracked_pids[pid] = game_name
+            self.event_source.pin(pid) # type: ignore
+            if list(self.tracked_pids.values()).count(game_name) == 1:
+                METRICS.event('game_detected', game=game_name, pid=pid, exe=exe)
+                if self.twitch.config.get('enabled'):
+                    self.twitch_client.request_category(game_name, detected_at)
+                self.status_callback(f"Game {game_name} detected!", "#34d399")
 
-            except:
-                continue
+    def _on_process_exit(self, pid: int):
+        self.pid_file_ids.pop(pid, None)
+        with self.tracked_lock:
+            game_name = self.tracked_pids.pop(pid, None)
+        if not game_name:
+            return
+        self.event_source.unpin(pid) # type: ignore
+        # Only start the close timer once the last process of this game is gone
+        if game_name not in self.tracked_pids.values() and game_name not in self.close_timers:
+            self.close_timers[game_name] = time.time()
 
-        return games
+    def tracked_games(self) -> List[str]:
+        """Names of the games currently running; safe to call from any thread"""
+        with self.tracked_lock:
+            return sorted(set(self.tracked_pids.values()))
 
+    def _expire_close_timers(self):
+        current_time = time.time()
+        games_to_close = [game_name for game_name, start_time in self.close_timers.items()
+                          if current_time - start_time >= self.CLOSE_GRACE_SECONDS]
 
-    def scan_all(self) -> List[Game]:
-        all_games = []
-        all_games.extend(self.scan_steam())
-        all_games.extend(self.scan_epic())
-        all_games.extend(self.scan_gog())
-        all_games.extend(self.scan_riot())
-        all_games.extend(self.scan_battlenet())
-        all_games.extend(self.scan_xbox())
-        all_games.extend(self.scan_marvel_rivals_universal())
-        return all_games
+        for game_name in games_to_close:
+            del self.close_timers[game_name]
+            METRICS.event('game_closed', game=game_name)
+            if self.twitch.config.get('enabled'):
+                self.twitch_client.request_category("Just Chatting")
+            self.status_callback(f"Closed: {game_name} closed", "#fbbf24")
 
-# Game Monitor
-class GameMonitor:
-    def __init__(self, games: List[Game], twitch: TwitchBot, status_callback):
-        self.games = games
-        self.twitch = twitch
-        self.status_callback = status_callback
-        self.active = False
-        self.tracked_pids = {}
-        self.exe_map = {}
-        self.close_timers = {}
+# ---------- Image Loading ----------
+class ImageLoader:
+    """
+    Fixed pool of worker threads fetching covers/icons, lowest priority value first.
 
-    def build_exe_map(self):
-        self.exe_map.clear()
-        for game in self.games:
-            # Special handling for Marvel Rivals - ALWAYS try to find the shipping exe
-            if "marvel rivals" in game.name.lower():
-                try:
-                    game_path = Path(game.path)
-                    
-                    # Common Marvel Rivals executable patterns across platforms
-                    # NOTE: The game uses "Marvel" not "MarvelRivals" in exe names!
-                    marvel_patterns = [
-                        # Steam version - uses "Marvel" not "MarvelRivals"
-                        game_path / "Marvel.exe",
-                        game_path / "Marvel-Win64-Shipping.exe",
-                        game_path / "Marvel" / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
-                        game_path / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
-                        
-                        # Also check for MarvelRivals variant (some versions)
-                        game_path / "MarvelRivals.exe",
-                        game_path / "MarvelRivals-Win64-Shipping.exe",
-                        game_path / "MarvelRivals" / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
-                        
-                        # Epic Games version
-                        game_path / "MarvelRivals-Win64-Shipping.exe",
-                        
-                        # NetEase/Standalone Launcher version
-                        game_path / "Game" / "MarvelRivals" / "Binaries" / "Win64" / "MarvelRivals-Win64-Shipping.exe",
-                        game_path / "MarvelGame" / "Marvel" / "Binaries" / "Win64" / "Marvel-Win64-Shipping.exe",
-                    ]
-                    
-                    # Try common patterns first
-                    for pattern_path in marvel_patterns:
-                        if pattern_path.exists() and pattern_path.is_file():
-                            marvel_exe_norm = os.path.normpath(str(pattern_path)).lower()
-                            self.exe_map[marvel_exe_norm] = game.name
-                    
-                    # Do a thorough recursive search for ONLY the shipping executable
-                    # Accept EITHER "Marvel" OR "MarvelRivals" in the filename
-                    for root, dirs, files in os.walk(game_path):
-                        depth = root[len(str(game_path)):].count(os.sep)
-                        if depth > 6:  # Increased depth for nested structures
-                            dirs.clear()
-                            continue
-                        for file in files:
-                            file_lower = file.lower()
-                            # Add ONLY the actual game executable with "shipping" in name
-                            # Accept: Marvel-Win64-Shipping.exe OR MarvelRivals-Win64-Shipping.exe
-                            # Reject: Anything with "launcher"
-                            if (file_lower.endswith('.exe') and 
-                                'shipping' in file_lower and 
-                                ('marvel-' in file_lower or 'marvelrivals-' in file_lower) and
-                                'launcher' not in file_lower):
-                                marvel_exe = Path(root) / file
-                                marvel_exe_norm = os.path.normpath(str(marvel_exe)).lower()
-                                self.exe_map[marvel_exe_norm] = game.name
-                    
-                except Exception:
-                    pass
-                # Don't process the rest of the standard logic for Marvel Rivals
-                continue
-            
-            # Special handling for Valorant - ALWAYS try to find the shipping exe
-            if "valorant" in game.name.lower():
-                try:
-                    game_path = Path(game.path)
-                    
-                    # Common Valorant executable patterns
-                    valorant_patterns = [
-                        game_path / "live" / "ShooterGame" / "Binaries" / "Win64" / "VALORANT-Win64-Shipping.exe",
-                        game_path / "live" / "VALORANT-Win64-Shipping.exe",
-                        game_path / "VALORANT-Win64-Shipping.exe",
-                        game_path / "VALORANT.exe",
-                    ]
-                    
-                    # Try common patterns first
-                    for pattern_path in valorant_patterns:
-                        if pattern_path.exists() and pattern_path.is_file():
-                            valorant_exe_norm = os.path.normpath(str(pattern_path)).lower()
-                            self.exe_map[valorant_exe_norm] = game.name
-                    
-                    # Do a thorough recursive search for the shipping executable
-                    for root, dirs, files in os.walk(game_path):
-                        depth = root[len(str(game_path)):].count(os.sep)
-                        if depth > 6:
-                            dirs.clear()
-                            continue
-                        for file in files:
-                            file_lower = file.lower()
-                            # Look for VALORANT-Win64-Shipping.exe (NOT RiotClientServices.exe)
-                            if (file_lower.endswith('.exe') and 
-                                'valorant' in file_lower and 
-                                ('shipping' in file_lower or file_lower == 'valorant.exe') and
-                                'riotclient' not in file_lower):
-                                valorant_exe = Path(root) / file
-                                valorant_exe_norm = os.path.normpath(str(valorant_exe)).lower()
-                                self.exe_map[valorant_exe_norm] = game.name
-                    
-                except Exception:
-                    pass
-                # Don't process the rest of the standard logic for Valorant
-                continue
-            
-            # Standard processing for other games
-            if game.exe_path and os.path.exists(game.exe_path):
-                norm_path = os.path.normpath(game.exe_path).lower()
-                self.exe_map[norm_path] = game.name
-                
-            # Special handling for Fortnite - detect actual game exe
-            if "fortnite" in game.name.lower():
-                try:
-                    game_path = Path(game.path)
-                    
-                    # Common Fortnite executable patterns
-                    fortnite_patterns = [
-                        game_path / "FortniteGame" / "Binaries" / "Win64" / "FortniteClient-Win64-Shipping.exe",
-                        game_path / "Binaries" / "Win64" / "FortniteClient-Win64-Shipping.exe",
-                        game_path / "FortniteClient-Win64-Shipping.exe",
-                        game_path / "FortniteGame" / "Binaries" / "Win64" / "FortniteLauncher.exe",
-                    ]
-                    
-                    # Try common patterns first
-                    for pattern_path in fortnite_patterns:
-                        if pattern_path.exists() and pattern_path.is_file():
-                            fortnite_exe_norm = os.path.normpath(str(pattern_path)).lower()
-                            self.exe_map[fortnite_exe_norm] = game.name
-                    
-                    # Do a thorough recursive search for Fortnite executables
-                    for root, dirs, files in os.walk(game_path):
-                        depth = root[len(str(game_path)):].count(os.sep)
-                        if depth > 5:  # Limit search depth
-                            dirs.clear()
-                            continue
-                        for file in files:
-                            file_lower = file.lower()
-                            # Add ANY exe that might be the game
-                            if file.endswith('.exe'):
-                                # Priority 1: Game client
-                                if any(keyword in file_lower for keyword in ['fortniteclient', 'shipping']):
-                                    fortnite_exe = Path(root) / file
-                                    fortnite_exe_norm = os.path.normpath(str(fortnite_exe)).lower()
-                                    self.exe_map[fortnite_exe_norm] = game.name
-                                # Priority 2: Any exe in FortniteGame/Binaries folder
-                                elif 'fortnitegame' in root.lower() and 'binaries' in root.lower():
-                                    fortnite_exe = Path(root) / file
-                                    fortnite_exe_norm = os.path.normpath(str(fortnite_exe)).lower()
-                                    self.exe_map[fortnite_exe_norm] = game.name
-                except Exception:
-                    pass
-            
-            # Also add the parent directory's other executables for games with multiple EXEs
-            if game.exe_path and os.path.exists(game.exe_path):
+    Requests for a cache_key that is already queued or downloading share that fetch.
+    A request whose callers have all cancelled is dropped when a worker reaches it.
+    """
+
+    class _Request:
+        __slots__ = ("key", "game_name", "image_type", "priority", "waiters", "started")
+
+        def __init__(self, key, game_name, image_type, priority):
+            self.key = key
+            self.game_name = game_name
+            self.image_type = image_type
+            self.priority = priority
+            self.waiters = {}  # ticket -> callback(photo)
+            self.started = False
+
+    def __init__(self, fetch, workers: int = 4):
+        import itertools
+        self.fetch = fetch  # fetch(game_name, image_type) -> photo or None, runs on a worker thread
+        self.queue = queue.PriorityQueue()
+        self.pending = {}   # cache_key -> _Request, until its callbacks have run
+        self.lock = threading.Lock()
+        self._order = itertools.count()
+        for i in range(workers):
+            threading.Thread(target=self._worker, name=f"image-loader-{i}", daemon=True).start()
+
+    def request(self, game_name: str, image_type: str, callback, priority: int = 0):
+        """Queue a load; callback(photo) runs on a worker thread. Returns a ticket for cancel()."""
+        key = f"{game_name}_{image_type}"
+        ticket = (key, next(self._order))
+        with self.lock:
+            req = self.pending.get(key)
+            if req is None:
+                req = self._Request(key, game_name, image_type, priority)
+                self.pending[key] = req
+                self.queue.put((priority, ticket[1], req))
+            elif not req.started and priority < req.priority:
+                # Re-queue at the better priority; the stale queue entry is skipped later
+                req.priority = priority
+                self.queue.put((priority, ticket[1], req))
+            req.waiters[ticket] = callback
+        return ticket
+
+    def cancel(self, ticket):
+        if not ticket:
+            return
+        with self.lock:
+            req = self.pending.get(ticket[0])
+            if req:
+                req.waiters.pop(ticket, None)
+
+    def _worker(self):
+        while True:
+            _, _, req = self.queue.get()
+            with self.lock:
+                if req.started or self.pending.get(req.key) is not req:
+                    continue  # duplicate entry from a priority bump
+                if not req.waiters:
+                    del self.pending[req.key]  # every caller went away
+                    continue
+                req.started = True
+
+            try:
+                photo = self.fetch(req.game_name, req.image_type)
+            except Exception:
+                photo = None
+
+            with self.lock:
+                self.pending.pop(req.key, None)
+                callbacks = list(req.waiters.values())
+            for callback in callbacks:
                 try:
-                    exe_dir = Path(game.exe_path).parent
-                    for exe in exe_dir.glob("*.exe"):
-                        exe_norm = os.path.normpath(str(exe)).lower()
-                        if exe_norm not in self.exe_map:
-                            # Only add if it's a reasonable game executable (not an installer/uninstaller)
-                            exe_name = exe.stem.lower()
-                            skip_patterns = ['unins', 'install', 'setup', 'crash', 'report']
-                            
-                            # For Marvel Rivals, ONLY accept the shipping exe, NOT launcher
-                            if "marvel rivals" in game.name.lower():
-                                # Must contain BOTH "shipping" AND not contain "launcher"
-                                if 'shipping' not in exe_name:
-                                    continue  # Skip non-shipping executables
-                                if 'launcher' in exe_name:
-                                    continue  # Skip launcher executables
-                            # Only skip launcher for games that aren't Fortnite
-                            elif "fortnite" not in game.name.lower():
-                                skip_patterns.append('launcher')
-                            
-                            if not any(skip in exe_name for skip in skip_patterns):
-                                self.exe_map[exe_norm] = game.name
+                    callback(photo)
                 except Exception:
                     pass
-                
-                if game.platform == "Xbox":
-                    try:
-                        content_path = Path(game.path)
-                        for exe in content_path.glob("*.exe"):
-                            exe_norm = os.path.normpath(str(exe)).lower()
-                            if exe_norm not in self.exe_map:
-                                self.exe_map[exe_norm] = game.name
-                    except Exception:
-                        pass
 
-    def start(self):
-        self.active = True
-        self.build_exe_map()
-        threading.Thread(target=self._monitor_loop, daemon=True).start()
 
-    def stop(self):
-        self.active = False
-        self.tracked_pids.clear()
-        self.close_timers.clear()
+class BoundedImageCache:
+    """
+    Decoded PhotoImages keyed by "<game>_<type>", least-recently-used first out.
 
-    def _monitor_loop(self):
+    Each image is charged width*height*4 bytes (Tk keeps photos as 32-bit pixels)
+    against max_bytes. Thread-safe: image workers put, the Tk thread gets.
+    """
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        from collections import OrderedDict
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()  # key -> (photo, size)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def image_bytes(photo) -> int:
+        try:
+            return photo.width() * photo.height() * 4
+        except Exception:
+            return 0
+
+    def get(self, key: str):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, photo):
+        size = self.image_bytes(photo)
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old:
+                self.bytes -= old[1]
+            self.entries[key] = (photo, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes and len(self.entries) > 1:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def retain_only(self, keys):
+        """Evict every image whose key is not in keys (e.g. the cards currently shown)"""
+        keys = set(keys)
+        with self.lock:
+            for key in [k for k in self.entries if k not in keys]:
+                self.bytes -= self.entries.pop(key)[1]
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.evictions += len(self.entries)
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+
+class ImageDiskCache:
+    """
+    Resized cover/icon thumbnails kept on disk between runs.
+
+    Entries are keyed by game name, image type and size, tracked in index.json with
+    their source URL and ETag/Last-Modified, and evicted least-recently-used first
+    once the cache grows past max_bytes.
+    """
+    DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+    REVALIDATE_AFTER = 7 * 24 * 3600  # seconds before a thumbnail is re-checked with its origin
+    FLUSH_DELAY = 2.0  # seconds; new thumbnails within this window share one index write
+
+    def __init__(self, cache_dir: Path = IMAGE_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.index_file = cache_dir / 'index.json'
+        self.entries = {}  # key -> {'file', 'size', 'last_used', 'fetched', 'url', 'etag', 'last_modified'}
+        self.lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer = None
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            if self.index_file.exists():
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f).get('entries', {})
+        except Exception:
+            self.entries = {}
+
+    @staticmethod
+    def key_for(game_name: str, image_type: str, size: tuple) -> str:
+        return f"{game_name}|{image_type}|{size[0]}x{size[1]}"
+
+    def total_bytes(self) -> int:
+        return sum(e.get('size', 0) for e in self.entries.values())
+
+    def get(self, key: str):
+        """Returns (thumbnail bytes, entry) or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            try:
+                with open(self.cache_dir / entry['file'], 'rb') as f:
+                    data = f.read()
+            except OSError:
+                del self.entries[key]
+                self._dirty = True
+                return None
+            entry['last_used'] = time.time()
+            self._dirty = True
+            return data, dict(entry)
+
+    def is_stale(self, entry: dict) -> bool:
+        return time.time() - entry.get('fetched', 0) > self.REVALIDATE_AFTER
+
+    def mark_fresh(self, key: str):
+        """The origin answered 304 Not Modified"""
+        with self.lock:
+            if key in self.entries:
+                self.entries[key]['fetched'] = time.time()
+                self._dirty = True
+
+    def put(self, key: str, data: bytes, url: str = "", etag: str = None, last_modified: str = None): # type: ignore
+        filename = hashlib.sha1(key.encode('utf-8')).hexdigest()[:24] + '.png'
+        with self.lock:
+            try:
+                with open(self.cache_dir / filename, 'wb') as f:
+                    f.write(data)
+            except OSError:
+                return
+            now = time.time()
+            self.entries[key] = {
+                'file': filename, 'size': len(data), 'last_used': now, 'fetched': now,
+                'url': url, 'etag': etag, 'last_modified': last_modified,
+            }
+            self._evict()
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """With the lock held: write the index once, FLUSH_DELAY after the first unsaved change"""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _evict(self):
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+        for key, entry in sorted(self.entries.items(), key=lambda kv: kv[1].get('last_used', 0)):
+            if total <= self.max_bytes:
+                break
+            try:
+                (self.cache_dir / entry['file']).unlink()
+            except OSError:
+                pass
+            total -= entry.get('size', 0)
+            del self.entries[key]
+
+    def _save_index(self):
+        if not self._dirty:
+            return
+        try:
+            tmp = self.index_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self.entries}, f)
+            os.replace(tmp, self.index_file)
+            self._dirty = False
+        except Exception:
+            pass
+
+    def flush(self):
+        """Persist pending entries and last-used times (debounced after puts, and on exit)"""
+        with self.lock:
+            self._flush_timer = None
+            self._save_index()
+
+
+class ImageUrlCache:
+    """
+    Remembers which URL produced each game's cover/icon, so repeat lookups skip discovery.
+
+    Names for which nothing could be found are remembered too (url None) until
+    NEGATIVE_TTL passes, so they don't cost a round of timeouts on every start.
+    """
+    NEGATIVE_TTL = 24 * 3600  # seconds
+    FLUSH_DELAY = 2.0  # seconds; lookups finishing within this window share one write
+
+    def __init__(self, cache_file: Path = IMAGE_URL_CACHE_FILE):
+        self.cache_file = cache_file
+        self.entries = {}  # "<clean name>|<type>" -> {'url': str or None, 'time': float}
+        self.lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer = None
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+        except Exception:
+            self.entries = {}
+
+    @staticmethod
+    def key_for(clean_name: str, image_type: str) -> str:
+        return f"{clean_name.lower()}|{image_type}"
+
+    def get(self, key: str) -> Optional[dict]:
+        """The remembered entry, or None if unknown / the negative entry has expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry.get('url') is None and time.time() - entry.get('time', 0) > self.NEGATIVE_TTL:
+                del self.entries[key]
+                return None
+            return entry
+
+    def remember(self, key: str, url: str):
+        self._set(key, {'url': url, 'time': time.time()})
+
+    def remember_failure(self, key: str):
+        self._set(key, {'url': None, 'time': time.time()})
+
+    def forget(self, key: str):
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self._schedule_flush()
+
+    def _set(self, key: str, entry: dict):
+        with self.lock:
+            self.entries[key] = entry
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        """With the lock held: save once, FLUSH_DELAY after the first unsaved change"""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self):
+        """Persist pending changes (debounced after updates, and on exit)"""
+        with self.lock:
+            self._flush_timer = None
+            if self._dirty:
+                self._save()
+
+    def _save(self):
+        self._dirty = False
+        try:
+            tmp = self.cache_file.with_suffix('.tmp')
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2)
+            os.replace(tmp, self.cache_file)
+        except Exception:
+            pass
+
+
+# ---------- Virtualized game views ----------
+class GameListRow:
+    """A recycled list-view row. bind() repoints it at another game instead of rebuilding widgets."""
+    HEIGHT = 116
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.game = None
+        self.image_ticket = None
+        c = gui.colors
+
+        self.frame = tk.Frame(gui.canvas, bg=c['bg_card'], height=self.HEIGHT, highlightthickness=0)
+        self.frame.pack_propagate(False)
+
+        # Platform accent bar (smooth, slightly thicker)
+        self.accent = tk.Frame(self.frame, bg=c['border'], width=5)
+        self.accent.pack(side="left", fill="y")
+
+        # Icon container - LARGER for better quality icons (80x80)
+        icon_frame = tk.Frame(self.frame, bg=c['bg_hover'], width=80, height=80)
+        icon_frame.pack(side="left", padx=18, pady=18)
+        icon_frame.pack_propagate(False)
+        self.icon = tk.Label(icon_frame, bg=c['bg_hover'], fg=c['text_primary'],
+                             font=("Segoe UI", 24, "bold"))  # Larger font for 80x80 fallback
+        self.icon.pack(expand=True, fill="both")
+
+        # Content section
+        self.content = tk.Frame(self.frame, bg=c['bg_card'])
+        self.content.pack(side="left", fill="both", expand=True, padx=24, pady=18)
+
+        self.name = tk.Label(self.content, font=("Segoe UI", 13, "bold"),
+                             bg=c['bg_card'], fg=c['text_primary'], anchor="w")
+        self.name.pack(anchor="w")
+
+        self.details = tk.Frame(self.content, bg=c['bg_card'])
+        self.details.pack(anchor="w", pady=(8, 0))
+
+        self.badge = tk.Label(self.details, font=("Segoe UI", 9, "bold"),
+                              fg=c['text_primary'], padx=12, pady=5)
+        self.badge.pack(side="left", padx=(0, 12))
+
+        self.path = tk.Label(self.details, font=("Segoe UI", 9),
+                             bg=c['bg_card'], fg=c['text_secondary'])
+        self.path.pack(side="left")
+
+        remove_btn = tk.Button(self.frame, text="✕", command=lambda: self.game and gui.remove(self.game),
+                               font=("Segoe UI", 12, "bold"), bg=c['accent_red'],
+                               fg=c['text_primary'], activebackground="#dc2626",
+                               relief="flat", padx=18, pady=12, cursor="hand2", borderwidth=0)
+        remove_btn.pack(side="right", padx=18, pady=15)
+
+        self.frame.bind("<Enter>", lambda e: self._set_bg(c['bg_hover']))
+        self.frame.bind("<Leave>", lambda e: self._set_bg(c['bg_card']))
+
+        self.item = gui.canvas.create_window(0, 0, window=self.frame, anchor="nw", state="hidden")
+
+    def _set_bg(self, color):
+        for widget in (self.frame, self.content, self.name, self.details, self.path):
+            widget.config(bg=color)
+
+    def bind(self, game, priority: int = 0):
+        self.game = game
+        accent_color = self.gui.PLATFORM_COLORS.get(game.platform, self.gui.colors['border'])
+        self.accent.config(bg=accent_color)
+        self.name.config(text=game.name)
+        self.badge.config(text=f"  {game.platform}  ", bg=accent_color)
+        self.path.config(text=game.path if len(game.path) < 60 else "..." + game.path[-57:])
+        self._set_bg(self.gui.colors['bg_card'])
+        self.icon.config(image="", text="", bg=self.gui.colors['bg_hover'])
+        self.gui.load_card_image(self, "icon", priority)
+
+    def set_image(self, photo):
+        self.icon.config(image=photo, text="", bg=self.gui.colors['bg_hover'])
+        self.icon.image = photo # type: ignore
+
+    def set_fallback(self):
+        """First letter on the platform colour when no icon could be found"""
+        accent_color = self.gui.PLATFORM_COLORS.get(self.game.platform, self.gui.colors['border']) # type: ignore
+        self.icon.config(image="", text=self.game.name[:1].upper(), bg=accent_color) # type: ignore
+        self.icon.image = None # type: ignore
+
+    def clear_image(self):
+        self.icon.config(image="", text="", bg=self.gui.colors['bg_hover'])
+        self.icon.image = None # type: ignore
+
+
+class GameGridCard:
+    """A recycled grid-view card with cover art, name and platform badge."""
+    WIDTH = 230
+    HEIGHT = 370
+
+    def __init__(self, gui):
+        self.gui = gui
+        self.game = None
+        self.image_ticket = None
+        c = gui.colors
+
+        # Main card with smooth, rounded styling (no harsh borders)
+        self.frame = tk.Frame(gui.canvas, bg=c['bg_card'], highlightthickness=0,
+                              width=self.WIDTH, height=self.HEIGHT)
+        self.frame.pack_propagate(False)
+
+        # Image container with smooth background
+        img_frame = tk.Frame(self.frame, bg=c['bg_hover'], width=220, height=310)
+        img_frame.pack(padx=5, pady=5)
+        img_frame.pack_propagate(False)
+        self.cover = tk.Label(img_frame, bg=c['bg_hover'], fg=c['accent_purple'],
+                              font=("Segoe UI", 72, "bold"))
+        self.cover.pack(expand=True, fill="both")
+        # Game name at the bottom of the fallback cover
+        self.cover_name = tk.Label(img_frame, font=("Segoe UI", 10, "bold"),
+                                   bg=c['bg_medium'], fg=c['text_primary'], wraplength=190)
+
+        # Info section below image
+        self.info = tk.Frame(self.frame, bg=c['bg_card'])
+        self.info.pack(fill="x", padx=10, pady=(0, 10))
+
+        self.name = tk.Label(self.info, font=("Segoe UI", 10, "bold"), bg=c['bg_card'],
+                             fg=c['text_primary'], anchor="w")
+        self.name.pack(fill="x", pady=(0, 6))
+
+        self.badge = tk.Label(self.info, font=("Segoe UI", 8, "bold"),
+                              fg=c['text_primary'], padx=10, pady=4)
+        self.badge.pack(anchor="w")
+
+        self.frame.bind("<Enter>", lambda e: self._set_bg(c['bg_hover']))
+        self.frame.bind("<Leave>", lambda e: self._set_bg(c['bg_card']))
+
+        self.item = gui.canvas.create_window(0, 0, window=self.frame, anchor="nw", state="hidden")
+
+    def _set_bg(self, color):
+        for widget in (self.frame, self.info, self.name):
+            widget.config(bg=color)
+
+    def bind(self, game, priority: int = 0):
+        self.game = game
+        self.name.config(text=game.name[:30] + "..." if len(game.name) > 30 else game.name)
+        self.badge.config(text=game.platform,
+                          bg=self.gui.PLATFORM_COLORS.get(game.platform, self.gui.colors['border']))
+        self._set_bg(self.gui.colors['bg_card'])
+        self.cover.config(image="", text="", bg=self.gui.colors['bg_hover'])
+        self.cover_name.place_forget()
+        self.gui.load_card_image(self, "cover", priority)
+
+    def set_image(self, photo):
+        self.cover_name.place_forget()
+        self.cover.config(image=photo, text="", bg=self.gui.colors['bg_hover'])
+        self.cover.image = photo # type: ignore
+
+    def set_fallback(self):
+        """Large initial plus the game name when no cover could be found"""
+        name = self.game.name # type: ignore
+        self.cover.config(image="", text=name[:1].upper(), bg=self.gui.colors['bg_medium'])
+        self.cover.image = None # type: ignore
+        self.cover_name.config(text=name[:20] + "..." if len(name) > 20 else name)
+        self.cover_name.place(relx=0.5, rely=1.0, anchor="s", y=-10)
+
+    def clear_image(self):
+        self.cover_name.place_forget()
+        self.cover.config(image="", text="", bg=self.gui.colors['bg_hover'])
+        self.cover.image = None # type: ignore
+
+
+# ---------- Headless service ----------
+class HeadlessService:
+    """
+    --daemon: the monitor and Twitch client without any Tk. Loads the games cache,
+    builds the exe map and serves JSON-lines requests on a localhost socket:
+
+        {"cmd": "status" | "metrics" | "reload" | "reload_games" | "shutdown", "token": ...}\n
+
+    The port and a per-run token are published in DAEMON_INFO_FILE for DaemonClient.
+    """
+
+    @staticmethod
+    def gui_monitor_active() -> bool:
+        """Whether the GUI process named in GUI_MONITOR_FILE is still alive (and monitoring)"""
         try:
+            with open(GUI_MONITOR_FILE, 'r') as f:
+                pid = json.load(f)['pid']
             import psutil
+            # A process started after the file was written got a reused PID, it isn't that GUI
+            return psutil.Process(pid).create_time() <= GUI_MONITOR_FILE.stat().st_mtime
         except Exception:
+            return False
+
+    def __init__(self):
+        self.twitch = None
+        self.monitor = None
+        self.games = []
+        self.last_status = ""
+        self.running = False
+        self.token = base64.urlsafe_b64encode(os.urandom(18)).decode()
+        self.server = None
+
+    def start_monitor(self):
+        self.games = load_cached_games()
+        if self.twitch is None:
+            self.twitch = TwitchBot(interactive=False)
+        self.monitor = GameMonitor(self.games, self.twitch, self._on_status)
+        if self.twitch.is_authenticated() and self.games:
+            self.monitor.start()
+            threading.Thread(target=self.twitch.prefetch_categories,
+                             args=([g.name for g in self.games],), daemon=True).start()
+        print(f"Service: {len(self.games)} games, monitor {'active' if self.monitor.active else 'idle'}")
+
+    def reload(self):
+        """Re-read the games cache and Twitch config (the GUI saved new ones)"""
+        if self.twitch:
+            # Keeps the tokens this process rotated unless the GUI logged in again since
+            self.twitch.reload_config()
+            if self.monitor and self.monitor.active and self.twitch.is_authenticated():
+                self.reload_games()
+                return
+        if self.monitor:
+            self.monitor.stop()
+        self.start_monitor()
+
+    def reload_games(self):
+        """Re-read only the games cache. A running monitor keeps its tracked games and close timers."""
+        if not (self.monitor and self.monitor.active):
+            self.start_monitor()
             return
+        self.games = load_cached_games()
+        self.monitor.games = self.games
+        self.monitor.build_exe_map()
+        threading.Thread(target=self.twitch.prefetch_categories, # type: ignore
+                         args=([g.name for g in self.games],), daemon=True).start()
+        print(f"Service: reloaded {len(self.games)} games")
 
-        while self.active:
-            try:
-                current_pids = set()
-                active_games = set()
-                for proc in psutil.process_iter(['pid', 'exe']):
+    def _on_status(self, text, color):
+        self.last_status = text
+        print(text)
+
+    def status(self) -> dict:
+        monitor = self.monitor
+        return {
+            'pid': os.getpid(),
+            'active': bool(monitor and monitor.active),
+            'games': len(self.games),
+            'tracked': monitor.tracked_games() if monitor else [],
+            'source': type(monitor.event_source).__name__ if monitor and monitor.event_source else None,
+            'last_status': self.last_status,
+        }
+
+    def handle(self, request: dict) -> dict:
+        if request.get('token') != self.token:
+            return {'ok': False, 'error': 'bad token'}
+        cmd = request.get('cmd')
+        if cmd == 'status':
+            return {'ok': True, 'result': self.status()}
+        if cmd == 'metrics':
+            return {'ok': True, 'result': METRICS.snapshot()}
+        if cmd == 'reload':
+            self.reload()
+            return {'ok': True, 'result': self.status()}
+        if cmd == 'reload_games':
+            self.reload_games()
+            return {'ok': True, 'result': self.status()}
+        if cmd == 'shutdown':
+            self.running = False
+            return {'ok': True, 'result': None}
+        return {'ok': False, 'error': f'unknown command {cmd!r}'}
+
+    def run(self):
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(4)
+        self.server.settimeout(1.0)
+        port = self.server.getsockname()[1]
+        try:
+            with open(DAEMON_INFO_FILE, 'w') as f:
+                json.dump({'port': port, 'pid': os.getpid(), 'token': self.token}, f)
+        except Exception:
+            pass
+
+        self.running = True
+        self.start_monitor()
+        print(f"Service listening on 127.0.0.1:{port}")
+        try:
+            while self.running:
+                try:
+                    conn, _ = self.server.accept()
+                except socket.timeout:
+                    continue
+                threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+        finally:
+            self.stop()
+
+    def _serve(self, conn):
+        try:
+            conn.settimeout(10)
+            with conn, conn.makefile('rwb') as stream:
+                for line in stream:
                     try:
-                        pid = proc.info.get('pid')
-                        exe = proc.info.get('exe')
-                        if not exe:
-                            continue
-                        current_pids.add(pid)
-                        try:
-                            norm_exe = os.path.normpath(exe).lower()
-                        except Exception:
-                            continue
-                        if norm_exe in self.exe_map:
-                            game_name = self.exe_map[norm_exe]
-                            active_games.add(game_name)
-                            if game_name in self.close_timers:
-                                del self.close_timers[game_name]
-                            if pid not in self.tracked_pids:
-                                self.tracked_pids[pid] = game_name
-                                if list(self.tracked_pids.values()).count(game_name) == 1:
-                                    if self.twitch.config.get('enabled'):
-                                        threading.Thread(target=lambda gn=game_name: self.twitch.change_category(gn), daemon=True).start()
-                                    self.status_callback(f"Game {game_name} detected!", "#34d399")
-                    except Exception:
-                        pass
-
-                closed_pids = set(self.tracked_pids.keys()) - current_pids
-                for pid in closed_pids:
-                    game_name = self.tracked_pids.pop(pid, None)
-                    if game_name:
-                        if game_name not in active_games:
-                            if game_name not in self.close_timers:
-                                self.close_timers[game_name] = time.time()
-
-                current_time = time.time()
-                games_to_close = []
-                for game_name, start_time in list(self.close_timers.items()):
-                    elapsed = current_time - start_time
-                    if elapsed >= 5:
-                        games_to_close.append(game_name)
-
-                for game_name in games_to_close:
-                    del self.close_timers[game_name]
-                    if self.twitch.config.get('enabled'):
-                        threading.Thread(target=lambda: self.twitch.change_category("Just Chatting"), daemon=True).start()
-                    self.status_callback(f"Closed: {game_name} closed", "#fbbf24")
-
-                time.sleep(3.5)
-            except Exception:
-                time.sleep(3.5)
+                        response = self.handle(json.loads(line))
+                    except Exception as e:
+                        response = {'ok': False, 'error': str(e)}
+                    stream.write(json.dumps(response, default=str).encode() + b"\n")
+                    stream.flush()
+        except Exception:
+            pass
+
+    def stop(self):
+        self.running = False
+        if self.monitor:
+            self.monitor.stop()
+        try:
+            self.server.close() # type: ignore
+        except Exception:
+            pass
+        try:
+            with open(DAEMON_INFO_FILE, 'r') as f:
+                if json.load(f).get('pid') == os.getpid():
+                    DAEMON_INFO_FILE.unlink()
+        except Exception:
+            pass
+
+
+class DaemonClient:
+    """GUI side of the HeadlessService IPC channel"""
+
+    def __init__(self, port: int, token: str):
+        self.port = port
+        self.token = token
+
+    @classmethod
+    def find(cls) -> Optional['DaemonClient']:
+        """A client for the running service, or None if no service answers"""
+        try:
+            with open(DAEMON_INFO_FILE, 'r') as f:
+                info = json.load(f)
+            client = cls(info['port'], info['token'])
+            if client.call('status') is not None:
+                return client
+        except Exception:
+            pass
+        return None
+
+    def call(self, cmd: str, timeout: float = 2.0):
+        """Send one command; returns its result, or None if the service is unreachable"""
+        try:
+            with socket.create_connection(('127.0.0.1', self.port), timeout=timeout) as conn:
+                conn.sendall(json.dumps({'cmd': cmd, 'token': self.token}).encode() + b"\n")
+                with conn.makefile('rb') as stream:
+                    response = json.loads(stream.readline())
+            return response.get('result') if response.get('ok') else None
+        except Exception:
+            return None
+
 
 # GUI Application
 class GUI:
+    SCAN_BATCH_MS = 100  # how often streamed scan results are added to the view
+
+    # Virtualized views: fixed row geometry, only rows near the viewport get widgets
+    LIST_ROW_HEIGHT = GameListRow.HEIGHT + 8
+    GRID_CELL_WIDTH = GameGridCard.WIDTH + 20
+    GRID_ROW_HEIGHT = GameGridCard.HEIGHT + 40
+    GRID_PADDING = 10
+    OVERSCAN_ROWS = 2
+    IMAGE_WORKERS = 4
+
+    # Thumbnail bounds per image type (icons are squashed, covers keep aspect ratio)
+    IMAGE_SIZES = {"icon": (80, 80), "cover": (230, 345)}
+    IMAGE_REQUEST_HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+
+    PLATFORM_COLORS = {
+        "Steam": "#2563eb",
+        "Epic Games": "#0ea5e9",
+        "GOG": "#a855f7",
+        "Riot Games": "#ef4444",
+        "Xbox": "#10b981",
+        "Battle.net": "#0891b2",
+        "Other": "#6b7280"
+    }
+
     def __init__(self, root):
+        self.startup_times = {}
+        self._mark_startup('tk_ready')
         self.root = root
         self.root.title("Twitch Game Changer")
 
@@ -1427,14 +4032,16 @@ class GUI:
         # Close behavior
         if TRAY_AVAILABLE:
             self.root.protocol("WM_DELETE_WINDOW", self.minimize_to_tray)
-            # --- Start the persistent tray icon on launch ---
-            self.start_persistent_tray()
+            # The persistent tray icon starts right after the first paint (see _after_first_paint)
         else:
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
 
         # Core components
+        # A running --daemon service owns the monitor and token refreshes; the GUI is then only a client.
+        # It is looked for after the first paint (auto_start_monitor); until then nothing here rotates tokens.
+        self.daemon = None
         self.scanner = GameScanner()
-        self.twitch = TwitchBot()
+        self.twitch = TwitchBot(background_refresh=False)
         self.monitor = None
         self.games = []
         self.filtered = []
@@ -1443,11 +4050,31 @@ class GUI:
         self.updater = AutoUpdater(APP_VERSION, GITHUB_REPO, GITHUB_API_URL)
 
         self.setup_ui()
-        self.root.after(1400, self.load_cache)
-        # Auto-start monitor if Twitch is authenticated (after cache loads)
-        self.root.after(1600, self.auto_start_monitor)
-        # Check for updates after UI loads (non-blocking)
-        self.root.after(2000, self.check_for_updates_background)
+        # Startup pipeline: every stage runs as soon as what it needs is ready, not on fixed timers.
+        # The cache is just JSON, so games are there for the first paint.
+        self._mark_startup('ui_built')
+        self.load_cache()
+        self._mark_startup('cache_loaded')
+        self.root.after_idle(self._after_first_paint)
+
+    def _mark_startup(self, stage: str):
+        elapsed = time.perf_counter() - PROCESS_STARTED
+        self.startup_times[stage] = elapsed
+        METRICS.gauge(f'startup.{stage}_ms', round(elapsed * 1000, 1))
+
+    def _after_first_paint(self):
+        """Runs once the window has been drawn: service lookup + monitor, tray, update check"""
+        self.root.update_idletasks()
+        self._mark_startup('first_paint')
+        # Needs the games (loaded above) and the Twitch config (loaded in __init__);
+        # the 'monitoring' stage is marked once the service lookup has answered
+        self.auto_start_monitor()
+        if STARTUP_BENCHMARK:
+            return
+        if TRAY_AVAILABLE:
+            self.start_persistent_tray()
+        # Check for updates in the background (non-blocking)
+        self.check_for_updates_background()
 
     def setup_ui(self):
         # Smooth, soft color scheme with gradual transitions
@@ -1473,7 +4100,10 @@ class GUI:
         self.view_mode = tk.StringVar(value="list")  # Default to list view
         
         # Image cache for covers/icons
-        self.image_cache = {}
+        self.image_cache = BoundedImageCache()
+        self.image_disk_cache = ImageDiskCache()
+        self.image_url_cache = ImageUrlCache()
+        self.image_loader = ImageLoader(self.fetch_game_image, workers=self.IMAGE_WORKERS)
         
         # Top control bar with smooth, rounded feel
         topbar = tk.Frame(self.root, bg=self.colors['bg_medium'], height=80)
@@ -1514,6 +4144,11 @@ class GUI:
                  activebackground=self.colors['bg_hover'], **btn_style)
         excluded_btn.pack(side="left", padx=5)
         
+        diagnostics_btn = tk.Button(left_controls, text="Diagnostics", command=self.show_diagnostics,
+                 bg=self.colors['bg_card'], fg=self.colors['text_primary'],
+                 activebackground=self.colors['bg_hover'], **btn_style)
+        diagnostics_btn.pack(side="left", padx=5)
+        
         # Monitor button removed - monitoring is automatic when authenticated
         
         # Add smooth hover effects to all buttons
@@ -1530,6 +4165,7 @@ class GUI:
         create_hover_effect(add_btn, "#9d4edd")
         create_hover_effect(twitch_btn, "#7c3aed")
         create_hover_effect(excluded_btn, self.colors['bg_hover'])
+        create_hover_effect(diagnostics_btn, self.colors['bg_hover'])
         
         # Right side - search, filter, view toggle
         right_controls = tk.Frame(topbar, bg=self.colors['bg_medium'])
@@ -1632,19 +4268,28 @@ class GUI:
         self.canvas = tk.Canvas(container, bg=self.colors['bg_dark'], highlightthickness=0)
         self.canvas.pack(side="left", fill="both", expand=True)
         
-        scrollbar = tk.Scrollbar(container, orient="vertical", command=self.canvas.yview,
+        self.scrollbar = tk.Scrollbar(container, orient="vertical", command=self.canvas.yview,
                                 bg=self.colors['bg_dark'], troughcolor=self.colors['bg_medium'],
                                 activebackground=self.colors['text_secondary'], width=12)
-        scrollbar.pack(side="right", fill="y")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.configure(yscrollcommand=self._on_canvas_scroll)
+        
+        # Virtualized game view state: index in self.filtered -> card currently showing it
+        self._visible_cards = {}
+        self._card_pools = {"list": [], "grid": []}
+        self._grid_columns = 1
+        self._refresh_pending = False
         
-        self.games_frame = tk.Frame(self.canvas, bg=self.colors['bg_dark'])
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.games_frame, anchor="nw")
+        # Empty state (shown instead of cards when nothing matches)
+        self.empty_frame = tk.Frame(self.canvas, bg=self.colors['bg_dark'])
+        tk.Label(self.empty_frame, text="No games found", font=("Segoe UI", 24, "bold"),
+                bg=self.colors['bg_dark'], fg=self.colors['text_primary']).pack(pady=(0, 12))
+        tk.Label(self.empty_frame, text="Click 'Scan' to discover your games",
+                font=("Segoe UI", 12), bg=self.colors['bg_dark'],
+                fg=self.colors['text_secondary']).pack()
+        self.empty_item = self.canvas.create_window(0, 100, window=self.empty_frame, anchor="n", state="hidden")
         
-        def on_configure(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        self.games_frame.bind("<Configure>", on_configure)
-        self.canvas.bind("<Configure>", lambda e: self.canvas.itemconfig(self.canvas_window, width=e.width))
+        self.canvas.bind("<Configure>", lambda e: self._layout_view())
         
         def _on_mousewheel(event):
             self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
@@ -1665,215 +4310,324 @@ class GUI:
         """Fetch high-quality icons and covers with better non-Steam game support"""
         # Check cache first
         cache_key = f"{game_name}_{image_type}"
-        if cache_key in self.image_cache:
-            return self.image_cache[cache_key]
+        photo = self.image_cache.get(cache_key)
+        if photo:
+            return photo
+        
+        # Thumbnails saved by previous runs need no network at all
+        disk_key = ImageDiskCache.key_for(game_name, image_type, self.IMAGE_SIZES.get(image_type, (80, 80)))
+        cached = self.image_disk_cache.get(disk_key)
+        if cached:
+            data, entry = cached
+            if self.image_disk_cache.is_stale(entry):
+                data = self._revalidate_thumbnail(disk_key, entry, image_type) or data
+            try:
+                photo = self._photo_from_bytes(data)
+                self.image_cache.put(cache_key, photo)
+                return photo
+            except Exception:
+                pass
         
         try:
-            import requests
-            from io import BytesIO
-            from PIL import Image, ImageTk
-            import urllib.parse
-            
             # Clean game name
             clean_name = game_name.replace('™', '').replace('®', '').replace('©', '').strip()
             clean_name = clean_name.replace(':', '').replace('  ', ' ')
+            url_key = ImageUrlCache.key_for(clean_name, image_type)
             
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            
-            image_urls = []
+            # A URL that worked before skips the Steam/RAWG discovery requests
+            known = self.image_url_cache.get(url_key)
+            if known is not None:
+                if known.get('url') is None:
+                    print(f"  Skipping '{game_name}': no image found recently")
+                    return None
+                photo, gone = self._download_image(known['url'], cache_key, disk_key, image_type)
+                if photo:
+                    return photo
+                if not gone:
+                    return None  # offline / timeout / server error: keep the URL, retry on the next load
+                self.image_url_cache.forget(url_key)
             
             print(f"🔍 Searching for images: {clean_name}")
-            
-            # ===== METHOD 1: Steam Community (BEST quality for Steam games) =====
-            try:
-                steam_search = clean_name.lower().replace(' ', '%20')
-                steam_url = f"https://steamcommunity.com/actions/SearchApps/{steam_search}"
-                
-                response = requests.get(steam_url, headers=headers, timeout=5)
-                if response.status_code == 200:
-                    steam_data = response.json()
-                    if steam_data and len(steam_data) > 0:
-                        app_id = steam_data[0].get('appid')
-                        if app_id:
-                            print(f"✓ Found Steam App ID: {app_id}")
-                            
-                            if image_type == "icon":
-                                # PRIORITY ORDER: Best quality icons first!
-                                # 1. Library capsule (best quality, large)
-                                image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/capsule_184x69.jpg")
-                                image_urls.append(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/capsule_231x87.jpg")
-                                # 2. Logo from community (high quality)
-                                logo = steam_data[0].get('logo', '')
-                                if logo:
-                                    image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steamcommunity/public/images/apps/{app_id}/{logo}.jpg")
-                                # 3. Header (good fallback)
-                                image_urls.append(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg")
-                            else:
-                                # For covers, get highest quality available
-                                image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900_2x.jpg")
-                                image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900.jpg")
-                                image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_hero.jpg")
-                                image_urls.append(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg")
-                
-            except Exception as e:
-                print(f"  Steam search error: {e}")
-            
-            # ===== METHOD 2: RAWG API (Good for non-Steam games) =====
-            if not image_urls or len(image_urls) == 0:
-                try:
-                    # RAWG has good coverage for all platforms
-                    rawg_search = clean_name.lower().replace(' ', '-').replace("'", "")
-                    rawg_url = f"https://api.rawg.io/api/games/{rawg_search}"
-                    
-                    response = requests.get(rawg_url, headers=headers, timeout=5)
-                    if response.status_code == 200:
-                        rawg_data = response.json()
-                        
-                        # Get background image (usually high quality)
-                        bg_image = rawg_data.get('background_image')
-                        if bg_image:
-                            print(f"✓ Found RAWG image")
-                            image_urls.append(bg_image)
-                        
-                        # Get additional background
-                        bg_add = rawg_data.get('background_image_additional')
-                        if bg_add:
-                            image_urls.append(bg_add)
-                    else:
-                        # Try with spaces instead of dashes
-                        rawg_search2 = clean_name.lower().replace(' ', '%20')
-                        rawg_url2 = f"https://api.rawg.io/api/games?search={rawg_search2}"
-                        
-                        response2 = requests.get(rawg_url2, headers=headers, timeout=5)
-                        if response2.status_code == 200:
-                            rawg_data2 = response2.json()
-                            results = rawg_data2.get('results', [])
-                            if results and len(results) > 0:
-                                print(f"✓ Found RAWG game via search")
-                                bg_image = results[0].get('background_image')
-                                if bg_image:
-                                    image_urls.append(bg_image)
-                        
-                except Exception as e:
-                    print(f"  RAWG search error: {e}")
-            
-            # ===== METHOD 3: Epic Games Store (for Epic games) =====
-            if not image_urls and any(x in game_name.lower() for x in ['fortnite', 'rocket league', 'fall guys']):
-                try:
-                    # Common Epic Games images
-                    epic_game_ids = {
-                        'fortnite': 'fortnite',
-                        'rocket league': 'sugar',
-                        'fall guys': 'fallguys'
-                    }
-                    
-                    for game_key, game_id in epic_game_ids.items():
-                        if game_key in clean_name.lower():
-                            print(f"✓ Detected Epic game: {game_key}")
-                            # Epic CDN URLs
-                            if image_type == "icon":
-                                image_urls.append(f"https://cdn2.unrealengine.com/{game_id}-logo.png")
-                            image_urls.append(f"https://cdn2.unrealengine.com/{game_id}-keyart.jpg")
-                            break
-                            
-                except Exception as e:
-                    print(f"  Epic search error: {e}")
-            
-            # ===== METHOD 4: Special handling for known games =====
-            if not image_urls:
-                try:
-                    game_lower = clean_name.lower()
-                    
-                    # Marvel Rivals
-                    if 'marvel' in game_lower and 'rivals' in game_lower:
-                        print(f"✓ Detected Marvel Rivals")
-                        image_urls.append("https://cdn.marvel.com/content/1x/marvrivals_lob_crd_01.jpg")
-                        image_urls.append("https://www.marvelrivals.com/images/share-en.jpg")
-                    
-                    # Valorant
-                    elif 'valorant' in game_lower:
-                        print(f"✓ Detected Valorant")
-                        image_urls.append("https://images.contentstack.io/v3/assets/bltb6530b271fddd0b1/blt5c61cf2eb38b3d53/5eb26f413b2d42079e84200a/V_AGENTS_587x900_Jett.png")
-                        image_urls.append("https://playvalorant.com/assets/images/valorant-logo.png")
-                    
-                    # League of Legends
-                    elif 'league' in game_lower and 'legends' in game_lower:
-                        print(f"✓ Detected League of Legends")
-                        image_urls.append("https://lolstatic-a.akamaihd.net/frontpage/apps/prod/rg-league-display-2021/en_US/5f0f4e0d0ee3a67f3a7e5fa54e7ef20bdc0c7143/assets/images/logo.png")
-                    
-                    # Overwatch
-                    elif 'overwatch' in game_lower:
-                        print(f"✓ Detected Overwatch")
-                        image_urls.append("https://blz-contentstack-images.akamaized.net/v3/assets/blt9c12f249ac15c7ec/blt5a6b396c54b2b7b5/634f89c4e6d60c106d533909/ow-logo.png")
-                    
-                except Exception as e:
-                    print(f"  Special handling error: {e}")
+            image_urls, offline = self._discover_image_urls(game_name, clean_name, image_type)
             
             # ===== Try to download and process images =====
             if not image_urls:
                 print(f"✗ No image sources found for '{game_name}'")
+                if not offline:
+                    self.image_url_cache.remember_failure(url_key)
                 return None
             
             print(f"  Found {len(image_urls)} potential image sources")
             
+            all_gone = True
             for idx, source_url in enumerate(image_urls):
-                try:
-                    print(f"  → Trying source {idx+1}/{len(image_urls)}: {source_url[:70]}...")
-                    img_response = requests.get(source_url, timeout=10, headers=headers)
-                    
-                    if img_response.status_code == 200 and len(img_response.content) > 500:
-                        # Valid image data
-                        img_data = BytesIO(img_response.content)
-                        img = Image.open(img_data)
-                        
-                        # Convert to RGB if needed (some PNGs have alpha)
-                        if img.mode in ('RGBA', 'LA', 'P'):
-                            # Create white background
-                            background = Image.new('RGB', img.size, (255, 255, 255))
-                            if img.mode == 'P':
-                                img = img.convert('RGBA')
-                            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-                            img = background
-                        
-                        # Resize based on type - LARGER for better quality!
-                        if image_type == "icon":
-                            # Make icons nice and large (80x80 instead of 60x60)
-                            img = img.resize((80, 80), Image.Resampling.LANCZOS)
-                        else:
-                            # Cover - maintain aspect ratio
-                            img.thumbnail((230, 345), Image.Resampling.LANCZOS)
-                        
-                        photo = ImageTk.PhotoImage(img)
-                        self.image_cache[cache_key] = photo
-                        print(f"✓ Successfully loaded HIGH-QUALITY image for '{game_name}'")
-                        return photo
-                        
-                except Exception as e:
-                    print(f"  ✗ Failed: {str(e)[:50]}")
-                    continue
+                print(f"  → Trying source {idx+1}/{len(image_urls)}: {source_url[:70]}...")
+                photo, gone = self._download_image(source_url, cache_key, disk_key, image_type)
+                if photo:
+                    self.image_url_cache.remember(url_key, source_url)
+                    print(f"✓ Successfully loaded HIGH-QUALITY image for '{game_name}'")
+                    return photo
+                all_gone = all_gone and gone
             
-            # No images worked
+            # No images worked. Only remember that when every source definitively refused.
             print(f"✗ All image sources failed for '{game_name}'")
+            if not offline and all_gone:
+                self.image_url_cache.remember_failure(url_key)
             return None
             
         except Exception as e:
             print(f"✗ Error in fetch_game_image for '{game_name}': {e}")
             return None
 
+    def _download_image(self, source_url, cache_key, disk_key, image_type):
+        """
+        Download one candidate URL into the memory and disk caches.
+        Returns (photo, gone): photo is None on failure, and gone is True only when the
+        server definitively refused the URL (a 4xx other than 408/429, or no usable image).
+        Network errors, timeouts and 5xx responses are transient and leave gone False.
+        """
+        try:
+            img_response = get_http().get(source_url, timeout=10, headers=self.IMAGE_REQUEST_HEADERS)
+        except Exception as e:
+            print(f"  ✗ Failed: {str(e)[:50]}")
+            return None, False
+        status = img_response.status_code
+        if status != 200:
+            print(f"  ✗ Failed: HTTP {status}")
+            return None, 400 <= status < 500 and status not in (408, 429)
+        if len(img_response.content) <= 500:
+            return None, True
+        try:
+            data = self._make_thumbnail(img_response.content, image_type)
+            photo = self._photo_from_bytes(data)
+        except Exception as e:
+            print(f"  ✗ Failed: {str(e)[:50]}")
+            return None, True  # not an image we can decode
+        self.image_cache.put(cache_key, photo)
+        self.image_disk_cache.put(disk_key, data, source_url,
+                                  etag=img_response.headers.get('ETag'),
+                                  last_modified=img_response.headers.get('Last-Modified'))
+        return photo, False
+
+    def _discover_image_urls(self, game_name, clean_name, image_type):
+        """
+        Candidate cover/icon URLs for a game, best first.
+        Returns (urls, offline) - offline is True when the lookup services could not be reached.
+        """
+        http = get_http()
+        headers = self.IMAGE_REQUEST_HEADERS
+        image_urls = []
+        offline = False
+        
+        # ===== METHOD 1: Steam Community (BEST quality for Steam games) =====
+        try:
+            steam_search = clean_name.lower().replace(' ', '%20')
+            steam_url = f"https://steamcommunity.com/actions/SearchApps/{steam_search}"
+            
+            response = http.get(steam_url, headers=headers, timeout=5)
+            if response.status_code == 200:
+                steam_data = response.json()
+                if steam_data and len(steam_data) > 0:
+                    app_id = steam_data[0].get('appid')
+                    if app_id:
+                        print(f"✓ Found Steam App ID: {app_id}")
+                        
+                        if image_type == "icon":
+                            # PRIORITY ORDER: Best quality icons first!
+                            # 1. Library capsule (best quality, large)
+                            image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/capsule_184x69.jpg")
+                            image_urls.append(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/capsule_231x87.jpg")
+                            # 2. Logo from community (high quality)
+                            logo = steam_data[0].get('logo', '')
+                            if logo:
+                                image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steamcommunity/public/images/apps/{app_id}/{logo}.jpg")
+                            # 3. Header (good fallback)
+                            image_urls.append(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg")
+                        else:
+                            # For covers, get highest quality available
+                            image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900_2x.jpg")
+                            image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_600x900.jpg")
+                            image_urls.append(f"https://cdn.cloudflare.steamstatic.com/steam/apps/{app_id}/library_hero.jpg")
+                            image_urls.append(f"https://cdn.akamai.steamstatic.com/steam/apps/{app_id}/header.jpg")
+        
+        except http.connection_error as e:
+            offline = True
+            print(f"  Steam search error: {e}")
+        except Exception as e:
+            print(f"  Steam search error: {e}")
+        
+        # ===== METHOD 2: RAWG API (Good for non-Steam games) =====
+        if not image_urls or len(image_urls) == 0:
+            try:
+                # RAWG has good coverage for all platforms
+                rawg_search = clean_name.lower().replace(' ', '-').replace("'", "")
+                rawg_url = f"https://api.rawg.io/api/games/{rawg_search}"
+                
+                response = http.get(rawg_url, headers=headers, timeout=5)
+                if response.status_code == 200:
+                    rawg_data = response.json()
+                    
+                    # Get background image (usually high quality)
+                    bg_image = rawg_data.get('background_image')
+                    if bg_image:
+                        print(f"✓ Found RAWG image")
+                        image_urls.append(bg_image)
+                    
+                    # Get additional background
+                    bg_add = rawg_data.get('background_image_additional')
+                    if bg_add:
+                        image_urls.append(bg_add)
+                else:
+                    # Try with spaces instead of dashes
+                    rawg_search2 = clean_name.lower().replace(' ', '%20')
+                    rawg_url2 = f"https://api.rawg.io/api/games?search={rawg_search2}"
+                    
+                    response2 = http.get(rawg_url2, headers=headers, timeout=5)
+                    if response2.status_code == 200:
+                        rawg_data2 = response2.json()
+                        results = rawg_data2.get('results', [])
+                        if results and len(results) > 0:
+                            print(f"✓ Found RAWG game via search")
+                            bg_image = results[0].get('background_image')
+                            if bg_image:
+                                image_urls.append(bg_image)
+            
+            except Exception as e:
+                print(f"  RAWG search error: {e}")
+        
+        # ===== METHOD 3: Epic Games Store (for Epic games) =====
+        if not image_urls and any(x in game_name.lower() for x in ['fortnite', 'rocket league', 'fall guys']):
+            try:
+                # Common Epic Games images
+                epic_game_ids = {
+                    'fortnite': 'fortnite',
+                    'rocket league': 'sugar',
+                    'fall guys': 'fallguys'
+                }
+                
+                for game_key, game_id in epic_game_ids.items():
+                    if game_key in clean_name.lower():
+                        print(f"✓ Detected Epic game: {game_key}")
+                        # Epic CDN URLs
+                        if image_type == "icon":
+                            image_urls.append(f"https://cdn2.unrealengine.com/{game_id}-logo.png")
+                        image_urls.append(f"https://cdn2.unrealengine.com/{game_id}-keyart.jpg")
+                        break
+            
+            except Exception as e:
+                print(f"  Epic search error: {e}")
+        
+        # ===== METHOD 4: Special handling for known games =====
+        if not image_urls:
+            try:
+                game_lower = clean_name.lower()
+                
+                # Marvel Rivals
+                if 'marvel' in game_lower and 'rivals' in game_lower:
+                    print(f"✓ Detected Marvel Rivals")
+                    image_urls.append("https://cdn.marvel.com/content/1x/marvrivals_lob_crd_01.jpg")
+                    image_urls.append("https://www.marvelrivals.com/images/share-en.jpg")
+                
+                # Valorant
+                elif 'valorant' in game_lower:
+                    print(f"✓ Detected Valorant")
+                    image_urls.append("https://images.contentstack.io/v3/assets/bltb6530b271fddd0b1/blt5c61cf2eb38b3d53/5eb26f413b2d42079e84200a/V_AGENTS_587x900_Jett.png")
+                    image_urls.append("https://playvalorant.com/assets/images/valorant-logo.png")
+                
+                # League of Legends
+                elif 'league' in game_lower and 'legends' in game_lower:
+                    print(f"✓ Detected League of Legends")
+                    image_urls.append("https://lolstatic-a.akamaihd.net/frontpage/apps/prod/rg-league-display-2021/en_US/5f0f4e0d0ee3a67f3a7e5fa54e7ef20bdc0c7143/assets/images/logo.png")
+                
+                # Overwatch
+                elif 'overwatch' in game_lower:
+                    print(f"✓ Detected Overwatch")
+                    image_urls.append("https://blz-contentstack-images.akamaized.net/v3/assets/blt9c12f249ac15c7ec/blt5a6b396c54b2b7b5/634f89c4e6d60c106d533909/ow-logo.png")
+            
+            except Exception as e:
+                print(f"  Special handling error: {e}")
+        
+        return image_urls, offline
+
+    def _make_thumbnail(self, content: bytes, image_type: str) -> bytes:
+        """Decode downloaded image bytes, flatten alpha, resize and return PNG bytes"""
+        from io import BytesIO
+        from PIL import Image
+        img = Image.open(BytesIO(content))
+        
+        # Convert to RGB if needed (some PNGs have alpha)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # Create white background
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+            img = background
+        elif img.mode != 'RGB':
+            img = img.convert('RGB')
+        
+        # Resize based on type - LARGER for better quality!
+        size = self.IMAGE_SIZES.get(image_type, (80, 80))
+        if image_type == "icon":
+            # Make icons nice and large (80x80 instead of 60x60)
+            img = img.resize(size, Image.Resampling.LANCZOS)
+        else:
+            # Cover - maintain aspect ratio
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+        
+        out = BytesIO()
+        img.save(out, format='PNG')
+        return out.getvalue()
+    
+    def _photo_from_bytes(self, data: bytes):
+        from io import BytesIO
+        from PIL import Image, ImageTk
+        return ImageTk.PhotoImage(Image.open(BytesIO(data)))
+    
+    def _revalidate_thumbnail(self, disk_key: str, entry: dict, image_type: str):
+        """Conditional GET against the thumbnail's source. Returns new bytes if it changed."""
+        if not entry.get('url'):
+            return None
+        try:
+            headers = dict(self.IMAGE_REQUEST_HEADERS)
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            response = get_http().get(entry['url'], headers=headers, timeout=10)
+            if response.status_code == 304:
+                self.image_disk_cache.mark_fresh(disk_key)
+                return None
+            if response.status_code == 200 and len(response.content) > 500:
+                data = self._make_thumbnail(response.content, image_type)
+                self.image_disk_cache.put(disk_key, data, entry['url'],
+                                          etag=response.headers.get('ETag'),
+                                          last_modified=response.headers.get('Last-Modified'))
+                return data
+        except Exception:
+            pass
+        return None
+
     # ---------- scanning / UI helpers ----------
     def scan(self):
         self.status.config(text="Scanning all drives for games...", fg="#60a5fa")
         self.root.update()
+        from collections import deque
+        self._scan_buffer = deque()  # filled by scanner threads, drained on the main thread
+        self._scan_partial = []
+        self._scanners_done = 0
+        self._scanning = True
         threading.Thread(target=self._do_scan, daemon=True).start()
+        self.root.after(self.SCAN_BATCH_MS, self._flush_scan_batch)
 
     def _do_scan(self):
         # Preserve manually added games (those with "Other" platform)
         manual_games = [g for g in self.games if g.platform == "Other"]
         
-        # Scan for new games
-        scanned_games = self.scanner.scan_all()
+        # Scan for new games; games are streamed into the view as they are found
+        scanned_games = self.scanner.scan_all(
+            on_result=lambda r: self.root.after(0, lambda: self._on_scanner_done(r)),
+            on_game=self._scan_buffer.append)
         
         # Merge manual games with scanned games (avoid duplicates by name)
         scanned_names = {g.name.lower() for g in scanned_games}
@@ -1886,66 +4640,223 @@ class GUI:
         gc.collect()
         self.root.after(0, self._finish_scan)
 
+    def _on_scanner_done(self, result):
+        """Called on the main thread each time one launcher scanner finishes"""
+        self._scanners_done += 1
+        progress = f"({self._scanners_done}/{len(self.scanner.scanners())} launchers)"
+        if result.error:
+            self.status.config(text=f"{result.scanner} scan failed: {result.error} {progress}",
+                               fg=self.colors['accent_orange'])
+        else:
+            self.status.config(text=f"Scanning... {result.scanner}: {len(result.games)} games "
+                                    f"in {result.duration:.1f}s {progress}", fg="#60a5fa")
+
+    def _flush_scan_batch(self):
+        """Append the games found since the last flush to the view, every SCAN_BATCH_MS while scanning"""
+        if not self._scanning:
+            return
+        batch = []
+        while self._scan_buffer:
+            batch.append(self._scan_buffer.popleft())
+        if batch:
+            # Streamed games go through the active search / platform filter like display() input
+            shown = [g for g in batch if self._matches_filter(g)]
+            if not self._scan_partial:
+                # First games of this scan replace whatever was shown before
+                self._scan_partial.extend(batch)
+                self.filtered = shown
+                self.display()
+            else:
+                self._scan_partial.extend(batch)
+                if shown:
+                    self.filtered.extend(shown)
+                    self.append_cards(shown)
+        self.root.after(self.SCAN_BATCH_MS, self._flush_scan_batch)
+
     def _finish_scan(self):
-        self.filtered = self.games.copy()
+        self._scanning = False
+        self._scan_buffer.clear()
+        self.filtered = [g for g in self.games if self._matches_filter(g)]
         manual_count = len([g for g in self.games if g.platform == "Other"])
         if manual_count > 0:
             self.status.config(text=f"Found {len(self.games)} games ({manual_count} manually added)", fg="#10b981")
         else:
             self.status.config(text=f"Found {len(self.games)} games across all platforms", fg="#10b981")
         self.display()
+        if self.twitch.is_authenticated() and not self.daemon:
+            threading.Thread(target=self.twitch.prefetch_categories,
+                             args=([g.name for g in self.games],), daemon=True).start()
         # Auto-start monitor after scan if Twitch is authenticated
         self.root.after(500, self.auto_start_monitor)
 
+    def _matches_filter(self, game) -> bool:
+        """Whether game passes the current search text and platform choice"""
+        search = self.search_var.get().lower().strip()
+        platform = self.platform_var.get()
+        return search in game.name.lower() and (platform == "All Platforms" or game.platform == platform)
+
     def filter(self):
         search = self.search_var.get().lower().strip()
         platform = self.platform_var.get()
+        # While scanning, the view holds the games streamed in so far
+        games = self._scan_partial if getattr(self, '_scanning', False) else self.games
         
         # If no games loaded yet, show a helpful message
-        if not self.games:
+        if not games:
             self.status.config(text="No games loaded - please scan first!", fg="#f59e0b")
             self.filtered = []
             self.display()
             return
         
         # Apply filters
-        self.filtered = [g for g in self.games if search in g.name.lower() and (platform == "All Platforms" or g.platform == platform)]
+        self.filtered = [g for g in games if self._matches_filter(g)]
         
         # Update status with search results
         if search or platform != "All Platforms":
-            total = len(self.games)
+            total = len(games)
             found = len(self.filtered)
             if found == 0:
                 self.status.config(text=f"No games match your search (0/{total})", fg="#f59e0b")
             else:
                 self.status.config(text=f"Showing {found} of {total} games", fg="#60a5fa")
         else:
-            self.status.config(text=f"Showing all {len(self.games)} games", fg="#10b981")
+            self.status.config(text=f"Showing all {len(games)} games", fg="#10b981")
         
         self.display()
 
     def display(self):
-        for w in self.games_frame.winfo_children():
-            w.destroy()
-        # Don't clear image_cache here - keep images cached
-        gc.collect()
-        
-        if not self.filtered:
-            empty_frame = tk.Frame(self.games_frame, bg=self.colors['bg_dark'])
-            empty_frame.pack(expand=True, fill="both", pady=100)
-            
-            # Smooth empty state
-            tk.Label(empty_frame, text="No games found", font=("Segoe UI", 24, "bold"),
-                    bg=self.colors['bg_dark'], fg=self.colors['text_primary']).pack(pady=(0, 12))
-            tk.Label(empty_frame, text="Click 'Scan' to discover your games",
-                    font=("Segoe UI", 12), bg=self.colors['bg_dark'],
-                    fg=self.colors['text_secondary']).pack()
+        """Show self.filtered from the top. Only the rows in view get (recycled) widgets."""
+        self.canvas.yview_moveto(0)
+        self._layout_view(rebind=True)
+
+    def _card_mode(self) -> str:
+        return "grid" if self.view_mode.get() == "grid" else "list"
+
+    def _layout_view(self, rebind=False):
+        """Recompute scroll height / grid columns for the current list and refresh visible rows"""
+        width = max(self.canvas.winfo_width(), 1)
+        count = len(self.filtered)
+        if self._card_mode() == "grid":
+            self._grid_columns = max(1, (width - 2 * self.GRID_PADDING) // self.GRID_CELL_WIDTH)
+            rows = -(-count // self._grid_columns)
+            height = rows * self.GRID_ROW_HEIGHT + 2 * self.GRID_PADDING
+        else:
+            self._grid_columns = 1
+            height = count * self.LIST_ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, width, max(height, 1)))
+
+        if rebind:
+            self._release_cards(list(self._visible_cards))
+        self._refresh_visible(force_position=True)
+        if rebind:
+            # Filter/view changed: decoded images for games no longer shown can go
+            self.image_cache.retain_only(self._visible_image_keys())
+
+    def _visible_image_keys(self):
+        image_type = "cover" if self._card_mode() == "grid" else "icon"
+        return [f"{card.game.name}_{image_type}" for card in self._visible_cards.values()]
+
+    def _card_type_mode(self, card) -> str:
+        return "grid" if isinstance(card, GameGridCard) else "list"
+
+    def _on_canvas_scroll(self, first, last):
+        """yscrollcommand: keep the scrollbar in sync and re-render once per idle cycle"""
+        self.scrollbar.set(first, last)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after_idle(self._refresh_visible)
+
+    def _release_cards(self, indices):
+        for idx in indices:
+            card = self._visible_cards.pop(idx)
+            self.image_loader.cancel(card.image_ticket)
+            card.image_ticket = None
+            self.canvas.itemconfigure(card.item, state="hidden")
+            self._card_pools[self._card_type_mode(card)].append(card)
+
+    def _acquire_card(self):
+        mode = self._card_mode()
+        pool = self._card_pools[mode]
+        if pool:
+            return pool.pop()
+        return GameGridCard(self) if mode == "grid" else GameListRow(self)
+
+    def _refresh_visible(self, force_position=False):
+        """Bind cards to the rows inside the viewport (plus OVERSCAN_ROWS) and hide the rest"""
+        self._refresh_pending = False
+        count = len(self.filtered)
+        if not count:
+            self._release_cards(list(self._visible_cards))
+            self.canvas.coords(self.empty_item, max(self.canvas.winfo_width(), 1) // 2, 100)
+            self.canvas.itemconfigure(self.empty_item, state="normal")
             return
-        
-        if self.view_mode.get() == "grid":
-            self.display_grid()
+        self.canvas.itemconfigure(self.empty_item, state="hidden")
+
+        grid = self._card_mode() == "grid"
+        cols = self._grid_columns
+        row_height = self.GRID_ROW_HEIGHT if grid else self.LIST_ROW_HEIGHT
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int(top // row_height) - self.OVERSCAN_ROWS)
+        last_row = int(bottom // row_height) + self.OVERSCAN_ROWS
+        wanted = range(first_row * cols, min(count, (last_row + 1) * cols))
+        # Images for on-screen rows load before the overscan rows
+        on_screen = range(int(top // row_height) * cols, (int(bottom // row_height) + 1) * cols)
+
+        stale = [idx for idx, card in self._visible_cards.items()
+                 if idx not in wanted or card.game is not self.filtered[idx]]
+        self._release_cards(stale)
+
+        width = max(self.canvas.winfo_width(), 1)
+        for idx in wanted:
+            card = self._visible_cards.get(idx)
+            is_new = card is None
+            if is_new:
+                card = self._acquire_card()
+                priority = 0 if idx in on_screen else 1
+                if card.game is not self.filtered[idx]:
+                    card.bind(self.filtered[idx], priority)
+                elif card.image_ticket is None and not self._card_has_image(card):
+                    self.load_card_image(card, "cover" if grid else "icon", priority)
+                self._visible_cards[idx] = card
+            if is_new or force_position:
+                if grid:
+                    row, col = divmod(idx, cols)
+                    x = self.GRID_PADDING + col * self.GRID_CELL_WIDTH + 10
+                    y = self.GRID_PADDING + row * self.GRID_ROW_HEIGHT + 20
+                    self.canvas.coords(card.item, x, y)
+                    self.canvas.itemconfigure(card.item, state="normal")
+                else:
+                    self.canvas.coords(card.item, 6, idx * self.LIST_ROW_HEIGHT + 4)
+                    self.canvas.itemconfigure(card.item, width=width - 12, state="normal")
+
+    def load_card_image(self, card, image_type, priority: int = 0):
+        """Show the cached cover/icon for card.game, or queue it on the image loader"""
+        game = card.game
+        self.image_loader.cancel(card.image_ticket)
+        card.image_ticket = None
+        photo = self.image_cache.get(f"{game.name}_{image_type}")
+        if photo:
+            card.set_image(photo)
+            return
+        card.image_ticket = self.image_loader.request(
+            game.name, image_type,
+            lambda photo: self.root.after(0, lambda: self._apply_card_image(card, game, photo)),
+            priority)
+
+    def _card_has_image(self, card) -> bool:
+        label = card.cover if isinstance(card, GameGridCard) else card.icon
+        return bool(label.cget("image") or label.cget("text"))
+
+    def _apply_card_image(self, card, game, photo):
+        # The card may have been recycled for another game while loading
+        if card.game is not game:
+            return
+        card.image_ticket = None
+        if photo:
+            card.set_image(photo)
         else:
-            self.display_list()
+            card.set_fallback()
     
     def show_modern_dialog(self, title, message, dialog_type="info", callback=None):
         """Create a smooth modern custom dialog"""
@@ -2022,235 +4933,9 @@ class GUI:
         y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
         dialog.geometry(f"+{x}+{y}")
     
-    def display_grid(self):
-        """Display games in grid view with smooth, rounded card styling"""
-        # Calculate columns based on window width
-        cols = 5  # Default 5 columns
-        
-        platform_colors = {
-            "Steam": "#2563eb",
-            "Epic Games": "#0ea5e9",
-            "GOG": "#a855f7",
-            "Riot Games": "#ef4444",
-            "Xbox": "#10b981",
-            "Battle.net": "#0891b2",
-            "Other": "#6b7280"
-        }
-        
-        row_frame = None
-        for idx, game in enumerate(self.filtered):
-            if idx % cols == 0:
-                row_frame = tk.Frame(self.games_frame, bg=self.colors['bg_dark'])
-                row_frame.pack(fill="x", pady=10, padx=10)
-            
-            # Card container with smooth, soft shadow effect
-            card_container = tk.Frame(row_frame, bg=self.colors['bg_dark'])
-            card_container.pack(side="left", padx=10, pady=10)
-            
-            # Main card with smooth, rounded styling (no harsh borders)
-            card = tk.Frame(card_container, bg=self.colors['bg_card'], 
-                           highlightthickness=0,
-                           width=230, height=370)
-            card.pack()
-            card.pack_propagate(False)
-            
-            # Image container with smooth background
-            img_frame = tk.Frame(card, bg=self.colors['bg_hover'], width=220, height=310)
-            img_frame.pack(padx=5, pady=5)
-            img_frame.pack_propagate(False)
-            
-            # Try to fetch cover with proper caching
-            def load_cover(g=game, frame=img_frame):
-                try:
-                    photo = self.fetch_game_image(g.name, "cover")
-                    if photo:
-                        # Schedule UI update on main thread
-                        self.root.after(0, lambda p=photo, f=frame: self._update_cover(p, f))
-                    else:
-                        # Fallback: show game name with smooth gradient background
-                        self.root.after(0, lambda: self._create_fallback_cover(g, frame))
-                except Exception:
-                    # On error, create fallback
-                    self.root.after(0, lambda: self._create_fallback_cover(g, frame))
-            
-            # Load image in background
-            threading.Thread(target=load_cover, daemon=True).start()
-            
-            # Info section below image
-            info_frame = tk.Frame(card, bg=self.colors['bg_card'])
-            info_frame.pack(fill="x", padx=10, pady=(0, 10))
-            
-            # Game name (truncated if too long)
-            name_text = game.name[:30] + "..." if len(game.name) > 30 else game.name
-            name_label = tk.Label(info_frame, text=name_text,
-                                 font=("Segoe UI", 10, "bold"), bg=self.colors['bg_card'],
-                                 fg=self.colors['text_primary'], anchor="w")
-            name_label.pack(fill="x", pady=(0, 6))
-            
-            # Platform badge with smooth rounded color
-            accent_color = platform_colors.get(game.platform, self.colors['border'])
-            badge = tk.Label(info_frame, text=game.platform, font=("Segoe UI", 8, "bold"),
-                           bg=accent_color, fg=self.colors['text_primary'], 
-                           padx=10, pady=4)
-            badge.pack(anchor="w")
-            
-            # Add smooth hover effects to card
-            def on_enter(e, c=card):
-                c.config(bg=self.colors['bg_hover'])
-                info_frame.config(bg=self.colors['bg_hover'])
-                name_label.config(bg=self.colors['bg_hover'])
-            
-            def on_leave(e, c=card):
-                c.config(bg=self.colors['bg_card'])
-                info_frame.config(bg=self.colors['bg_card'])
-                name_label.config(bg=self.colors['bg_card'])
-            
-            card.bind("<Enter>", on_enter)
-            card.bind("<Leave>", on_leave)
-    
-    def _update_cover(self, photo, frame):
-        """Update cover image on main thread"""
-        for widget in frame.winfo_children():
-            widget.destroy()
-        label = tk.Label(frame, image=photo, bg=self.colors['bg_hover'])
-        label.pack(expand=True)
-    
-    def _create_fallback_cover(self, game, frame):
-        """Create fallback cover when image fetch fails"""
-        for widget in frame.winfo_children():
-            widget.destroy()
-        
-        # Create a nice gradient-like fallback with game initial
-        fallback_frame = tk.Frame(frame, bg=self.colors['bg_medium'])
-        fallback_frame.pack(expand=True, fill="both")
-        
-        # Game initial in large font
-        initial = tk.Label(fallback_frame, text=game.name[0].upper(),
-                          font=("Segoe UI", 72, "bold"),
-                          bg=self.colors['bg_medium'], fg=self.colors['accent_purple'])
-        initial.pack(expand=True)
-        
-        # Game name at bottom
-        name_text = game.name[:20] + "..." if len(game.name) > 20 else game.name
-        name_label = tk.Label(fallback_frame, text=name_text,
-                             font=("Segoe UI", 10, "bold"), 
-                             bg=self.colors['bg_medium'],
-                             fg=self.colors['text_primary'], wraplength=190)
-        name_label.pack(side="bottom", pady=10)
-    
-    def display_list(self):
-        """Display games in list view with smooth, rounded styling and HIGH-QUALITY icons"""
-        platform_colors = {
-            "Steam": "#2563eb",
-            "Epic Games": "#0ea5e9",
-            "GOG": "#a855f7",
-            "Riot Games": "#ef4444",
-            "Xbox": "#10b981",
-            "Battle.net": "#0891b2",
-            "Other": "#6b7280"
-        }
-        
-        for game in self.filtered:
-            # Outer container for smooth shadow effect
-            card = tk.Frame(self.games_frame, bg=self.colors['bg_dark'])
-            card.pack(fill="x", pady=4, padx=6)
-            
-            # Inner card with smooth rounded feel (no harsh borders)
-            card_inner = tk.Frame(card, bg=self.colors['bg_card'], 
-                                 highlightthickness=0)
-            card_inner.pack(fill="x")
-            
-            # Platform accent bar (smooth, slightly thicker)
-            accent_color = platform_colors.get(game.platform, self.colors['border'])
-            accent = tk.Frame(card_inner, bg=accent_color, width=5)
-            accent.pack(side="left", fill="y")
-            
-            # Icon container - LARGER for better quality icons (80x80)
-            icon_frame = tk.Frame(card_inner, bg=self.colors['bg_hover'], width=80, height=80)
-            icon_frame.pack(side="left", padx=18, pady=18)
-            icon_frame.pack_propagate(False)
-            
-            # Try to fetch HIGH-QUALITY icon with proper caching
-            def load_icon(g=game, frame=icon_frame, accent_col=accent_color):
-                try:
-                    photo = self.fetch_game_image(g.name, "icon")
-                    if photo:
-                        # Schedule UI update on main thread
-                        self.root.after(0, lambda p=photo, f=frame: self._update_icon(p, f))
-                    else:
-                        # Fallback: show first letter with smooth background
-                        self.root.after(0, lambda: self._create_fallback_icon(g, frame, accent_col))
-                except Exception as e:
-                    # On error, create fallback
-                    self.root.after(0, lambda: self._create_fallback_icon(g, frame, accent_col))
-            
-            # Load icon in background
-            threading.Thread(target=load_icon, daemon=True).start()
-            
-            # Content section
-            content = tk.Frame(card_inner, bg=self.colors['bg_card'])
-            content.pack(side="left", fill="both", expand=True, padx=24, pady=18)
-            
-            # Game name with smooth, larger font
-            tk.Label(content, text=game.name, font=("Segoe UI", 13, "bold"),
-                    bg=self.colors['bg_card'], fg=self.colors['text_primary'],
-                    anchor="w").pack(anchor="w")
-            
-            # Details row
-            details = tk.Frame(content, bg=self.colors['bg_card'])
-            details.pack(anchor="w", pady=(8, 0))
-            
-            # Platform badge with smooth rounded corners effect
-            badge = tk.Label(details, text=f"  {game.platform}  ", font=("Segoe UI", 9, "bold"),
-                           bg=accent_color, fg=self.colors['text_primary'],
-                           padx=12, pady=5)
-            badge.pack(side="left", padx=(0, 12))
-            
-            # Path info (shortened)
-            path_text = game.path if len(game.path) < 60 else "..." + game.path[-57:]
-            tk.Label(details, text=path_text, font=("Segoe UI", 9),
-                    bg=self.colors['bg_card'], fg=self.colors['text_secondary']).pack(side="left")
-            
-            # Remove button with smooth styling
-            remove_btn = tk.Button(card_inner, text="✕", command=lambda g=game: self.remove(g),
-                                  font=("Segoe UI", 12, "bold"), bg=self.colors['accent_red'],
-                                  fg=self.colors['text_primary'], activebackground="#dc2626",
-                                  relief="flat", padx=18, pady=12, cursor="hand2", borderwidth=0)
-            remove_btn.pack(side="right", padx=18, pady=15)
-            
-            # Add smooth hover effect
-            def on_enter(e):
-                card_inner.config(bg=self.colors['bg_hover'])
-                content.config(bg=self.colors['bg_hover'])
-                for child in details.winfo_children():
-                    if isinstance(child, tk.Label) and child != badge:
-                        child.config(bg=self.colors['bg_hover'])
-            
-            def on_leave(e):
-                card_inner.config(bg=self.colors['bg_card'])
-                content.config(bg=self.colors['bg_card'])
-                for child in details.winfo_children():
-                    if isinstance(child, tk.Label) and child != badge:
-                        child.config(bg=self.colors['bg_card'])
-            
-            card_inner.bind("<Enter>", on_enter)
-            card_inner.bind("<Leave>", on_leave)
-    
-    def _update_icon(self, photo, frame):
-        """Update icon on main thread"""
-        for widget in frame.winfo_children():
-            widget.destroy()
-        label = tk.Label(frame, image=photo, bg=self.colors['bg_hover'])
-        label.pack(expand=True)
-    
-    def _create_fallback_icon(self, game, frame, accent_color):
-        """Create fallback icon when image fetch fails - larger size for better appearance"""
-        for widget in frame.winfo_children():
-            widget.destroy()
-        fallback = tk.Label(frame, text=game.name[0].upper(),
-                          font=("Segoe UI", 24, "bold"),  # Larger font for 80x80 icon
-                          bg=accent_color, fg=self.colors['text_primary'])
-        fallback.pack(expand=True, fill="both")
+    def append_cards(self, games):
+        """Make games just appended to self.filtered scrollable without resetting the view"""
+        self._layout_view()
 
     def remove(self, game):
         def on_confirm(result):
@@ -2259,7 +4944,7 @@ class GUI:
                 self.games = [g for g in self.games if g.name != game.name]
                 self.filtered = [g for g in self.filtered if g.name != game.name]
                 self.save_cache()
-                self.display()
+                self._layout_view(rebind=True)
                 self.status.config(text=f"✓ Removed {game.name}", fg=self.colors['accent_orange'])
         
         self.show_modern_dialog(
@@ -2275,10 +4960,50 @@ class GUI:
         # 1. Twitch is authenticated and enabled
         # 2. Games have been loaded (from cache or scan)
         # 3. Monitor is not already running
+        if self.monitor and self.monitor.active:
+            return
+        if self.daemon:
+            # Ask the service off the Tk thread; the answer decides who monitors
+            self.daemon_call(["status"], self._on_daemon_status)
+            return
+        # Look for a service (it may have started since the last look) off the Tk thread
+        threading.Thread(target=lambda: self.root.after(0, self._on_daemon_found, DaemonClient.find()),
+                         daemon=True).start()
+
+    def _on_daemon_found(self, daemon: Optional[DaemonClient]):
+        self._set_daemon(daemon)
+        self._on_daemon_status(True if daemon else None)
+
+    def _set_daemon(self, daemon: Optional[DaemonClient]):
+        """Attach to (or detach from) the service; whoever monitors also rotates the tokens"""
+        self.daemon = daemon
+        if self.twitch.background_refresh != (daemon is None):
+            self.twitch.background_refresh = daemon is None
+            self.twitch.reload_tokens()  # ours may be a pair the service has rotated since
+
+    def _on_daemon_status(self, daemon_status):
+        if daemon_status is None and self.daemon:
+            # The service went away - monitor from the GUI process again
+            self._set_daemon(None)
+        if self.daemon:
+            self.status.config(text="● Monitoring runs in the background service",
+                               fg=self.colors['accent_green'])
+        else:
+            self._start_local_monitor()
+        if 'monitoring' not in self.startup_times:
+            self._mark_startup('monitoring')
+            if STARTUP_BENCHMARK:
+                print("STARTUP " + json.dumps({stage: round(t * 1000, 1) for stage, t in self.startup_times.items()}))
+                self.app_is_closing = True
+                self.stop_local_monitor()
+                self.root.after(0, self.root.destroy)
+
+    def _start_local_monitor(self):
         if self.twitch.is_authenticated() and self.games and not (self.monitor and self.monitor.active):
             try:
                 self.monitor = GameMonitor(self.games, self.twitch, self.update_status)
                 self.monitor.start()
+                self._claim_monitor()
                 
                 # Show different message based on startup mode
                 if STARTUP_MODE:
@@ -2288,8 +5013,26 @@ class GUI:
                     self.status.config(text="● Monitoring active - Game launches will update Twitch", 
                                      fg=self.colors['accent_green'])
             except Exception as e:
-                # Silently fail if auto-start doesn't work
-                pass
+                # Not fatal: the user can still start monitoring from the Twitch settings
+                print(f"Auto-start monitor failed: {e}")
+
+    def _claim_monitor(self):
+        """Publish GUI_MONITOR_FILE so a --daemon started now won't run a second monitor"""
+        try:
+            with open(GUI_MONITOR_FILE, 'w') as f:
+                json.dump({'pid': os.getpid()}, f)
+        except Exception:
+            pass
+
+    def stop_local_monitor(self):
+        if self.monitor and self.monitor.active:
+            self.monitor.stop()
+        try:
+            with open(GUI_MONITOR_FILE, 'r') as f:
+                if json.load(f).get('pid') == os.getpid():
+                    GUI_MONITOR_FILE.unlink()
+        except Exception:
+            pass
 
     def update_status(self, text, color):
         self.root.after(0, lambda: self.status.config(text=text, fg=color))
@@ -2384,6 +5127,7 @@ class GUI:
                         "success"
                     ))
                     # Auto-start monitoring after successful authentication
+                    self.notify_daemon()
                     self.root.after(100, self.auto_start_monitor)
                     dialog.destroy()
                 else:
@@ -2403,6 +5147,7 @@ class GUI:
 
         def save():
             self.twitch.update_config(channel_entry.get().strip(), enabled_var.get())
+            self.notify_daemon()
             self.show_modern_dialog(
                 "Settings Saved",
                 "Your Twitch settings have been saved successfully!",
@@ -2534,6 +5279,12 @@ class GUI:
         dialog.transient(self.root)
         dialog.grab_set()
         tk.Label(dialog, text="🗑️ Excluded Games", font=("Segoe UI", 18, "bold"), bg="#0f1629", fg="#ef4444").pack(pady=20)
+        # Scan option: launcher records only (fast) or also sweep drives for Riot / Battle.net games
+        sweep_var = tk.BooleanVar(value=self.scanner.drive_sweep)
+        tk.Checkbutton(dialog, text="Also search every drive for Riot / Battle.net games (slower scans)",
+                       variable=sweep_var, command=lambda: self.scanner.set_drive_sweep(sweep_var.get()),
+                       font=("Segoe UI", 10), bg="#0f1629", fg="#9ca3af", selectcolor="#1a1f3a",
+                       activebackground="#0f1629", activeforeground="#f3f4f6", borderwidth=0).pack(side="bottom", pady=(0, 12))
         if not excluded_list:
             tk.Label(dialog, text="No excluded games", font=("Segoe UI", 12), bg="#0f1629", fg="#6b7280").pack(pady=50)
             tk.Button(dialog, text="Close", command=dialog.destroy, font=("Segoe UI", 11, "bold"), bg="#374151", fg="#ffffff", relief="flat", padx=30, pady=10, cursor="hand2", borderwidth=0).pack(pady=20)
@@ -2562,28 +5313,109 @@ class GUI:
             tk.Button(item_frame, text="↩️ Restore", command=restore_game, font=("Segoe UI", 9, "bold"), bg="#10b981", fg="#ffffff", activebackground="#059669", relief="flat", padx=15, pady=6, cursor="hand2", borderwidth=0).pack(side="right", padx=10)
         tk.Button(dialog, text="Close", command=dialog.destroy, font=("Segoe UI", 11, "bold"), bg="#374151", fg="#ffffff", relief="flat", padx=30, pady=10, cursor="hand2", borderwidth=0).pack(pady=(0, 20))
 
+    def show_diagnostics(self):
+        """Live view of METRICS, refreshed every second while open"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Diagnostics")
+        dialog.geometry("620x560")
+        dialog.configure(bg="#0f1629")
+        dialog.transient(self.root)
+        tk.Label(dialog, text="Diagnostics", font=("Segoe UI", 18, "bold"), bg="#0f1629", fg="#60a5fa").pack(pady=(20, 5))
+        log_file = DAEMON_METRICS_LOG_FILE if self.daemon else METRICS_LOG_FILE
+        tk.Label(dialog, text=f"Structured log: {log_file}", font=("Segoe UI", 9), bg="#0f1629", fg="#6b7280", wraplength=560).pack(pady=(0, 10))
+        text = tk.Text(dialog, font=("Consolas", 10), bg="#151b2e", fg="#f3f4f6", relief="flat", borderwidth=0, padx=12, pady=10)
+        text.pack(fill="both", expand=True, padx=20, pady=(0, 10))
+        tk.Button(dialog, text="Close", command=dialog.destroy, font=("Segoe UI", 11, "bold"), bg="#374151", fg="#ffffff", relief="flat", padx=30, pady=10, cursor="hand2", borderwidth=0).pack(pady=(0, 20))
+
+        def refresh():
+            if not dialog.winfo_exists():
+                return
+            if self.daemon:
+                # Monitor metrics live in the service process; fetch them off the Tk thread
+                self.daemon_call(["status", "metrics"], show)
+            else:
+                show(None, None)
+
+        def show(daemon_status, daemon_metrics):
+            if not dialog.winfo_exists():
+                return
+            text.config(state="normal")
+            text.delete("1.0", "end")
+            text.insert("end", self.format_diagnostics(daemon_status, daemon_metrics))
+            text.config(state="disabled")
+            dialog.after(1000, refresh)
+
+        refresh()
+
+    def format_diagnostics(self, daemon_status: Optional[dict] = None, daemon_metrics: Optional[dict] = None) -> str:
+        """Diagnostics text; pass the service's status/metrics replies when a daemon is attached"""
+        if daemon_status:
+            snap = daemon_metrics or METRICS.snapshot()
+            monitor_state = "active" if daemon_status.get('active') else "inactive"
+            source = f"{daemon_status.get('source', '-')}, background service pid {daemon_status.get('pid')}"
+        else:
+            snap = METRICS.snapshot()
+            monitor_state = "active" if self.monitor and self.monitor.active else "inactive"
+            source = type(self.monitor.event_source).__name__ if self.monitor and self.monitor.event_source else "-"
+        lines = [f"Uptime {snap['uptime'] / 60:.1f} min   Threads {snap['threads']}   Monitor {monitor_state} ({source})", ""]
+
+        lines.append("Timings                      count     last      avg      max")
+        for name, t in sorted(snap['timings'].items()):
+            lines.append(f"  {name:<26}{t['count']:>6}{t['last'] * 1000:>8.1f}ms{t['avg'] * 1000:>7.1f}ms{t['max'] * 1000:>7.1f}ms")
+        if snap['gauges']:
+            lines += ["", "Gauges"]
+            lines += [f"  {name:<26}{value}" for name, value in sorted(snap['gauges'].items())]
+        if snap['counters']:
+            lines += ["", "Counters"]
+            lines += [f"  {name:<26}{value}" for name, value in sorted(snap['counters'].items())]
+        images = self.image_cache.stats()
+        lines += ["", f"Image cache  {images['entries']} images, {images['bytes'] // 1024} KB, "
+                      f"{images['hits']} hits / {images['misses']} misses / {images['evictions']} evictions"]
+        if snap['recent']:
+            lines += ["", "Recent events"]
+            for record in reversed(snap['recent'][-8:]):
+                fields = ", ".join(f"{k}={v}" for k, v in record.items() if k not in ('ts', 'event'))
+                lines.append(f"  {time.strftime('%H:%M:%S', time.localtime(record['ts']))} {record['event']}: {fields}")
+        return "\n".join(lines)
+
     def save_cache(self):
         try:
             # --- 'icon' field removed from cache data ---
-            data = [{'name': g.name, 'path': g.path, 'platform': g.platform, 'exe_path': g.exe_path} for g in self.games]
+            data = []
+            for g in self.games:
+                entry = {'name': g.name, 'path': g.path, 'platform': g.platform, 'exe_path': g.exe_path}
+                if g.exe_paths:
+                    entry['exe_paths'] = g.exe_paths
+                data.append(entry)
             with open(GAMES_CACHE_FILE, 'w') as f:
                 json.dump(data, f, indent=2)
         except Exception:
             pass
+        self.notify_daemon("reload_games")
+
+    def notify_daemon(self, cmd: str = "reload"):
+        """Tell an attached background service to pick up the new Twitch settings ("reload")
+        or just the new library ("reload_games", which leaves its running monitor alone)"""
+        if self.daemon:
+            threading.Thread(target=self.daemon.call, args=(cmd,), daemon=True).start()
+
+    def daemon_call(self, cmds: List[str], callback):
+        """Send daemon commands from a worker thread; callback gets their results on the Tk thread"""
+        daemon = self.daemon
+
+        def work():
+            results = [daemon.call(cmd) if daemon else None for cmd in cmds]
+            self.root.after(0, lambda: callback(*results))
+
+        threading.Thread(target=work, daemon=True).start()
 
     def load_cache(self):
-        try:
-            if GAMES_CACHE_FILE.exists():
-                with open(GAMES_CACHE_FILE, 'r') as f:
-                    data = json.load(f)
-                    # --- 'icon' field removed from cache loading ---
-                    self.games = [Game(g['name'], g['path'], g['platform'], g.get('exe_path', '')) for g in data]
-                    self.filtered = self.games.copy()
-                    if self.games:
-                        self.display()
-                        self.status.config(text=f"Loaded {len(self.games)} games from cache", fg="#10b981")
-        except Exception:
-            pass
+        games = load_cached_games()
+        if games:
+            self.games = games
+            self.filtered = self.games.copy()
+            self.display()
+            self.status.config(text=f"Loaded {len(self.games)} games from cache", fg="#10b981")
 
     # ---------- tray / icon (MODIFIED FOR PERSISTENT TRAY) ----------
     def create_tray_icon_image(self):
@@ -2603,24 +5435,28 @@ class GUI:
             return None
 
     def start_persistent_tray(self):
-        """Creates and runs the persistent tray icon in a thread."""
-        if not TRAY_AVAILABLE or pystray is None or item is None:
+        """Creates and runs the persistent tray icon in a thread (pystray and PIL are imported there)."""
+        if not TRAY_AVAILABLE:
             return
 
-        image = self.create_tray_icon_image()
-        menu = pystray.Menu(
-            item('Show', self.show_window, default=True),
-            item('Monitor Status', self.show_monitor_status),
-            pystray.Menu.SEPARATOR,
-            item('Exit', self.quit_app)
-        )
-        
-        try:
-            self.tray_icon = pystray.Icon("twitch_game_changer", image, "Twitch Game Changer", menu)
-        except Exception:
-            self.tray_icon = pystray.Icon("twitch_game_changer", None, "Twitch Game Changer", menu)
-
         def start_tray_loop():
+            pystray = load_pystray()
+            if pystray is None:
+                return
+            item = pystray.MenuItem
+            image = self.create_tray_icon_image()
+            menu = pystray.Menu(
+                item('Show', self.show_window, default=True),
+                item('Monitor Status', self.show_monitor_status),
+                pystray.Menu.SEPARATOR,
+                item('Exit', self.quit_app)
+            )
+            
+            try:
+                self.tray_icon = pystray.Icon("twitch_game_changer", image, "Twitch Game Changer", menu)
+            except Exception:
+                self.tray_icon = pystray.Icon("twitch_game_changer", None, "Twitch Game Changer", menu)
+
             # keep trying to run the tray icon; if run() exits due to Explorer restart, recreate & rerun
             while not self.app_is_closing:
                 try:
@@ -2645,33 +5481,57 @@ class GUI:
 
     def minimize_to_tray(self):
         """Hides the window. Called by WM_DELETE_WINDOW."""
+        if load_pystray() is None:
+            # No tray icon to come back from: minimize to the taskbar instead
+            self.root.iconify()
+            return
         self.is_minimized_to_tray = True
         self.root.withdraw()
+        self.release_images()
+
+    def release_images(self):
+        """Drop every decoded cover/icon while hidden; they reload from the disk cache on show"""
+        self._release_cards(list(self._visible_cards))
+        for pool in self._card_pools.values():
+            for card in pool:
+                card.clear_image()
+        stats = self.image_cache.stats()
+        print(f"Image cache: {stats['hits']} hits, {stats['misses']} misses, "
+              f"{stats['evictions']} evictions, {stats['bytes'] // 1024} KB released")
+        self.image_cache.clear()
 
     def show_window(self, icon=None, item=None):
         """Shows the window. Called by tray icon menu."""
         self.is_minimized_to_tray = False
         # --- No longer stops the icon ---
         self.root.after(0, self.root.deiconify)
+        self.root.after(0, self._refresh_visible)
         self.root.after(0, self.root.lift)
         self.root.after(0, self.root.focus_force)
 
     def show_monitor_status(self, icon=None, item=None):
-        if self.monitor and self.monitor.active:
+        if self.daemon:
+            self.daemon_call(["status"], self._show_monitor_status)
+        else:
+            self.root.after(0, self._show_monitor_status, None)
+
+    def _show_monitor_status(self, daemon_status):
+        if daemon_status:
+            playing = ", ".join(daemon_status.get('tracked', [])) or "no game running"
+            state = "ACTIVE" if daemon_status.get('active') else "INACTIVE"
+            status = f"Background service: monitor {state}\n{daemon_status.get('games', 0)} games, {playing}"
+        elif self.monitor and self.monitor.active:
             status = "🟢 Monitor is ACTIVE\nDetecting game launches..."
         else:
             status = "⚪ Monitor is INACTIVE\nGames are not being tracked"
-        def show_msg():
-            messagebox.showinfo("Monitor Status", status)
-        self.root.after(0, show_msg)
+        messagebox.showinfo("Monitor Status", status)
 
     def quit_app(self, icon=None, item=None):
         """Cleanly exits the entire application."""
         self.app_is_closing = True # Signal tray thread to exit
         
         try:
-            if self.monitor and self.monitor.active:
-                self.monitor.stop()
+            self.stop_local_monitor()
         except Exception:
             pass
         
@@ -2681,6 +5541,13 @@ class GUI:
         except Exception:
             pass
         
+        try:
+            self.image_disk_cache.flush()
+            self.image_url_cache.flush()
+            get_http().close()
+        except Exception:
+            pass
+        
         self.root.after(0, self.root.destroy)
 
     def check_for_updates_background(self):
@@ -2876,7 +5743,7 @@ class GUI:
         if self.monitor and self.monitor.active:
             def on_confirm(result):
                 if result:
-                    self.monitor.stop() # type: ignore
+                    self.stop_local_monitor()
                     self.root.destroy()
             
             self.show_modern_dialog(
@@ -2890,13 +5757,24 @@ class GUI:
 
 # Application Entry Point
 def main():
+    if DAEMON_MODE:
+        if DaemonClient.find():
+            print("Background service is already running")
+            return
+        if HeadlessService.gui_monitor_active():
+            # Two monitors would both change the category; the next --daemon (e.g. at login) takes over
+            print("The app window is already monitoring games; close it to use the background service")
+            return
+        HeadlessService().run()
+        return
+
     root = tk.Tk()
     app = GUI(root)
 
     # minimize on startup only if flagged
-    if STARTUP_MODE and hasattr(app, "minimize_to_tray"):
-        # The tray icon is already running, so just hide the window
-        root.after(800, app.minimize_to_tray)
+    if STARTUP_MODE and not STARTUP_BENCHMARK and hasattr(app, "minimize_to_tray"):
+        # Hide straight away; the tray icon comes up with the rest of the startup pipeline
+        app.minimize_to_tray()
 
     root.mainloop()
 
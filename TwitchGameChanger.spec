@@ -1,46 +1,50 @@
-# -*- mode: python ; coding: utf-8 -*-
-from PyInstaller.utils.hooks import collect_dynamic_libs
-from PyInstaller.utils.hooks import collect_submodules
-
-binaries = []
-hiddenimports = ['pystray', 'PIL.Image', 'PIL.ImageDraw']
-binaries += collect_dynamic_libs('psutil')
-hiddenimports += collect_submodules('psutil')
-
-
-a = Analysis(
-    ['TwitchGameChanger.py'],
-    pathex=[],
-    binaries=binaries,
-    datas=[('icon.ico', '.')],
-    hiddenimports=hiddenimports,
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
-    noarchive=False,
-    optimize=0,
-)
-pyz = PYZ(a.pure)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='TwitchGameChanger',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=True,
-    upx=False,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=['icon.ico'],
-)
+# -*- mode: python ; coding: utf-8 -*-
+from PyInstaller.utils.hooks import collect_dynamic_libs
+from PyInstaller.utils.hooks import collect_submodules
+
+binaries = []
+hiddenimports = ['pystray', 'PIL.Image', 'PIL.ImageDraw']
+# WMI process events (imported lazily by WmiProcessEventSource)
+hiddenimports += ['pythoncom', 'pywintypes', 'win32com.client']
+# Loaded through _LazyModule proxies in TwitchGameChanger.py, invisible to the import scan
+hiddenimports += ['tkinter', 'tkinter.ttk', 'tkinter.messagebox', 'winreg', 'socket']
+binaries += collect_dynamic_libs('psutil')
+hiddenimports += collect_submodules('psutil')
+
+
+a = Analysis(
+    ['TwitchGameChanger.py'],
+    pathex=[],
+    binaries=binaries,
+    datas=[('icon.ico', '.')],
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=[],
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='TwitchGameChanger',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=True,
+    upx=False,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=['icon.ico'],
+)
@@ -0,0 +1,86 @@
+"""
+Benchmark: GameMonitor.build_exe_map on a synthetic 300-game library.
+
+Creates a temporary install tree (ordinary games with a handful of exes next to
+the main one, plus Marvel Rivals / Valorant / Fortnite with deep Unreal-style
+layouts) and times building the exe map cold (no persisted index, every install
+walked with the compiled EXE_RULES matcher) and warm (index loaded, only the
+directory mtimes checked).
+
+Run: python benchmarks/bench_exe_map.py [games]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import TwitchGameChanger  # noqa: E402
+from TwitchGameChanger import Game, GameMonitor  # noqa: E402
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+
+
+def _unreal_tree(root, project, shipping, filler_dirs=40):
+    """A deep install with the shipping exe buried under Binaries/Win64 and lots of content dirs"""
+    _touch(os.path.join(root, f"{project}Launcher.exe"))
+    _touch(os.path.join(root, project, "Binaries", "Win64", shipping))
+    _touch(os.path.join(root, project, "Binaries", "Win64", "CrashReportClient.exe"))
+    for i in range(filler_dirs):
+        _touch(os.path.join(root, project, "Content", "Paks", f"chunk{i}", "data", f"pak{i}.pak"))
+
+
+def build_library(base, count):
+    games = []
+    specials = [
+        ("Marvel Rivals", "MarvelGame", "Marvel-Win64-Shipping.exe"),
+        ("VALORANT", "ShooterGame", "VALORANT-Win64-Shipping.exe"),
+        ("Fortnite", "FortniteGame", "FortniteClient-Win64-Shipping.exe"),
+    ]
+    for name, project, shipping in specials:
+        root = os.path.join(base, name.replace(' ', ''))
+        _unreal_tree(root, project, shipping)
+        games.append(Game(name, root, "Epic Games", os.path.join(root, f"{project}Launcher.exe")))
+    for i in range(count - len(specials)):
+        root = os.path.join(base, f"Game{i:03d}")
+        exe = os.path.join(root, f"game{i}.exe")
+        for extra in (exe, os.path.join(root, "unins000.exe"), os.path.join(root, "editor.exe")):
+            _touch(extra)
+        _touch(os.path.join(root, "data", "assets.bin"))
+        games.append(Game(f"Game {i}", root, "Steam", exe))
+    return games
+
+
+def run(count=300, repeats=5):
+    base = tempfile.mkdtemp(prefix="tgc_exe_bench_")
+    try:
+        games = build_library(base, count)
+        index_file = Path(base) / "exe_map.json"
+        TwitchGameChanger.EXE_MAP_FILE = index_file
+        monitor = GameMonitor(games, None, lambda *a: None) # type: ignore
+
+        def best_of(prepare):
+            best = float('inf')
+            for _ in range(repeats):
+                prepare()
+                start = time.perf_counter()
+                monitor.build_exe_map()
+                best = min(best, time.perf_counter() - start)
+            return best * 1000
+
+        cold = best_of(lambda: index_file.unlink(missing_ok=True))
+        warm = best_of(lambda: None)
+        print(f"{count} games, {len(monitor.exe_map)} executables mapped (best of {repeats}):")
+        print(f"  cold build_exe_map  {cold:7.1f} ms")
+        print(f"  warm build_exe_map  {warm:7.1f} ms")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,150 @@
+"""
+Benchmark: DirectoryIndex.find_folders on a synthetic drive.
+
+Lays out a drive-like tree: user folders with deep AppData caches, a Windows
+folder, a ProgramData folder and a games area holding a few "Marvel Rivals"
+installs among many other folders. Reports, best of N repeats:
+
+    cold      fresh index, nothing persisted
+    warm      same index again (in-memory listings, nothing changed)
+    restart   new index loading what the last run persisted (one stat per directory)
+    no-prune  cold traversal with SKIP_DIRS emptied (what pruning saves)
+
+with the number of directories each one had to list, the size of the persisted
+index, and what churn in AppData (pruned) and in Downloads (indexed) costs.
+
+Run: python benchmarks/bench_location_index.py [repeats] [scale]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from TwitchGameChanger import DirectoryIndex  # noqa: E402
+
+
+def build_tree(base, scale):
+    """A drive root under base; returns (root, expected match paths)"""
+    root = os.path.join(base, "drive_c")
+    for u in range(2):
+        appdata = os.path.join(root, "Users", f"user{u}", "AppData")
+        for a in range(10 * scale):
+            for b in range(8):
+                os.makedirs(os.path.join(appdata, "Local", f"Cache{a}", f"blob{b}", "x"), exist_ok=True)
+        for d in ("Documents", "Downloads", "Videos"):
+            for a in range(3 * scale):
+                for b in range(4):
+                    os.makedirs(os.path.join(root, "Users", f"user{u}", d, f"folder{a}", f"sub{b}"), exist_ok=True)
+    for a in range(20 * scale):
+        os.makedirs(os.path.join(root, "Windows", "WinSxS", f"component{a}", "v1"), exist_ok=True)
+        os.makedirs(os.path.join(root, "ProgramData", f"Vendor{a}", "cache"), exist_ok=True)
+    matches = []
+    for a in range(5 * scale):
+        for b in range(4):
+            os.makedirs(os.path.join(root, "Games", f"Studio{a}", f"Title{b}", "Binaries", "Win64"), exist_ok=True)
+    for i in range(3):
+        path = os.path.join(root, "Games", f"Studio{i}", "Marvel Rivals")
+        os.makedirs(os.path.join(path, "MarvelGame"), exist_ok=True)
+        matches.append(path)
+    return root, sorted(matches)
+
+
+class NoPruneIndex(DirectoryIndex):
+    SKIP_DIRS = set()
+
+
+class _ListingCounter:
+    """Counts os.scandir calls (directories actually listed)"""
+
+    def __init__(self):
+        self.count = 0
+        self._scandir = os.scandir
+
+    def __enter__(self):
+        def counting(path):
+            self.count += 1
+            return self._scandir(path)
+        os.scandir = counting
+        return self
+
+    def __exit__(self, *exc):
+        os.scandir = self._scandir
+
+
+def listed(fn):
+    with _ListingCounter() as counter:
+        fn()
+    return counter.count
+
+
+def best_of(fn, repeats, prepare=None):
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        index = prepare() if prepare else None
+        start = time.perf_counter()
+        result = fn(index)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def run(repeats=3, scale=20):
+    base = tempfile.mkdtemp(prefix="tgc_location_bench_")
+    try:
+        root, expected = build_tree(base, scale)
+        index_file = Path(base) / "location_index.json"
+        names = {"marvel rivals"}
+
+        def find(index):
+            return sorted(index.find_folders(names, [root])["marvel rivals"])
+
+        def fresh():
+            index_file.unlink(missing_ok=True)
+            return DirectoryIndex(index_file)
+
+        total_dirs = sum(len(d) for _, d, _ in os.walk(root))
+        print(f"DirectoryIndex on a synthetic drive ({total_dirs} directories, best of {repeats}):")
+        cold, found = best_of(find, repeats, fresh)
+        assert found == expected, found
+        cold_listed = listed(lambda: find(fresh()))
+        print(f"  {'cold':<10}{cold:9.1f} ms  {cold_listed:6d} dirs listed, {len(found)} matches")
+
+        shared = DirectoryIndex(index_file)
+        find(shared)
+        warm, _ = best_of(lambda _: find(shared), repeats)
+        print(f"  {'warm':<10}{warm:9.1f} ms  {listed(lambda: find(shared)):6d} dirs listed")
+
+        restart, found = best_of(find, repeats, lambda: DirectoryIndex(index_file))
+        assert found == expected, found
+        restart_listed = listed(lambda: find(DirectoryIndex(index_file)))
+        assert restart_listed == 0, restart_listed
+        print(f"  {'restart':<10}{restart:9.1f} ms  {restart_listed:6d} dirs listed "
+              f"({len(shared.nodes)} persisted, {index_file.stat().st_size // 1024} KB)")
+
+        no_prune_file = index_file.with_name("no_prune.json")
+
+        def fresh_no_prune():
+            no_prune_file.unlink(missing_ok=True)
+            return NoPruneIndex(no_prune_file)
+
+        no_prune, found = best_of(find, repeats, fresh_no_prune)
+        assert found == expected, found
+        print(f"  {'no-prune':<10}{no_prune:9.1f} ms  {listed(lambda: find(fresh_no_prune())):6d} dirs listed")
+
+        for label, new_dir in (("AppData", ("AppData", "Local", "Cache0", "new")), ("Downloads", ("Downloads", "new folder"))):
+            written = index_file.stat().st_mtime_ns
+            time.sleep(0.01)
+            os.makedirs(os.path.join(root, "Users", "user0", *new_dir))
+            count = listed(lambda: find(DirectoryIndex(index_file)))
+            rewritten = index_file.stat().st_mtime_ns != written
+            print(f"  churn in {label:<10}restart re-lists {count} dir(s), index rewritten: "
+                  f"{'yes' if rewritten else 'no'}")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    run(args[0] if args else 3, args[1] if len(args) > 1 else 20)
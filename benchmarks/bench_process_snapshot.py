@@ -0,0 +1,182 @@
+"""
+Benchmark: full process-table resolution vs. incremental PID snapshot diffing.
+
+Builds a synthetic process table (1k / 10k processes) and compares the old
+GameMonitor tick (resolve and normalise every exe, every tick) with
+PollingProcessSource.poll_once(), which only resolves PIDs that are new and
+re-checks create_time for tracked PIDs plus one slice of the reuse sweep.
+
+Costs follow psutil on Windows: pids() is one EnumProcesses call, Process(pid)
+opens the process and reads its create_time (which later create_time() calls
+return from cache), exe() queries the image name.
+
+Run: python benchmarks/bench_process_snapshot.py
+"""
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from TwitchGameChanger import PollingProcessSource, ProcessEvent  # noqa: E402
+
+# Rough cost of OpenProcess + QueryFullProcessImageName on Windows
+EXE_LOOKUP_COST = 20e-6
+# psutil.Process(pid): OpenProcess(QUERY_LIMITED_INFORMATION) + GetProcessTimes for create_time
+PROCESS_INIT_COST = 8e-6
+# EnumProcesses, per process listed
+PIDS_COST_PER_PROCESS = 0.05e-6
+
+
+def _spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class SyntheticProcessTable:
+    """Minimal stand-in for the parts of psutil the monitor uses"""
+
+    def __init__(self, size, churn=0.01, seed=1):
+        self.rng = random.Random(seed)
+        self.churn = churn
+        self.next_pid = 4
+        self.procs = {}
+        for _ in range(size):
+            self._spawn()
+
+    def _spawn(self):
+        pid = self.next_pid
+        self.next_pid += 4
+        exe = f"C:\\Program Files\\Vendor{pid % 97}\\App{pid}\\bin\\app{pid}.exe"
+        self.procs[pid] = (time.time(), exe)
+
+    def reuse(self, pid, exe):
+        """A process exits and a new one immediately gets the same PID"""
+        self.procs[pid] = (self.procs[pid][0] + 1, exe)
+
+    def tick(self):
+        """Replace `churn` of the processes with new ones"""
+        count = max(1, int(len(self.procs) * self.churn))
+        for pid in self.rng.sample(list(self.procs), count):
+            del self.procs[pid]
+        for _ in range(count):
+            self._spawn()
+
+    # --- psutil surface ---
+    def pids(self):
+        _spin(PIDS_COST_PER_PROCESS * len(self.procs))
+        return list(self.procs)
+
+    def Process(self, pid):
+        return _SyntheticProcess(self, pid)
+
+    def process_iter(self, attrs=None):
+        for pid in list(self.procs):
+            proc = _SyntheticProcess(self, pid)
+            proc.info = {'pid': pid, 'exe': proc.exe()}
+            yield proc
+
+
+class _SyntheticProcess:
+    def __init__(self, table, pid):
+        _spin(PROCESS_INIT_COST)
+        if pid not in table.procs:
+            raise LookupError(pid)
+        self.table = table
+        self.pid = pid
+        self._create_time = table.procs[pid][0]
+
+    def create_time(self):
+        return self._create_time
+
+    def exe(self):
+        _spin(EXE_LOOKUP_COST)
+        return self.table.procs[self.pid][1]
+
+
+def full_resolve_tick(table, exe_map):
+    """The pre-snapshot GameMonitor tick"""
+    matches = 0
+    for proc in table.process_iter(['pid', 'exe']):
+        exe = proc.info.get('exe')
+        if exe and os.path.normpath(exe).lower() in exe_map:
+            matches += 1
+    return matches
+
+
+def run(size, ticks=20):
+    exe_map = {"c:\\games\\game\\game.exe": "Game"}
+
+    table = SyntheticProcessTable(size)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        table.tick()
+        full_resolve_tick(table, exe_map)
+    full = (time.perf_counter() - start) / ticks
+
+    table = SyntheticProcessTable(size)
+    source = PollingProcessSource(psutil_module=table)
+    source.poll_once()  # initial snapshot, paid once
+    for pid in list(source.snapshot)[:3]:  # a running game with a few processes
+        source.pin(pid)
+    resolved = 0
+    start = time.perf_counter()
+    for _ in range(ticks):
+        table.tick()
+        resolved += source.poll_once()
+        while source.get(0):  # drain events like the monitor would
+            pass
+    incremental = (time.perf_counter() - start) / ticks
+
+    sweep = -(-size // int(source.SWEEP_SECONDS / source.interval))
+    print(f"{size:>6} procs | full resolve {full * 1000:8.2f} ms/tick | "
+          f"snapshot diff {incremental * 1000:7.2f} ms/tick "
+          f"({resolved / ticks:.0f} new, {sweep} swept PIDs/tick) | {full / incremental:5.1f}x")
+
+
+def _drain(source):
+    events = []
+    while True:
+        event = source.get(0)
+        if event is None:
+            return events
+        if event.pid == 500:
+            events.append((event.kind, event.pid, event.exe))
+
+
+def check_pid_reuse():
+    """
+    A reused PID must produce exit + start: on the next poll for a tracked PID, and within
+    one sweep period for an untracked one (pid 500 notepad.exe exits, pid 500 game.exe starts).
+    """
+    expected = [(ProcessEvent.EXIT, 500, ""), (ProcessEvent.START, 500, "c:\\games\\game\\game.exe")]
+    for tracked in (True, False):
+        table = SyntheticProcessTable(0)
+        table.procs[500] = (time.time(), "C:\\Windows\\notepad.exe")
+        table.next_pid = 1000
+        for _ in range(200):
+            table._spawn()
+        source = PollingProcessSource(psutil_module=table)
+        source.poll_once()
+        _drain(source)
+        if tracked:
+            source.pin(500)
+        table.reuse(500, "C:\\Games\\Game\\game.exe")
+        polls = 0
+        events = []
+        while not events and polls <= source.SWEEP_SECONDS / source.interval + 1:
+            source.poll_once()
+            polls += 1
+            events = _drain(source)
+        assert events == expected, (tracked, events)
+        assert not tracked or polls == 1, polls
+        print(f"PID reuse ({'tracked' if tracked else 'untracked'}): exit + start after {polls} poll(s), "
+              f"{polls * source.interval:.1f}s")
+
+
+if __name__ == "__main__":
+    check_pid_reuse()
+    for size in (1000, 10000):
+        run(size)
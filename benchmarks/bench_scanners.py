@@ -0,0 +1,112 @@
+"""
+Benchmark: GameScanner on synthetic libraries of 10 / 100 / 1000 games.
+
+Each library is generated by synthetic_library.make_library() and scanned
+through a FakePlatform (in-memory registry, temp directories as drives), so it
+runs on any OS. Reports, best of N repeats:
+
+    each iter_* scanner on its own (Steam with and without its manifest cache,
+    Riot / Battle.net from launcher records and with the opt-in drive sweep)
+    scan_all (all scanners concurrently)
+    GameMonitor.build_exe_map cold (no persisted index) and warm
+
+Before timing, check_launcher_records() asserts that every known Battle.net
+title resolves from a product.db written with the agent's real uids and
+product codes, and that Riot folders without a game exe are skipped.
+
+Run: python benchmarks/bench_scanners.py [repeats] [sizes...]
+"""
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import TwitchGameChanger  # noqa: E402
+from TwitchGameChanger import DirectoryIndex, GameMonitor, GameScanner, SteamManifestCache  # noqa: E402
+from synthetic_library import BLIZZARD, make_library  # noqa: E402
+
+
+def best_of(fn, repeats, prepare=None):
+    best, result = float('inf'), None
+    for _ in range(repeats):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def run_size(count, repeats):
+    base = Path(tempfile.mkdtemp(prefix="tgc_scan_bench_"))
+    try:
+        platform = make_library(base, count)
+        scanner = GameScanner(platform)
+        scanner.location_index = DirectoryIndex(base / "location_index.json")
+        manifest_file = base / "steam_manifests.json"
+
+        def cold_manifests():
+            manifest_file.unlink(missing_ok=True)
+            scanner.steam_manifests = SteamManifestCache(manifest_file)
+
+        def fresh_scan():
+            scanner._standalone_folders = None
+
+        print(f"\n{count} games")
+        ms, games = best_of(lambda: list(scanner.iter_steam()), repeats, cold_manifests)
+        print(f"  {'Steam (cold)':<20}{len(games):6d} games {ms:9.1f} ms")
+        for name, fn in scanner.scanners():
+            ms, games = best_of(lambda: list(fn()), repeats, fresh_scan)
+            print(f"  {name:<20}{len(games):6d} games {ms:9.1f} ms")
+
+        scanner.drive_sweep = True
+        for name, fn in (("Riot (+sweep)", scanner.iter_riot), ("Battle.net (+sweep)", scanner.iter_battlenet)):
+            ms, swept = best_of(lambda: list(fn()), repeats)
+            print(f"  {name:<20}{len(swept):6d} games {ms:9.1f} ms")
+        scanner.drive_sweep = False
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ms, games = best_of(scanner.scan_all, repeats)
+        print(f"  {'scan_all':<20}{len(games):6d} games {ms:9.1f} ms")
+
+        index_file = base / "exe_map.json"
+        TwitchGameChanger.EXE_MAP_FILE = index_file
+        monitor = GameMonitor(games, None, lambda *a: None)  # type: ignore
+        cold, _ = best_of(monitor.build_exe_map, repeats, lambda: index_file.unlink(missing_ok=True))
+        warm, _ = best_of(monitor.build_exe_map, repeats)
+        print(f"  {'build_exe_map':<20}{len(monitor.exe_map):6d} exes  {cold:9.1f} ms cold {warm:7.1f} ms warm")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def check_launcher_records():
+    base = Path(tempfile.mkdtemp(prefix="tgc_records_"))
+    try:
+        # 160 games gets every Battle.net title in BLIZZARD installed
+        scanner = GameScanner(make_library(base, 160))
+        found = sorted(g.name for g in scanner.iter_battlenet())
+        assert found == sorted(g["name"] for g in GameScanner.BLIZZARD_GAMES), found
+        assert {code for *_, code in BLIZZARD} == {g["product"] for g in GameScanner.BLIZZARD_GAMES}
+        riot = [g for g in scanner.iter_riot()]
+        assert riot and all(g.exe_path for g in riot), [(g.name, g.exe_path) for g in riot]
+        assert "Uninstalled Game" not in {g.name for g in riot}
+        print(f"Launcher records: {len(found)} Battle.net titles from product.db, "
+              f"{len(riot)} Riot games (folders without an exe skipped)")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+def run(repeats=3, sizes=(10, 100, 1000)):
+    print(f"GameScanner on synthetic libraries (best of {repeats}):")
+    for count in sizes:
+        run_size(count, repeats)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    check_launcher_records()
+    run(args[0] if args else 3, tuple(args[1:]) or (10, 100, 1000))
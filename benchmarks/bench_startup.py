@@ -0,0 +1,83 @@
+"""
+Benchmark: cold-start timings of the GUI.
+
+Launches `TwitchGameChanger.py --startup-benchmark` several times. In that mode
+the app prints its startup stages (milliseconds since the interpreter started
+importing the module) and exits once the monitor is running:
+
+    tk_ready      module imported and the Tk root created
+    ui_built      GUI.setup_ui() done
+    cache_loaded  games cache loaded and shown
+    first_paint   window drawn (time-to-first-paint)
+    monitoring    GameMonitor started (time-to-monitoring)
+
+Each run gets a temporary APPDATA holding a Twitch config with a placeholder
+login (so the monitor starts as it would for a signed-in user) and a copy of
+your games cache, or a small synthetic one if there is none.
+
+Needs a display (and the app's runtime dependencies) to run.
+
+Run: python benchmarks/bench_startup.py [runs]
+"""
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from TwitchGameChanger import GAMES_CACHE_FILE, TokenEncryption  # noqa: E402
+
+APP = Path(__file__).resolve().parent.parent / "TwitchGameChanger.py"
+STAGES = ("tk_ready", "ui_built", "cache_loaded", "first_paint", "monitoring")
+
+
+def make_appdata(base):
+    """An APPDATA for the app under test: a stub Twitch login plus a games cache"""
+    data_dir = Path(base) / "TwitchGameChanger"
+    data_dir.mkdir(parents=True)
+    with open(data_dir / "twitch_config.json", "w") as f:
+        json.dump({'channel_name': 'benchmark', 'enabled': True, 'user_id': '0',
+                   'access_token': TokenEncryption.encrypt("startup-benchmark")}, f)
+    if GAMES_CACHE_FILE.exists():
+        shutil.copy(GAMES_CACHE_FILE, data_dir / "games_cache.json")
+    else:
+        games = [{'name': f"Game {i}", 'path': f"C:\\Games\\Game {i}", 'platform': "Other",
+                  'exe_path': f"C:\\Games\\Game {i}\\game{i}.exe"} for i in range(50)]
+        with open(data_dir / "games_cache.json", "w") as f:
+            json.dump(games, f)
+
+
+def run_once(timeout=60):
+    base = tempfile.mkdtemp(prefix="tgc_startup_bench_")
+    try:
+        make_appdata(base)
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, str(APP), "--startup-benchmark"], capture_output=True,
+                              text=True, timeout=timeout, env=dict(os.environ, APPDATA=base))
+        wall = (time.perf_counter() - start) * 1000
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("STARTUP "):
+            stages = json.loads(line[len("STARTUP "):])
+            stages["process_wall"] = wall
+            return stages
+    raise RuntimeError(f"no STARTUP line (exit code {proc.returncode}):\n{proc.stderr[-2000:]}")
+
+
+def run(runs=5):
+    results = [run_once() for _ in range(runs)]
+    print(f"Startup over {runs} runs (median / min, ms):")
+    for stage in STAGES + ("process_wall",):
+        values = [r[stage] for r in results if stage in r]
+        if values:
+            print(f"  {stage:<14}{statistics.median(values):8.1f}{min(values):8.1f}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,84 @@
+"""
+Benchmark: resolving Steam game executables from appinfo.vdf vs. directory walks.
+
+Builds a fixture Steam library whose installs look like real ones (Unreal-style
+Project/Binaries/Win64/Project-Win64-Shipping.exe, a launcher and redistributables
+next to it, content folders) plus an appinfo.vdf with each app's launch entries
+padded with entries for apps that aren't installed. Times:
+
+    heuristic  GameScanner._find_steam_exe (guessed paths, root glob, os.walk)
+    appinfo    SteamAppInfo.launch_map + GameScanner._existing_exes
+
+and counts how often the heuristic picked the exe Steam actually launches.
+
+Run: python benchmarks/bench_steam_exes.py [games]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from TwitchGameChanger import GameScanner, SteamAppInfo  # noqa: E402
+from synthetic_library import steam_appinfo, write_appinfo  # noqa: E402
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+
+
+def build_fixture(base, count):
+    common = os.path.join(base, "steamapps", "common")
+    games, appinfo = [], {}
+    for i in range(count):
+        installdir = f"Fixture Game {i:04d}"
+        project = f"Proj{i:04d}"
+        root = os.path.join(common, installdir)
+        exe = os.path.join(project, "Binaries", "Win64", f"{project}-Win64-Shipping.exe")
+        _touch(os.path.join(root, exe))
+        _touch(os.path.join(root, f"{project}Launcher.exe"))
+        _touch(os.path.join(root, "Engine", "Extras", "Redist", "en-us", "UE4PrereqSetup_x64.exe"))
+        for j in range(8):
+            _touch(os.path.join(root, project, "Content", "Paks", f"chunk{j}", "data.pak"))
+        app_id = 21 * i + 10  # installed apps are scattered among the others
+        appinfo[app_id] = steam_appinfo(app_id, installdir, installdir, exe.replace(os.sep, '\\'))
+        games.append((app_id, Path(root), installdir, os.path.join(root, exe)))
+    for app_id in range(1, 21 * count + 1):
+        if app_id not in appinfo:
+            appinfo[app_id] = steam_appinfo(app_id, f"Other {app_id}", f"Other{app_id}", f"Other{app_id}.exe")
+    path = os.path.join(base, "appcache", "appinfo.vdf")
+    write_appinfo(path, dict(sorted(appinfo.items())))
+    return games, path
+
+
+def run(count=500):
+    base = tempfile.mkdtemp(prefix="tgc_steam_exe_bench_")
+    try:
+        games, appinfo_path = build_fixture(base, count)
+        scanner = GameScanner.__new__(GameScanner)  # only the exe helpers are needed
+
+        start = time.perf_counter()
+        guessed = [scanner._find_steam_exe(gpath, name, name) for _, gpath, name, _ in games]
+        heuristic = time.perf_counter() - start
+
+        start = time.perf_counter()
+        launch = SteamAppInfo().launch_map(appinfo_path, [app_id for app_id, *_ in games])
+        resolved = [(scanner._existing_exes(str(gpath), launch.get(app_id, [])) or [None])[0]
+                    for app_id, gpath, _, _ in games]
+        configured = time.perf_counter() - start
+
+        right_guess = sum(1 for g, (*_, exe) in zip(guessed, games) if g and str(g) == exe)
+        right_appinfo = sum(1 for r, (*_, exe) in zip(resolved, games) if r and str(r) == exe)
+        print(f"{count} Steam games, appinfo.vdf {os.path.getsize(appinfo_path) / 1024:.0f} KB "
+              f"({count * 21} apps):")
+        print(f"  heuristic walk  {heuristic * 1000:8.1f} ms  {right_guess}/{count} launch exes found")
+        print(f"  appinfo.vdf     {configured * 1000:8.1f} ms  {right_appinfo}/{count} launch exes found")
+    finally:
+        shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,253 @@
+"""
+Synthetic game library for the scanner benchmarks.
+
+make_library(base, count) lays out `count` installed games across every
+launcher GameScanner knows about, under a temporary directory:
+
+    drive_c/, drive_d/   stand-ins for C:\\ and D:\\
+      Steam/steamapps/          libraryfolders.vdf (with "apps" maps) + appmanifest_*.acf,
+                                for the C: library and a second one on D:
+      Steam/appcache/appinfo.vdf  binary app info with launch entries for every installed
+                                app, padded with entries for apps that aren't installed
+      Epic Games/<game>/        install folders for the Epic manifests
+      GOG Games/<game>/         install folders (with goggame-*.info) for the GOG registry entries
+      Riot Games/<game>/        Riot installs (VALORANT with its Unreal layout); more
+      Games/Riot/<game>/        of them live outside the usual folder
+      <Blizzard game>/          Battle.net installs at the drive root or under Program Files
+      Xbox/<game>/Content/      Xbox app installs
+      Games/NetEase/Marvel Rivals/  a standalone install found via the location index
+    programdata/Epic/EpicGamesLauncher/Data/Manifests/*.item
+    programdata/Riot Games/       RiotClientInstalls.json, Metadata/*/*.product_settings.yaml
+    programdata/Battle.net/Agent/product.db
+
+and returns a FakePlatform whose registry and drives point at it.
+"""
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from TwitchGameChanger import FakePlatform  # noqa: E402
+
+# Share of the library each launcher gets (Battle.net is capped at its 8 known titles)
+SHARES = (("Steam", 0.45), ("Epic Games", 0.20), ("GOG", 0.15), ("Xbox", 0.10),
+          ("Riot Games", 0.05), ("Battle.net", 0.05))
+
+# (folder, exe, product.db uid, product.db product code) as the Battle.net agent records them
+BLIZZARD = [("Overwatch", "Overwatch.exe", "prometheus", "pro"), ("World of Warcraft", "Wow.exe", "wow", "wow"),
+            ("Diablo III", "Diablo III64.exe", "diablo3", "d3"), ("Diablo IV", "Diablo IV.exe", "fenris", "fen"),
+            ("Hearthstone", "Hearthstone.exe", "hs_beta", "hsb"), ("StarCraft II", "SC2_x64.exe", "s2", "s2"),
+            ("Warcraft III", "Warcraft III.exe", "w3", "w3"),
+            ("Heroes of the Storm", "HeroesOfTheStorm_x64.exe", "heroes", "hero")]
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'wb').close()
+
+
+def _install(root, exe_name, deep=False):
+    """A game folder: the exe (at the root or under Binaries/Win64), an uninstaller and some data"""
+    exe = os.path.join(root, "Binaries", "Win64", exe_name) if deep else os.path.join(root, exe_name)
+    _touch(exe)
+    _touch(os.path.join(root, "unins000.exe"))
+    for sub in ("data", "data/maps", "data/audio"):
+        _touch(os.path.join(root, sub, "assets.bin"))
+    return exe
+
+
+def _binary_kv(node, strings):
+    """Binary KeyValues with v29-style keys (indices into the string table)"""
+    out = bytearray()
+    for key, value in node.items():
+        index = struct.pack('<I', strings.setdefault(key, len(strings)))
+        if isinstance(value, dict):
+            out += b'\x00' + index + _binary_kv(value, strings) + b'\x08'
+        elif isinstance(value, int):
+            out += b'\x02' + index + struct.pack('<i', value)
+        else:
+            out += b'\x01' + index + str(value).encode('utf-8') + b'\0'
+    return bytes(out)
+
+
+def write_appinfo(path, apps):
+    """Write a version 29 appinfo.vdf holding {app id: appinfo dict}"""
+    strings = {}
+    body = bytearray()
+    for app_id, info in apps.items():
+        kv = _binary_kv({'appinfo': info}, strings) + b'\x08'
+        # info state, last updated, PICS token, text SHA-1, change number, binary SHA-1
+        header = struct.pack('<IIQ20sI20s', 2, 1700000000, 0, b'\0' * 20, 1, b'\0' * 20)
+        body += struct.pack('<II', app_id, len(header) + len(kv)) + header + kv
+    body += struct.pack('<I', 0)
+    table_offset = 16 + len(body)
+    names = sorted(strings, key=strings.get)
+    table = struct.pack('<I', len(names)) + b''.join(n.encode('utf-8') + b'\0' for n in names)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<IIq', 0x07564429, 1, table_offset) + body + table)
+
+
+def steam_appinfo(app_id, name, installdir, exe):
+    """appinfo for a game with a Windows launch entry, a Linux one and a tool option"""
+    return {
+        'appid': app_id,
+        'common': {'name': name, 'type': 'Game'},
+        'config': {
+            'installdir': installdir,
+            'launch': {
+                '0': {'executable': exe, 'type': 'default', 'config': {'oslist': 'windows', 'osarch': '64'}},
+                '1': {'executable': f"{installdir}.sh", 'type': 'default', 'config': {'oslist': 'linux'}},
+                '2': {'executable': 'Tools\\Editor.exe', 'type': 'editor'},
+            },
+        },
+    }
+
+
+def _varint(n):
+    out = bytearray()
+    while True:
+        byte, n = n & 0x7F, n >> 7
+        out.append(byte | 0x80 if n else byte)
+        if not n:
+            return bytes(out)
+
+
+def _pb_bytes(number, payload):
+    """A length-delimited protobuf field"""
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+def write_product_db(path, installs):
+    """Battle.net Agent product.db for [(uid, product code, install path)]"""
+    db = b''
+    for uid, code, install_path in installs:
+        settings = _pb_bytes(1, install_path.replace(os.sep, '/')) + _pb_bytes(2, "us")
+        state = _varint(1 << 3 | 0) + _varint(1)  # a varint field the scanner ignores
+        db += _pb_bytes(1, _pb_bytes(1, uid) + _pb_bytes(2, code) + _pb_bytes(3, settings) + _pb_bytes(4, state))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(db)
+
+
+def _counts(count):
+    counts = {}
+    for launcher, share in SHARES:
+        counts[launcher] = max(1, round(count * share))
+    counts["Battle.net"] = min(len(BLIZZARD), counts["Battle.net"])
+    return counts
+
+
+def make_library(base, count) -> FakePlatform:
+    base = Path(base)
+    drives = [str(base / "drive_c"), str(base / "drive_d")]
+    program_data = base / "programdata"
+    platform = FakePlatform(drives=drives, program_data=str(program_data))
+    counts = _counts(count)
+    serial = iter(range(1, 1_000_000))
+
+    # Steam: the main library on C: plus a second one on D:
+    steam = Path(drives[0]) / "Steam"
+    platform.set_registry_value('HKCU', r"Software\Valve\Steam", "SteamPath", str(steam))
+    libraries = [steam, Path(drives[1]) / "SteamLibrary"]
+    apps = {library: [] for library in libraries}
+    appinfo = {}
+    for i in range(counts["Steam"]):
+        appid = 100000 + next(serial)
+        installdir = f"SteamGame{i:04d}"
+        library = libraries[i % 2]
+        apps[library].append(appid)
+        steamapps = library / "steamapps"
+        exe = _install(str(steamapps / "common" / installdir), f"{installdir}.exe", deep=(i % 5 == 0))
+        relative = os.path.relpath(exe, steamapps / "common" / installdir).replace(os.sep, '\\')
+        appinfo[appid] = steam_appinfo(appid, f"Steam Game {i}", installdir, relative)
+        (steamapps / f"appmanifest_{appid}.acf").write_text(
+            '"AppState"\n{\n'
+            f'\t"appid"\t\t"{appid}"\n\t"name"\t\t"Steam Game {i}"\n'
+            f'\t"installdir"\t\t"{installdir}"\n\t"StateFlags"\t\t"4"\n'
+            '\t"UserConfig"\n\t{\n\t\t"name"\t\t"nested key"\n\t}\n}\n', encoding='utf-8')
+    vdf_lines = ['"libraryfolders"', '{', '\t"contentstatsid"\t\t"-1234567890"']
+    for i, library in enumerate(libraries):
+        (library / "steamapps" / "common").mkdir(parents=True, exist_ok=True)
+        vdf_lines += [f'\t"{i}"', '\t{', '\t\t"path"\t\t"{}"'.format(str(library).replace('\\', '\\\\')),
+                      '\t\t"apps"', '\t\t{'] + [f'\t\t\t"{appid}"\t\t"1048576"' for appid in apps[library]] + ['\t\t}', '\t}']
+    vdf_lines.append('}')
+    (steam / "steamapps" / "libraryfolders.vdf").write_text('\n'.join(vdf_lines), encoding='utf-8')
+    # Steam knows about far more apps than are installed
+    for i in range(counts["Steam"] * 20):
+        appid = 500000 + i
+        appinfo[appid] = steam_appinfo(appid, f"Not Installed {i}", f"NotInstalled{i}", f"NotInstalled{i}.exe")
+    write_appinfo(str(steam / "appcache" / "appinfo.vdf"), dict(sorted(appinfo.items())))
+
+    # Epic: JSON manifests in ProgramData pointing at installs on either drive
+    manifests = program_data / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
+    manifests.mkdir(parents=True, exist_ok=True)
+    for i in range(counts["Epic Games"]):
+        root = os.path.join(drives[i % 2], "Epic Games", f"EpicGame{i:04d}")
+        exe = _install(root, f"EpicGame{i:04d}.exe", deep=(i % 3 == 0))
+        with open(manifests / f"{next(serial):032X}.item", 'w', encoding='utf-8') as f:
+            json.dump({"DisplayName": f"Epic Game {i}", "InstallLocation": root,
+                       "LaunchExecutable": os.path.relpath(exe, root).replace(os.sep, '/')}, f)
+
+    # GOG: one registry subkey per game, plus the goggame-<id>.info play tasks in the install
+    for i in range(counts["GOG"]):
+        root = os.path.join(drives[0], "GOG Games", f"GogGame{i:04d}")
+        _install(root, f"GogGame{i:04d}.exe")
+        _touch(os.path.join(root, "Tools", "ConfigTool.exe"))
+        game_id = 1200000000 + next(serial)
+        with open(os.path.join(root, f"goggame-{game_id}.info"), 'w', encoding='utf-8') as f:
+            json.dump({"gameId": str(game_id), "name": f"GOG Game {i}", "playTasks": [
+                {"isPrimary": True, "type": "FileTask", "category": "game", "path": f"GogGame{i:04d}.exe"},
+                {"type": "FileTask", "category": "tool", "path": "ConfigTool.exe", "workingDir": "Tools"},
+                {"type": "FileTask", "category": "document", "path": "Manual.pdf"},
+                {"type": "URLTask", "category": "document", "link": "https://www.gog.com/support"},
+            ]}, f)
+        key = rf"SOFTWARE\WOW6432Node\GOG.com\Games\{game_id}"
+        platform.set_registry_value('HKLM', key, "gameName", f"GOG Game {i}")
+        platform.set_registry_value('HKLM', key, "path", root)
+        platform.set_registry_value('HKLM', key, "exe", f"GogGame{i:04d}.exe")
+
+    # Riot: VALORANT with its real layout, then generic titles (half of them outside the usual
+    # folder, where only the Riot Client's records find them)
+    riot = os.path.join(drives[0], "Riot Games")
+    riot_data = program_data / "Riot Games"
+    _touch(os.path.join(riot, "Riot Client", "RiotClientServices.exe"))
+    _touch(os.path.join(riot, "VALORANT", "live", "ShooterGame", "Binaries", "Win64", "VALORANT-Win64-Shipping.exe"))
+    _touch(os.path.join(riot, "VALORANT", "live", "VALORANT.exe"))
+    settings = riot_data / "Metadata" / "valorant.live" / "valorant.live.product_settings.yaml"
+    settings.parent.mkdir(parents=True, exist_ok=True)
+    settings.write_text('locale_data:\n  default_locale: "en_US"\n'
+                        f'product_install_full_path: "{os.path.join(riot, "VALORANT", "live")}"\n'
+                        f'product_install_root: "{riot}"\n', encoding='utf-8')
+    associated = {}
+    for i in range(counts["Riot Games"] - 1):
+        root = os.path.join(riot if i % 2 else os.path.join(drives[1], "Games", "Riot"), f"RiotGame{i:03d}")
+        _install(root, f"RiotGame{i:03d}.exe")
+        associated[root + "/"] = os.path.join(riot, "Riot Client", "RiotClientServices.exe")
+    # A left-over folder the client still lists but without a game exe (must not become a game)
+    _touch(os.path.join(riot, "Uninstalled Game", "logs", "install.log"))
+    associated[os.path.join(riot, "Uninstalled Game") + "/"] = os.path.join(riot, "Riot Client", "RiotClientServices.exe")
+    with open(riot_data / "RiotClientInstalls.json", 'w', encoding='utf-8') as f:
+        json.dump({"associated_client": associated,
+                   "rc_default": os.path.join(riot, "Riot Client", "RiotClientServices.exe")}, f)
+
+    # Battle.net: known titles at a drive root or under Program Files, recorded in product.db
+    installs = [("battle.net", "bna", os.path.join(drives[0], "Program Files (x86)", "Battle.net"))]
+    for i, (name, exe, uid, code) in enumerate(BLIZZARD[:counts["Battle.net"]]):
+        root = os.path.join(drives[i % 2], name) if i % 3 else os.path.join(drives[0], "Program Files (x86)", name)
+        _install(root, exe, deep=(i % 2 == 1))
+        installs.append((uid, code, root))
+    write_product_db(str(program_data / "Battle.net" / "Agent" / "product.db"), installs)
+
+    # Xbox app: <drive>\Xbox\<game>\Content\*.exe
+    for i in range(counts["Xbox"]):
+        _install(os.path.join(drives[1], "Xbox", f"XboxGame{i:04d}", "Content"), f"XboxGame{i:04d}.exe")
+
+    # Standalone Marvel Rivals (NetEase launcher) a couple of levels down
+    _touch(os.path.join(drives[1], "Games", "NetEase", "Marvel Rivals", "MarvelGame", "Marvel",
+                        "Binaries", "Win64", "Marvel-Win64-Shipping.exe"))
+    return platform